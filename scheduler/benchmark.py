@@ -0,0 +1,129 @@
+"""Benchmark the scheduling engines on generated instances.
+
+Usage:
+    python benchmark.py --sizes small,medium --engines greedy,ga --output bench.json
+
+Results are written as JSON with stable key order so runs from different
+commits can be diffed directly.
+"""
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List, Dict, Any
+
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+
+# Instance shapes, from a single department up to a whole college
+SIZES: Dict[str, Dict[str, Any]] = {
+    "small": {"num_subjects": 5, "num_faculty": 3, "num_rooms": 1, "num_breaks": 1},
+    "medium": {"num_subjects": 15, "num_faculty": 8, "num_rooms": 2, "num_breaks": 2},
+    "large": {"num_subjects": 40, "num_faculty": 20, "num_rooms": 4, "num_breaks": 3},
+    "xlarge": {"num_subjects": 80, "num_faculty": 40, "num_rooms": 8, "num_breaks": 3},
+}
+
+def run_case(size: str, engine: str, seed: int, instance_options: Dict[str, Any], measure_memory: bool = True) -> Dict[str, Any]:
+    """Solve one generated instance and measure wall time, peak memory and schedule quality.
+
+    tracemalloc slows the solve down noticeably, so with measure_memory the
+    instance is solved twice: once for timing and once for peak memory.
+    """
+    input_data = generate_instance(seed=seed, **SIZES[size], **instance_options)
+    use_ga = engine == "ga"
+
+    random.seed(seed)
+    started = time.perf_counter()
+    result = SchedulerService().generate_schedule(input_data, use_ga=use_ga)
+    wall_time = time.perf_counter() - started
+
+    peak_memory = None
+    if measure_memory:
+        random.seed(seed)
+        tracemalloc.start()
+        SchedulerService().generate_schedule(input_data, use_ga=use_ga)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    assignments = [cell for days in result["weekly_schedule"]["rooms"].values()
+                   for cells in days.values() for cell in cells if cell]
+    virtual = sum(1 for cell in assignments if cell["faculty_id"].startswith("VF"))
+    available = result["total_available_slots"]
+    return {
+        "size": size,
+        "engine": engine,
+        "seed": seed,
+        "subjects": len(input_data.subjects),
+        "rooms": len(input_data.rooms),
+        "wall_time_seconds": round(wall_time, 4),
+        "peak_memory_kib": round(peak_memory / 1024, 1) if peak_memory is not None else None,
+        "fitness": round(result["fitness"], 4),
+        "utilization_percentage": result["utilization_percentage"],
+        "real_utilization_percentage": round((len(assignments) - virtual) / available * 100, 1) if available else 0,
+        "virtual_assignments": virtual,
+        "total_assignments": result["total_assignments"],
+    }
+
+def run_benchmark(sizes: List[str], engines: List[str], seeds: List[int], instance_options: Dict[str, Any] = None,
+                  measure_memory: bool = True) -> Dict[str, Any]:
+    """Run every (size, engine, seed) combination and collect the measurements."""
+    instance_options = instance_options or {}
+    results = []
+    for size in sizes:
+        if size not in SIZES:
+            raise ValueError(f"Unknown size: {size}. Must be one of {list(SIZES)}")
+        for engine in engines:
+            if engine not in ("greedy", "ga"):
+                raise ValueError(f"Unknown engine: {engine}. Must be 'greedy' or 'ga'")
+            for seed in seeds:
+                results.append(run_case(size, engine, seed, instance_options, measure_memory))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(),
+            "instance_options": instance_options,
+        },
+        "results": results,
+    }
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark greedy vs GA scheduling across instance sizes")
+    parser.add_argument("--sizes", default="small,medium", help=f"Comma-separated sizes from {list(SIZES)}")
+    parser.add_argument("--engines", default="greedy,ga", help="Comma-separated engines: greedy, ga")
+    parser.add_argument("--seeds", default="0", help="Comma-separated instance seeds")
+    parser.add_argument("--availability-density", type=float, default=0.7)
+    parser.add_argument("--preference-density", type=float, default=0.3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON report")
+    args = parser.parse_args(argv)
+
+    # Solver logging would dominate the measurements
+    logging.disable(logging.INFO)
+
+    report = run_benchmark(
+        sizes=[s for s in args.sizes.split(",") if s],
+        engines=[e for e in args.engines.split(",") if e],
+        seeds=[int(s) for s in args.seeds.split(",") if s],
+        instance_options={
+            "availability_density": args.availability_density,
+            "preference_density": args.preference_density,
+        },
+        measure_memory=not args.no_memory,
+    )
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for row in report["results"]:
+        print(f"{row['size']:>7} {row['engine']:>6} seed={row['seed']:<3} "
+              f"{row['wall_time_seconds']:>8.3f}s {row['peak_memory_kib'] or 0:>10.1f} KiB "
+              f"fitness={row['fitness']:.3f} real_util={row['real_utilization_percentage']}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,16 @@
 from typing import List
 from model import ScheduleInput, ScheduleAssignment, Subject, TimeSlot, Faculty
-from utils import check_time_conflict, check_break_conflict, time_to_minutes
+from utils import check_break_conflict, build_break_index, time_to_minutes
+from validation import conflicting_pairs
+from instrumentation import DetailLog
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ConstraintChecker:
     def __init__(self, subjects: List[Subject]):
         self.subjects = subjects
+        self.detail = DetailLog(logger)
 
     def sort_subjects_by_constraints(self, subjects: List[Subject]) -> List[Subject]:
         """Sort subjects by number of faculty (fewer faculty = more constrained)."""
@@ -27,19 +33,15 @@ class ConstraintChecker:
             if scheduled < required:
                 unmet_requirements += (required - scheduled)
 
-        # Penalty for conflicts
-        conflicts = 0
-        for i, a1 in enumerate(schedule):
-            slot1 = TimeSlot(a1.day, a1.startTime, a1.endTime)
-            for a2 in schedule[i+1:]:
-                slot2 = TimeSlot(a2.day, a2.startTime, a2.endTime)
-                if (a1.faculty_id == a2.faculty_id or a1.room_id == a2.room_id) and check_time_conflict(slot1, slot2):
-                    conflicts += 1
-            if check_break_conflict(slot1, input_data.break_):
+        # Penalty for conflicts: faculty/room double bookings found by a sort-and-sweep, plus break overlaps
+        conflicts = len(conflicting_pairs(schedule))
+        breaks = build_break_index(input_data.break_)
+        for a in schedule:
+            if check_break_conflict(TimeSlot(a.day, a.startTime, a.endTime), breaks):
                 conflicts += 1
 
         fitness = unmet_requirements * 1000 + conflicts * 10
-        print(f"[DEBUG] Fitness: {fitness} (unmet requirements: {unmet_requirements}, conflicts: {conflicts})")
+        logger.debug("Fitness: %s (unmet requirements: %d, conflicts: %d)", fitness, unmet_requirements, conflicts)
         return fitness
 
     def get_valid_slots(self, availability: List[TimeSlot], fixed_slots: List[TimeSlot], duration: int) -> List[TimeSlot]:
@@ -58,10 +60,11 @@ class ConstraintChecker:
                         slot_end = time_to_minutes(fixed_slot.endTime)
                         if avail_start <= slot_start and slot_end <= avail_end:
                             valid_slots.append(fixed_slot)
-                            print(f"[DEBUG] Valid slot for {fixed_slot.day}: {fixed_slot.startTime}-{fixed_slot.endTime}")
+                            if self.detail.enabled:
+                                self.detail("Valid slot for %s: %s-%s", fixed_slot.day, fixed_slot.startTime, fixed_slot.endTime)
                             break
                     except ValueError as e:
-                        print(f"[ERROR] Time parsing error in get_valid_slots: {e}")
+                        logger.error("Time parsing error in get_valid_slots: %s", e)
         return valid_slots
 
     def check_constraints(self, faculty_id: str, time_slot: TimeSlot, room_id: str, input_data: ScheduleInput) -> bool:
@@ -78,7 +81,7 @@ class ConstraintChecker:
                 break
 
         if not faculty or not subject:
-            print(f"[DEBUG] Invalid faculty_id {faculty_id} or subject not found")
+            self.detail("Invalid faculty_id %s or subject not found", faculty_id)
             return False
 
         valid_slot = False
@@ -93,27 +96,27 @@ class ConstraintChecker:
                         valid_slot = True
                         break
                 except ValueError as e:
-                    print(f"[ERROR] Time parsing error in check_constraints: {e}")
+                    logger.error("Time parsing error in check_constraints: %s", e)
                     return False
         if not valid_slot:
-            print(f"[DEBUG] Slot {time_slot.startTime}-{time_slot.endTime} not in faculty {faculty_id} availability")
+            self.detail("Slot %s-%s not in faculty %s availability", time_slot.startTime, time_slot.endTime, faculty_id)
             return False
 
         if check_break_conflict(time_slot, input_data.break_):
-            print(f"[DEBUG] Slot {time_slot.startTime}-{time_slot.endTime} conflicts with break")
+            self.detail("Slot %s-%s conflicts with break", time_slot.startTime, time_slot.endTime)
             return False
 
         if room_id not in input_data.rooms:
-            print(f"[DEBUG] Invalid room_id {room_id}")
+            self.detail("Invalid room_id %s", room_id)
             return False
 
         try:
             slot_duration = time_to_minutes(time_slot.endTime) - time_to_minutes(time_slot.startTime)
             if slot_duration != subject.time:  # Use subject.time instead of duration
-                print(f"[DEBUG] Slot duration {slot_duration} does not match subject {subject.name} time {subject.time}")
+                self.detail("Slot duration %d does not match subject %s time %s", slot_duration, subject.name, subject.time)
                 return False
         except ValueError as e:
-            print(f"[ERROR] Duration check failed: {e}")
+            logger.error("Duration check failed: %s", e)
             return False
 
         return True
\ No newline at end of file
@@ -0,0 +1,55 @@
+from typing import List, Dict, Tuple, Hashable
+from model import BatchScheduleInput, SectionInput
+
+class _DisjointSet:
+    """Union-find with path halving, used to split the interaction graph."""
+
+    def __init__(self):
+        self.parent: Dict[Hashable, Hashable] = {}
+
+    def find(self, node: Hashable) -> Hashable:
+        self.parent.setdefault(node, node)
+        while self.parent[node] != node:
+            self.parent[node] = self.parent[self.parent[node]]
+            node = self.parent[node]
+        return node
+
+    def union(self, a: Hashable, b: Hashable) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+def build_interaction_edges(batch: BatchScheduleInput) -> List[Tuple[Hashable, Hashable]]:
+    """Edges of the subject-faculty-room graph.
+
+    Every subject of a section is linked to each of its faculty and to each
+    room of the section, since any of those rooms may host it.
+    """
+    edges = []
+    for section in batch.sections:
+        section_node = ("SECTION", section.section_id)
+        for room in section.schedule_input.rooms:
+            edges.append((section_node, ("ROOM", room)))
+        for idx, subject in enumerate(section.schedule_input.subjects):
+            subject_node = ("SUBJECT", section.section_id, idx)
+            edges.append((section_node, subject_node))
+            for faculty in subject.faculty:
+                edges.append((subject_node, ("FACULTY", faculty.id)))
+    return edges
+
+def find_independent_components(batch: BatchScheduleInput) -> List[List[SectionInput]]:
+    """Split a batch into groups of sections that share no faculty and no rooms.
+
+    Components are returned in order of their first section in the batch, and
+    sections keep their batch order within a component, so merging results
+    back is deterministic.
+    """
+    components = _DisjointSet()
+    for a, b in build_interaction_edges(batch):
+        components.union(a, b)
+
+    grouped: Dict[Hashable, List[SectionInput]] = {}
+    for section in batch.sections:
+        root = components.find(("SECTION", section.section_id))
+        grouped.setdefault(root, []).append(section)
+    return list(grouped.values())
@@ -0,0 +1,169 @@
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+from model import ScheduleInput, ScheduleAssignment, Subject, TimeSlot
+from indexes import ConsecutiveBlockIndex, OccupancyIndex
+from problem import NormalizedProblem, slot_minutes
+from utils import VALID_DAYS, time_to_minutes
+from validation import contiguous_runs
+
+# Why a required class could not be placed, most fundamental first
+NO_FACULTY = "no_faculty"
+NO_DURATION_SLOT = "no_duration_slot"  # the grid has no slot (or block) of the class's length at all
+FACULTY_UNAVAILABLE = "faculty_unavailable"  # no faculty member is available for that long during college hours
+BREAK_OVERLAP = "break_overlap"  # availability is long enough, but only across a break
+OFF_GRID = "off_grid"  # a break-free stretch exists, but no grid slot of that length lies inside it
+SLOTS_TAKEN = "slots_taken"  # candidate slots exist and are all taken by the listed assignments
+FREE_SLOT_UNUSED = "free_slot_unused"  # a candidate slot is still free; the search stopped before using it
+
+def scheduled_classes(input_data: ScheduleInput, schedule: List[ScheduleAssignment]) -> Dict[str, int]:
+    """Classes of each subject in a schedule, counting a consecutive-period block once."""
+    subjects = {subject.name: subject for subject in input_data.subjects}
+    counts: Dict[str, int] = defaultdict(int)
+    block_periods = defaultdict(list)
+    for idx, a in enumerate(schedule):
+        subject = subjects.get(a.subject_name)
+        if subject is None:
+            continue
+        if subject.requires_consecutive:
+            block_periods[(a.subject_name, a.faculty_id, a.room_id, a.day)].append(
+                (time_to_minutes(a.startTime), time_to_minutes(a.endTime), idx))
+        else:
+            counts[a.subject_name] += 1
+    for (subject_name, _, _, _), periods in block_periods.items():
+        for run in contiguous_runs(periods):
+            counts[subject_name] += (run[-1][1] - run[0][0]) // subjects[subject_name].time
+    return counts
+
+def _longest_stretch(problem: NormalizedProblem, faculty_id: str, day: str, skip_breaks: bool) -> int:
+    """Longest available stretch of the faculty member on the day within college hours, optionally between breaks."""
+    longest = 0
+    for start, end in problem.availability.get(faculty_id, {}).get(day, ()):
+        start, end = max(start, problem.college_start), min(end, problem.college_end)
+        cuts = [start]
+        if skip_breaks:
+            for break_start, break_end in problem.breaks.get(day, ()):
+                if break_start < end and start < break_end:
+                    cuts.extend((max(break_start, start), min(break_end, end)))
+        cuts.append(end)
+        for piece_start, piece_end in zip(cuts[::2], cuts[1::2]):
+            longest = max(longest, piece_end - piece_start)
+    return longest
+
+class UnassignedExplainer:
+    """Reasons why required classes are missing from a schedule, read off indexes instead of re-running the search.
+
+    Candidate slots come from the same grid (and consecutive-block index) the
+    engines use; who holds a candidate comes from an OccupancyIndex over the
+    schedule, so each explanation costs a lookup per candidate slot.
+    Placeholder cells are not counted as taking a slot.
+    """
+
+    def __init__(self, input_data: ScheduleInput, problem: NormalizedProblem, schedule: List[ScheduleAssignment],
+                 grid_slots: List[TimeSlot], blocks: ConsecutiveBlockIndex,
+                 booked_elsewhere: Optional[Callable[[str, str, TimeSlot], bool]] = None):
+        self.input_data = input_data
+        self.problem = problem
+        self.schedule = schedule
+        self.grid_slots = grid_slots
+        self.blocks = blocks
+        # (kind, id, slot) -> whether the faculty member ("FACULTY") or room ("ROOM") is booked anywhere; only
+        # consulted when nothing in schedule holds it, so a hit is another batch section ("other_section")
+        self.booked_elsewhere = booked_elsewhere
+        intervals = []
+        for idx, a in enumerate(schedule):
+            if a.faculty_id not in problem.faculty:
+                continue  # placeholders
+            start, end = time_to_minutes(a.startTime), time_to_minutes(a.endTime)
+            intervals.append((("FACULTY", a.faculty_id, a.day), start, end, idx))
+            intervals.append((("ROOM", a.room_id, a.day), start, end, idx))
+        self.occupancy = OccupancyIndex.build(intervals)
+
+    def _slots_of_length(self, subject: Subject) -> List[TimeSlot]:
+        if subject.requires_consecutive:
+            return [span for day in VALID_DAYS for _, span in self.blocks.blocks(day, subject.time)]
+        return [slot for slot in self.grid_slots if slot_minutes(slot)[1] - slot_minutes(slot)[0] == subject.time]
+
+    def _candidate(self, faculty_id: str, slot: TimeSlot) -> Dict[str, Any]:
+        """Who holds the faculty member and every room at a candidate slot."""
+        start, end = slot_minutes(slot)
+        faculty_busy = self.occupancy.overlapping(("FACULTY", faculty_id, slot.day), start, end)
+        rooms = {}
+        for room in self.input_data.rooms:
+            holders = self.occupancy.overlapping(("ROOM", room, slot.day), start, end)
+            if not holders and self.booked_elsewhere is not None and self.booked_elsewhere("ROOM", room, slot):
+                holders = ["other_section"]
+            rooms[room] = holders
+        elsewhere = self.booked_elsewhere is not None and self.booked_elsewhere("FACULTY", faculty_id, slot)
+        return {
+            "day": slot.day, "startTime": slot.startTime, "endTime": slot.endTime, "faculty_id": faculty_id,
+            "faculty_busy": faculty_busy + (["other_section"] if elsewhere and not faculty_busy else []),
+            "rooms_taken": rooms,
+        }
+
+    def explain(self, subject: Subject, missing: int) -> Dict[str, Any]:
+        """Reason code, message and details for `missing` unplaced classes of the subject."""
+        base = {"subject_name": subject.name, "missing": missing}
+        if not subject.faculty:
+            return {**base, "reason": NO_FACULTY, "message": f"{subject.name} has no faculty"}
+        slots = self._slots_of_length(subject)
+        unit, units = (("block of consecutive periods", "blocks of consecutive periods") if subject.requires_consecutive
+                       else ("slot", "slots"))
+        if not slots:
+            return {**base, "reason": NO_DURATION_SLOT,
+                    "message": f"The timetable has no {subject.time}-minute {unit} on any day"}
+
+        candidates = []
+        for faculty in subject.faculty:
+            for slot in slots:
+                if self.problem.is_available(faculty.id, slot.day, *slot_minutes(slot)):
+                    candidates.append(self._candidate(faculty.id, slot))
+        if not candidates:
+            faculty_ids = [faculty.id for faculty in subject.faculty]
+            between_breaks = max(_longest_stretch(self.problem, f, day, True) for f in faculty_ids for day in VALID_DAYS)
+            across_breaks = max(_longest_stretch(self.problem, f, day, False) for f in faculty_ids for day in VALID_DAYS)
+            if between_breaks >= subject.time:
+                reason, message = OFF_GRID, f"No {subject.time}-minute grid {unit} lies inside the faculty's availability"
+            elif across_breaks >= subject.time:
+                reason, message = BREAK_OVERLAP, (f"The faculty's availability only fits {subject.time} minutes "
+                                                  f"across a break")
+            else:
+                reason, message = FACULTY_UNAVAILABLE, (f"No faculty of {subject.name} is available for "
+                                                        f"{subject.time} minutes during college hours")
+            return {**base, "reason": reason, "message": message, "faculty": faculty_ids,
+                    "longest_available_minutes": across_breaks}
+
+        free = [c for c in candidates if not c["faculty_busy"] and not all(c["rooms_taken"].values())]
+        if free:
+            for c in free:
+                c["free_rooms"] = [room for room, holders in c["rooms_taken"].items() if not holders]
+                del c["rooms_taken"]
+            return {**base, "reason": FREE_SLOT_UNUSED,
+                    "message": (f"1 candidate {unit} of {subject.name} is still free" if len(free) == 1
+                                else f"{len(free)} candidate {units} of {subject.name} are still free"),
+                    "candidates": free}
+
+        blocking = sorted({idx for c in candidates for idx in c["faculty_busy"] if isinstance(idx, int)}
+                          | {idx for c in candidates for holders in c["rooms_taken"].values()
+                             for idx in holders if isinstance(idx, int)})
+        # Keep only the rooms that are taken; a candidate with a free room is held by its faculty member
+        for c in candidates:
+            c["rooms_taken"] = {room: holders for room, holders in c["rooms_taken"].items() if holders}
+        return {**base, "reason": SLOTS_TAKEN,
+                "message": (f"The only candidate {unit} of {subject.name} is taken" if len(candidates) == 1
+                            else f"All {len(candidates)} candidate {units} of {subject.name} are taken"),
+                "candidates": candidates, "blocking_assignments": blocking}
+
+def explain_unassigned(input_data: ScheduleInput, problem: NormalizedProblem, schedule: List[ScheduleAssignment],
+                       grid_slots: List[TimeSlot], blocks: ConsecutiveBlockIndex,
+                       booked_elsewhere: Optional[Callable[[str, str, TimeSlot], bool]] = None) -> List[Dict[str, Any]]:
+    """One explanation per subject with fewer classes in the schedule than it requires; [] when none are short.
+
+    blocking_assignments and the candidates' holders are indexes into schedule.
+    """
+    counts = scheduled_classes(input_data, schedule)
+    short = [(subject, subject.no_of_classes_per_week - counts.get(subject.name, 0)) for subject in input_data.subjects
+             if counts.get(subject.name, 0) < subject.no_of_classes_per_week]
+    if not short:
+        return []
+    explainer = UnassignedExplainer(input_data, problem, schedule, grid_slots, blocks, booked_elsewhere)
+    return [explainer.explain(subject, missing) for subject, missing in short]
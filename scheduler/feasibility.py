@@ -0,0 +1,192 @@
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, Hashable, List, Optional
+from model import ScheduleInput, TimeSlot
+from indexes import RoomSlotIndex, ConsecutiveBlockIndex, slot_key
+from problem import NormalizedProblem, slot_minutes
+
+class InfeasibleScheduleError(ValueError):
+    """The required classes cannot all be placed; `report` is the analyze_feasibility result."""
+
+    def __init__(self, report: Dict[str, Any]):
+        super().__init__(f"Infeasible input: {report['issues'][0]['message']}" if report["issues"] else "Infeasible input")
+        self.report = report
+
+class _MaxFlow:
+    """Dinic's maximum flow on a small graph with hashable node names."""
+
+    def __init__(self):
+        self.edges: List[List] = []  # [to, capacity, index of the reverse edge]
+        self.graph: Dict[Hashable, List[int]] = defaultdict(list)
+
+    def add_edge(self, source: Hashable, target: Hashable, capacity: int) -> None:
+        self.graph[source].append(len(self.edges))
+        self.edges.append([target, capacity, len(self.edges) + 1])
+        self.graph[target].append(len(self.edges))
+        self.edges.append([source, 0, len(self.edges) - 1])
+
+    def _levels(self, source: Hashable) -> Dict[Hashable, int]:
+        levels = {source: 0}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            for e in self.graph[node]:
+                target, capacity, _ = self.edges[e]
+                if capacity > 0 and target not in levels:
+                    levels[target] = levels[node] + 1
+                    queue.append(target)
+        return levels
+
+    def _push(self, node, sink, amount, levels, next_edge) -> int:
+        if node == sink:
+            return amount
+        edges = self.graph[node]
+        while next_edge[node] < len(edges):
+            e = edges[next_edge[node]]
+            target, capacity, reverse = self.edges[e]
+            if capacity > 0 and levels.get(target) == levels[node] + 1:
+                pushed = self._push(target, sink, min(amount, capacity), levels, next_edge)
+                if pushed:
+                    self.edges[e][1] -= pushed
+                    self.edges[reverse][1] += pushed
+                    return pushed
+            next_edge[node] += 1
+        return 0
+
+    def max_flow(self, source: Hashable, sink: Hashable) -> int:
+        flow = 0
+        while True:
+            levels = self._levels(source)
+            if sink not in levels:
+                return flow
+            next_edge = defaultdict(int)
+            while True:
+                pushed = self._push(source, sink, float("inf"), levels, next_edge)
+                if not pushed:
+                    break
+                flow += pushed
+
+    def reachable(self, source: Hashable) -> set:
+        """Nodes reachable from source in the residual graph, i.e. the source side of a minimum cut."""
+        return set(self._levels(source))
+
+def _issue(kind: str, message: str, **details: Any) -> Dict[str, Any]:
+    return {"type": kind, "message": message, **details}
+
+def analyze_feasibility(input_data: ScheduleInput, problem: NormalizedProblem, grid_slots: List[TimeSlot],
+                        blocks: ConsecutiveBlockIndex, room_index: Optional[RoomSlotIndex] = None,
+                        faculty_free: Optional[Callable[[str, TimeSlot], bool]] = None) -> Dict[str, Any]:
+    """Whether the required classes can possibly all be placed, checked before any search.
+
+    Cheap capacity bounds come first: per subject (grid slots its faculty can
+    teach, times the rooms free there), per faculty member (free grid
+    minutes against the subjects only they teach) and per slot duration
+    (free room cells). A maximum flow from subjects through
+    (faculty, slot) pairs to slots (one class per faculty per slot, one per
+    free room) then checks Hall's condition for all subjects together; when
+    it fails, the source side of the minimum cut names the smallest group of
+    subjects competing for too few cells. Consecutive-period subjects only
+    take part in the bounds. room_index and faculty_free account for
+    bookings of earlier batch sections.
+    """
+    def free_rooms(slot: TimeSlot) -> int:
+        return len(room_index.free_rooms(slot)) if room_index is not None else len(input_data.rooms)
+
+    def can_teach(faculty_id: str, slot: TimeSlot) -> bool:
+        return faculty_free is None or faculty_free(faculty_id, slot)
+
+    issues: List[Dict[str, Any]] = []
+    subjects_report: Dict[str, Dict[str, int]] = {}
+    candidates: Dict[str, Dict[str, List[TimeSlot]]] = {}  # subject -> faculty -> slots (spans for blocks)
+
+    for subject in input_data.subjects:
+        by_faculty: Dict[str, List[TimeSlot]] = {}
+        for faculty in subject.faculty:
+            if subject.requires_consecutive:
+                slots = [span for _, span in problem.valid_blocks(faculty.id, blocks, subject.time)]
+            else:
+                slots = problem.valid_slots(faculty.id, grid_slots, subject.time)
+            by_faculty[faculty.id] = [slot for slot in slots if can_teach(faculty.id, slot)]
+        candidates[subject.name] = by_faculty
+
+        teachers_at: Dict[tuple, int] = defaultdict(int)
+        slot_of: Dict[tuple, TimeSlot] = {}
+        for slots in by_faculty.values():
+            for slot in slots:
+                teachers_at[slot_key(slot)] += 1
+                slot_of[slot_key(slot)] = slot
+        upper_bound = sum(min(count, free_rooms(slot_of[key])) for key, count in teachers_at.items())
+        subjects_report[subject.name] = {"required": subject.no_of_classes_per_week,
+                                         "candidate_slots": len(teachers_at), "upper_bound": upper_bound}
+        if upper_bound < subject.no_of_classes_per_week:
+            issues.append(_issue(
+                "subject_capacity", f"{subject.name} needs {subject.no_of_classes_per_week} classes but its faculty "
+                f"can teach at most {upper_bound} in free rooms", subject_name=subject.name,
+                required=subject.no_of_classes_per_week, upper_bound=upper_bound))
+
+    # Faculty: free grid minutes against the subjects nobody else can teach
+    faculty_report: Dict[str, Dict[str, int]] = {}
+    for faculty_id in problem.faculty:
+        available_slots = [slot for slot in grid_slots
+                           if problem.is_available(faculty_id, slot.day, *slot_minutes(slot)) and can_teach(faculty_id, slot)]
+        available = sum(end - start for start, end in map(slot_minutes, available_slots))
+        sole = [subject for subject in input_data.subjects
+                if [faculty.id for faculty in subject.faculty] == [faculty_id]]
+        required = sum(subject.time * subject.no_of_classes_per_week for subject in sole)
+        faculty_report[faculty_id] = {"available_minutes": available, "required_minutes": required}
+        if required > available:
+            issues.append(_issue(
+                "faculty_capacity", f"{faculty_id} alone teaches {required} minutes a week but has {available} "
+                f"minutes of free grid slots", faculty_id=faculty_id, required_minutes=required,
+                available_minutes=available))
+
+    # Rooms: free cells per slot duration against the classes of that duration
+    cells: Dict[int, int] = defaultdict(int)
+    for slot in grid_slots:
+        start, end = slot_minutes(slot)
+        cells[end - start] += free_rooms(slot)
+    needed: Dict[int, int] = defaultdict(int)
+    for subject in input_data.subjects:
+        if not subject.requires_consecutive:
+            needed[subject.time] += subject.no_of_classes_per_week
+    for duration in sorted(needed):
+        if needed[duration] > cells[duration]:
+            issues.append(_issue(
+                "room_capacity", f"{needed[duration]} classes of {duration} minutes need rooms but only "
+                f"{cells[duration]} free room cells of that length exist", duration=duration,
+                required=needed[duration], available=cells[duration]))
+
+    # Hall's condition over all regular subjects at once, as a maximum flow
+    network = _MaxFlow()
+    regular = [subject for subject in input_data.subjects if not subject.requires_consecutive]
+    teaching = {}  # (faculty_id, slot key) -> slot; each faculty member teaches one class per slot
+    for subject in regular:
+        network.add_edge("source", ("subject", subject.name), subject.no_of_classes_per_week)
+        for faculty_id, slots in candidates[subject.name].items():
+            for slot in slots:
+                teaching[(faculty_id, slot_key(slot))] = slot
+                network.add_edge(("subject", subject.name), ("teaching", faculty_id, slot_key(slot)), 1)
+    slots_used = {}
+    for (faculty_id, key), slot in teaching.items():
+        network.add_edge(("teaching", faculty_id, key), ("slot", key), 1)
+        slots_used[key] = slot
+    for key, slot in slots_used.items():
+        network.add_edge(("slot", key), "sink", free_rooms(slot))
+    required_regular = sum(subject.no_of_classes_per_week for subject in regular)
+    placeable = network.max_flow("source", "sink") if regular else 0
+    if placeable < required_regular:
+        cut = network.reachable("source")
+        short = sorted(subject.name for subject in regular if ("subject", subject.name) in cut)
+        demand = sum(subject.no_of_classes_per_week for subject in regular if subject.name in short)
+        issues.append(_issue(
+            "hall_violation", f"Subjects {', '.join(short)} need {demand} classes but can share at most "
+            f"{demand - (required_regular - placeable)} faculty-slot-room cells", subjects=short,
+            required=demand, capacity=demand - (required_regular - placeable)))
+
+    return {
+        "feasible": not issues,
+        "issues": issues,
+        "required_classes": sum(subject.no_of_classes_per_week for subject in input_data.subjects),
+        "placeable_regular_classes": placeable,
+        "subjects": subjects_report,
+        "faculty": faculty_report,
+    }
@@ -1,31 +1,64 @@
 import random
-from typing import List, Callable, Tuple
+from typing import List, Dict, Callable, Tuple, Optional
 import deap.base
 import deap.creator
 import deap.tools
 from collections import defaultdict
-from model import ScheduleInput, ScheduleAssignment, TimeSlot
-from utils import check_time_conflict, check_break_conflict, time_to_minutes
+from model import ScheduleInput, ScheduleAssignment, TimeSlot, DEFAULT_FRONT_SIZE
+from indexes import RoomSlotIndex, ConsecutiveBlockIndex
+from problem import NormalizedProblem, normalize_input, slot_minutes
+from instrumentation import SolveTimings, DetailLog
+from soft_constraints import LoadTracker
+from utils import check_time_conflict, time_to_minutes, calculate_preference_score
+import dataclasses
 import logging
+import statistics
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Define the fitness and individual types for DEAP
-deap.creator.create("FitnessMin", deap.base.Fitness, weights=(-1.0,))
-deap.creator.create("Individual", list, fitness=deap.creator.FitnessMin)
+def _ensure_deap_types() -> None:
+    """Define the DEAP fitness and individual types on first use rather than at import time."""
+    if not hasattr(deap.creator, "FitnessMin"):
+        deap.creator.create("FitnessMin", deap.base.Fitness, weights=(-1.0,))
+    if not hasattr(deap.creator, "Individual"):
+        deap.creator.create("Individual", list, fitness=deap.creator.FitnessMin)
+    # NSGA-II: minimise hard penalty, maximise preference score, minimise faculty load imbalance
+    if not hasattr(deap.creator, "FitnessPareto"):
+        deap.creator.create("FitnessPareto", deap.base.Fitness, weights=(-1.0, 1.0, -1.0))
+    if not hasattr(deap.creator, "ParetoIndividual"):
+        deap.creator.create("ParetoIndividual", list, fitness=deap.creator.FitnessPareto)
 
 class GeneticAlgorithm:
-    def __init__(self, input_data: ScheduleInput, fixed_slots: List[TimeSlot], pop_size: int = 100, generations: int = 50, fixed_room_id: str = "R1", conflict_checker: Callable = None):
+    def __init__(self, input_data: ScheduleInput, fixed_slots: List[TimeSlot], pop_size: int = 100, generations: int = 50, fixed_room_id: str = "R1", conflict_checker: Callable = None, rooms: List[str] = None,
+                 timings: SolveTimings = None, problem: NormalizedProblem = None):
         self.input_data = input_data
         self.fixed_slots = fixed_slots
         self.pop_size = pop_size
         self.generations = generations
         self.fixed_room_id = fixed_room_id
+        # Rooms the search may choose from; each gene carries its room_id
+        self.rooms = list(rooms) if rooms else [fixed_room_id]
+        self.timings = timings or SolveTimings()
+        # Parsed availability and breaks; built here when the caller has not normalised the input
+        self.problem = problem or normalize_input(input_data)
+        self._valid_slots_cache: Dict[Tuple[str, int], List[TimeSlot]] = {}
+        self._valid_blocks_cache: Dict[Tuple[str, int], List[TimeSlot]] = {}
+        self._preference_cache: Dict[Tuple[str, str, str, str, str], int] = {}
+        self._block_periods_cache: Dict[Tuple[str, str, str], List[TimeSlot]] = {}
+        self.subjects = {subject.name: subject for subject in input_data.subjects}
+        self.soft_constraints = input_data.soft_constraints
+        # Scores faculty-days for the soft penalty; individuals share most faculty-days, so terms are cached
+        self._soft_scorer = LoadTracker(self.soft_constraints, self.problem.breaks) if self.soft_constraints else None
+        self._day_terms_cache: Dict[Tuple[str, Tuple[Tuple[int, int], ...]], Tuple[int, int, int]] = {}
         self.conflict_checker = conflict_checker
+        # Shared by every individual so sampling spans the whole run
+        self.detail = DetailLog(logger)
+        _ensure_deap_types()
         self.toolbox = deap.base.Toolbox()
         self.assignable_slots = self._get_assignable_slots()
+        # A consecutive-period class is one gene spanning its whole block, so crossover and mutation keep it intact
+        self.blocks = ConsecutiveBlockIndex(self.assignable_slots)
+        self.block_subjects = {subject.name for subject in input_data.subjects if subject.requires_consecutive}
         self._setup_ga()
 
     def _get_assignable_slots(self) -> List[TimeSlot]:
@@ -33,30 +66,66 @@ class GeneticAlgorithm:
         assignable_slots = []
         for slot in self.fixed_slots:
             slot_obj = TimeSlot(day=slot.day, startTime=slot.startTime, endTime=slot.endTime)
-            if check_break_conflict(slot_obj, self.input_data.break_):
-                logger.debug(f"Excluding slot {slot.day} {slot.startTime}-{slot.endTime} due to break conflict")
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot_obj)):
+                if self.detail.enabled:
+                    self.detail("Excluding slot %s %s-%s due to break conflict", slot.day, slot.startTime, slot.endTime)
                 continue
             assignable_slots.append(slot)
-        logger.info(f"Total assignable slots: {len(assignable_slots)}")
+        logger.info("GA assignable_slots=%d rooms=%d", len(assignable_slots), len(self.rooms))
         return assignable_slots
 
+    def _valid_slots(self, faculty_id: str, duration: int) -> List[TimeSlot]:
+        """Assignable slots of the given duration inside the faculty's availability, computed once per pair."""
+        key = (faculty_id, duration)
+        if key not in self._valid_slots_cache:
+            self._valid_slots_cache[key] = self.problem.valid_slots(faculty_id, self.assignable_slots, duration)
+        return self._valid_slots_cache[key]
+
+    def _candidate_slots(self, faculty_id: str, subject) -> List[TimeSlot]:
+        """Slots a class of the subject can take: grid slots, or the spans of whole blocks for consecutive subjects."""
+        if not subject.requires_consecutive:
+            return self._valid_slots(faculty_id, subject.time)
+        key = (faculty_id, subject.time)
+        if key not in self._valid_blocks_cache:
+            self._valid_blocks_cache[key] = [span for _, span in self.problem.valid_blocks(faculty_id, self.blocks, subject.time)]
+        return self._valid_blocks_cache[key]
+
+    def _block_periods(self, a: ScheduleAssignment) -> List[TimeSlot]:
+        """Grid periods spanned by a block gene, computed once per span."""
+        key = (a.day, a.startTime, a.endTime)
+        if key not in self._block_periods_cache:
+            mask = self.blocks.mask(a.day, time_to_minutes(a.startTime), time_to_minutes(a.endTime))
+            self._block_periods_cache[key] = self.blocks.periods(a.day, mask)
+        return self._block_periods_cache[key]
+
+    def _expand_blocks(self, individual: List[ScheduleAssignment]) -> List[ScheduleAssignment]:
+        """One assignment per grid period: block genes are split into the periods they span."""
+        expanded = []
+        for a in individual:
+            if a.subject_name not in self.block_subjects:
+                expanded.append(a)
+                continue
+            expanded.extend(dataclasses.replace(a, startTime=period.startTime, endTime=period.endTime)
+                            for period in self._block_periods(a))
+        return expanded
+
     def _get_slot_duration(self, slot: TimeSlot) -> int:
         """Calculate the duration of a slot in minutes with error handling."""
         try:
             slot_duration = time_to_minutes(slot.endTime) - time_to_minutes(slot.startTime)
             if slot_duration <= 0:
-                logger.error(f"Invalid slot duration for {slot.day} {slot.startTime}-{slot.endTime}: {slot_duration} minutes")
+                logger.error("Invalid slot duration for %s %s-%s: %d minutes", slot.day, slot.startTime, slot.endTime, slot_duration)
                 return -1
             return slot_duration
         except ValueError as e:
-            logger.error(f"Failed to calculate slot duration for {slot.day} {slot.startTime}-{slot.endTime}: {e}")
+            logger.error("Failed to calculate slot duration for %s %s-%s: %s", slot.day, slot.startTime, slot.endTime, e)
             return -1
 
     def _create_individual(self) -> List[ScheduleAssignment]:
         """Create an individual by scheduling subjects across all non-break slots."""
         schedule = []
         used_slots_per_faculty = defaultdict(list)
-        used_slots_per_room = defaultdict(list)
+        room_index = RoomSlotIndex(self.rooms, self.assignable_slots)
         subject_counts = {subject.name: 0 for subject in self.input_data.subjects}
 
         # Step 1: Meet the minimum requirements for each subject
@@ -65,37 +134,23 @@ class GeneticAlgorithm:
             for _ in range(subject.no_of_classes_per_week):
                 subjects_to_assign.append(subject)
         random.shuffle(subjects_to_assign)
+        # Blocks first, while whole runs of periods are still free
+        subjects_to_assign.sort(key=lambda subject: not subject.requires_consecutive)
 
         for subject in subjects_to_assign:
             assigned = False
             for faculty in random.sample(subject.faculty, len(subject.faculty)):
-                valid_slots = []
-                for slot in self.assignable_slots:
-                    slot_duration = self._get_slot_duration(slot)
-                    if slot_duration != subject.time:
-                        continue
-                    for avail in faculty.availability:
-                        if slot.day == avail.day:
-                            try:
-                                avail_start = time_to_minutes(avail.startTime)
-                                avail_end = time_to_minutes(avail.endTime)
-                                slot_start = time_to_minutes(slot.startTime)
-                                slot_end = time_to_minutes(slot.endTime)
-                                if avail_start <= slot_start and slot_end <= avail_end:
-                                    valid_slots.append(slot)
-                                    break
-                            except ValueError as e:
-                                logger.error(f"Time parsing error in _create_individual for faculty {faculty.id}: {e}")
-                                continue
+                valid_slots = self._candidate_slots(faculty.id, subject)
 
                 if not valid_slots:
                     continue
 
                 for slot in random.sample(valid_slots, len(valid_slots)):
                     if any(slot.day == s.day and check_time_conflict(slot, s)
-                           for s in used_slots_per_faculty[faculty.id] + used_slots_per_room[self.fixed_room_id]):
+                           for s in used_slots_per_faculty[faculty.id]):
                         continue
-                    if self.conflict_checker and not self.conflict_checker(faculty.id, slot, self.fixed_room_id, self.input_data):
+                    room_id = self._pick_room(room_index, faculty.id, slot)
+                    if room_id is None:
                         continue
 
                     assignment = ScheduleAssignment(
@@ -105,96 +160,134 @@ class GeneticAlgorithm:
                         day=slot.day,
                         startTime=slot.startTime,
                         endTime=slot.endTime,
-                        room_id=self.fixed_room_id
+                        room_id=room_id
                     )
                     schedule.append(assignment)
                     used_slots_per_faculty[faculty.id].append(slot)
-                    used_slots_per_room[self.fixed_room_id].append(slot)
+                    room_index.book(room_id, slot)
                     subject_counts[subject.name] += 1
                     assigned = True
-                    logger.debug(f"Assigned {subject.name} to {faculty.name} at {slot.day} {slot.startTime}-{slot.endTime}")
+                    if self.detail.enabled:
+                        self.detail("Assigned %s to %s at %s %s-%s in %s", subject.name, faculty.name,
+                                    slot.day, slot.startTime, slot.endTime, room_id)
                     break
                 if assigned:
                     break
 
             if not assigned:
-                logger.warning(f"Could not assign subject: {subject.name}")
-
-        # Step 2: Fill all remaining slots, ignoring subject count limits
-        used_slots = set((a.day, a.startTime, a.endTime) for a in schedule)
-        remaining_slots = [slot for slot in self.assignable_slots
-                          if (slot.day, slot.startTime, slot.endTime) not in used_slots]
+                # Happens routinely for random individuals; the final schedule reports what stayed unassigned
+                if self.detail.enabled:
+                    self.detail("Could not assign subject: %s", subject.name)
 
+        # Step 2: Fill all remaining (slot, room) cells, ignoring subject count limits
         remaining_subjects = [subject for subject in self.input_data.subjects]
         random.shuffle(remaining_subjects)
 
-        for slot in remaining_slots:
+        for slot in self.assignable_slots:
             slot_duration = self._get_slot_duration(slot)
             if slot_duration <= 0:
                 continue
             subjects_to_consider = [s for s in remaining_subjects if s.time == slot_duration]
             if not subjects_to_consider:
                 continue
+            for _ in range(len(room_index.free_rooms(slot))):
+                if not self._fill_remaining_cell(slot, subjects_to_consider, schedule, used_slots_per_faculty, room_index, subject_counts):
+                    break
 
-            assigned = False
-            for subject in subjects_to_consider:
-                for faculty in random.sample(subject.faculty, len(subject.faculty)):
-                    valid_slot = False
-                    for avail in faculty.availability:
-                        if slot.day == avail.day:
-                            try:
-                                avail_start = time_to_minutes(avail.startTime)
-                                avail_end = time_to_minutes(avail.endTime)
-                                slot_start = time_to_minutes(slot.startTime)
-                                slot_end = time_to_minutes(slot.endTime)
-                                if avail_start <= slot_start and slot_end <= avail_end:
-                                    valid_slot = True
-                                    break
-                            except ValueError as e:
-                                logger.error(f"Time parsing error in _create_individual for faculty {faculty.id}: {e}")
-                                continue
-
-                    if not valid_slot:
-                        continue
+        if self.detail.enabled:
+            self.detail("Individual created with %d assignments", len(schedule))
+        return schedule
 
-                    if any(slot.day == s.day and check_time_conflict(slot, s)
-                           for s in used_slots_per_faculty[faculty.id] + used_slots_per_room[self.fixed_room_id]):
-                        continue
-                    if self.conflict_checker and not self.conflict_checker(faculty.id, slot, self.fixed_room_id, self.input_data):
-                        continue
+    def _pick_room(self, room_index: RoomSlotIndex, faculty_id: str, slot: TimeSlot) -> Optional[str]:
+        """Pick a random free room for the slot that also passes the external conflict checker."""
+        free_rooms = room_index.free_rooms(slot)
+        for room_id in random.sample(free_rooms, len(free_rooms)):
+            if self.conflict_checker and not self.conflict_checker(faculty_id, slot, room_id, self.input_data):
+                continue
+            return room_id
+        return None
 
-                    assignment = ScheduleAssignment(
-                        subject_name=subject.name,
-                        faculty_id=faculty.id,
-                        faculty_name=faculty.name,
-                        day=slot.day,
-                        startTime=slot.startTime,
-                        endTime=slot.endTime,
-                        room_id=self.fixed_room_id
-                    )
-                    schedule.append(assignment)
-                    used_slots_per_faculty[faculty.id].append(slot)
-                    used_slots_per_room[self.fixed_room_id].append(slot)
-                    subject_counts[subject.name] = subject_counts.get(subject.name, 0) + 1
-                    assigned = True
-                    break
-                if assigned:
-                    break
+    def _fill_remaining_cell(self, slot: TimeSlot, subjects_to_consider: List, schedule: List[ScheduleAssignment],
+                             used_slots_per_faculty, room_index: RoomSlotIndex, subject_counts: Dict[str, int]) -> bool:
+        """Place any compatible subject into one free room of the slot; return False if nothing fits."""
+        for subject in subjects_to_consider:
+            for faculty in random.sample(subject.faculty, len(subject.faculty)):
+                if not self.problem.is_available(faculty.id, slot.day, *slot_minutes(slot)):
+                    continue
 
-        logger.info(f"Individual created with {len(schedule)} assignments")
-        return schedule
+                if any(slot.day == s.day and check_time_conflict(slot, s)
+                       for s in used_slots_per_faculty[faculty.id]):
+                    continue
+                room_id = self._pick_room(room_index, faculty.id, slot)
+                if room_id is None:
+                    continue
+
+                assignment = ScheduleAssignment(
+                    subject_name=subject.name,
+                    faculty_id=faculty.id,
+                    faculty_name=faculty.name,
+                    day=slot.day,
+                    startTime=slot.startTime,
+                    endTime=slot.endTime,
+                    room_id=room_id
+                )
+                schedule.append(assignment)
+                used_slots_per_faculty[faculty.id].append(slot)
+                room_index.book(room_id, slot)
+                subject_counts[subject.name] = subject_counts.get(subject.name, 0) + 1
+                return True
+        return False
 
     def _setup_ga(self):
         """Set up the genetic algorithm toolbox."""
         self.toolbox.register("individual", deap.tools.initIterate, deap.creator.Individual, self._create_individual)
+        self.toolbox.register("pareto_individual", deap.tools.initIterate, deap.creator.ParetoIndividual, self._create_individual)
         self.toolbox.register("population", self._valid_population)
         self.toolbox.register("evaluate", self._calculate_fitness)
+        self.toolbox.register("evaluate_pareto", self._objectives)
         self.toolbox.register("mate", self._crossover)
         self.toolbox.register("mutate", self._mutate, indpb=0.2)
         self.toolbox.register("select", deap.tools.selTournament, tournsize=3)
 
     def _calculate_fitness(self, individual: List[ScheduleAssignment]) -> Tuple[float]:
         """Calculate the fitness of an individual based on constraints and coverage."""
+        self.timings.count("evaluations")
+        return (self._hard_penalty(individual) + self._soft_penalty(individual),)
+
+    def _soft_penalty(self, individual: List[ScheduleAssignment]) -> int:
+        """Soft-constraint penalty of an individual; 0 when the input configures none.
+
+        Genes are grouped per faculty-day and each faculty-day is scored once
+        per distinct set of classes, so after crossover or mutation only the
+        faculty-days whose genes changed are rescored. Matches
+        LoadTracker.from_schedule on the expanded schedule.
+        """
+        if self._soft_scorer is None:
+            return 0
+        classes: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)
+        subject_days = set()
+        repeated_days = 0
+        for a in individual:
+            if a.faculty_id not in self.problem.faculty:
+                continue
+            if a.subject_name in self.block_subjects:
+                classes[(a.faculty_id, a.day)].extend(slot_minutes(period) for period in self._block_periods(a))
+            else:
+                classes[(a.faculty_id, a.day)].append(slot_minutes(a))
+            # A block gene is one class for the subject spread
+            repeated_days += (a.subject_name, a.day) in subject_days
+            subject_days.add((a.subject_name, a.day))
+
+        units = repeated_days if self.soft_constraints.spread_subjects else 0
+        for (_, day), windows in classes.items():
+            key = (day, tuple(sorted(windows)))
+            if key not in self._day_terms_cache:
+                self._day_terms_cache[key] = self._soft_scorer.day_terms(day, key[1])
+            units += sum(self._day_terms_cache[key])
+        return self.soft_constraints.weight * units
+
+    def _hard_penalty(self, individual: List[ScheduleAssignment]) -> float:
+        """Weighted penalty for unmet class counts, conflicts and unfilled cells; 0 for a complete, clash-free schedule."""
         subject_counts = {subject.name: 0 for subject in self.input_data.subjects}
         for a in individual:
             subject_counts[a.subject_name] += 1
@@ -211,7 +304,7 @@ class GeneticAlgorithm:
         used_slots_per_room = defaultdict(list)
         for a in individual:
             slot = TimeSlot(day=a.day, startTime=a.startTime, endTime=a.endTime)
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 conflicts += 1
             for existing_slot in used_slots_per_faculty[a.faculty_id]:
                 if slot.day == existing_slot.day and check_time_conflict(slot, existing_slot):
@@ -222,27 +315,55 @@ class GeneticAlgorithm:
             used_slots_per_faculty[a.faculty_id].append(slot)
             used_slots_per_room[a.room_id].append(slot)
 
-        used_slots = set((a.day, a.startTime, a.endTime) for a in individual)
-        unfilled_slots = len(self.assignable_slots) - len(used_slots)
+        used_cells = set()
+        for a in individual:
+            if a.subject_name in self.block_subjects:
+                used_cells.update((a.day, period.startTime, period.endTime, a.room_id) for period in self._block_periods(a))
+            else:
+                used_cells.add((a.day, a.startTime, a.endTime, a.room_id))
+        unfilled_slots = len(self.assignable_slots) * len(self.rooms) - len(used_cells)
         unfilled_penalty = unfilled_slots * 5000
 
-        fitness = class_requirement_penalty + (conflicts * 100) + unfilled_penalty
-        return (fitness,)
+        return class_requirement_penalty + (conflicts * 100) + unfilled_penalty
+
+    def _preference(self, a: ScheduleAssignment) -> int:
+        """Preference score of one gene, as the greedy engine scores its assignments."""
+        key = (a.subject_name, a.faculty_id, a.day, a.startTime, a.endTime)
+        if key not in self._preference_cache:
+            subject = self.subjects.get(a.subject_name)
+            faculty = self.problem.faculty.get(a.faculty_id)
+            self._preference_cache[key] = calculate_preference_score(
+                TimeSlot(day=a.day, startTime=a.startTime, endTime=a.endTime),
+                subject.preferred_slots if subject else [], faculty.preferred_slots if faculty else [])
+        return self._preference_cache[key]
+
+    def _objectives(self, individual: List[ScheduleAssignment]) -> Tuple[float, float, float]:
+        """(hard penalty, preference score less soft-constraint penalty, spread of weekly teaching minutes
+        across faculty) for NSGA-II."""
+        self.timings.count("evaluations")
+        minutes = dict.fromkeys(self.problem.faculty, 0)
+        for a in individual:
+            if a.faculty_id in minutes:
+                minutes[a.faculty_id] += time_to_minutes(a.endTime) - time_to_minutes(a.startTime)
+        imbalance = statistics.pstdev(minutes.values()) if len(minutes) > 1 else 0.0
+        preference = sum(self._preference(a) for a in individual) - self._soft_penalty(individual)
+        return self._hard_penalty(individual), float(preference), imbalance
 
-    def _valid_population(self, n):
+    def _valid_population(self, n, factory: Callable = None):
         """Generate a valid population, retrying if necessary."""
+        factory = factory or self.toolbox.individual
         pop = []
         attempts = 0
         max_attempts = 10000
         while len(pop) < n and attempts < max_attempts:
-            individual = self.toolbox.individual()
+            individual = factory()
             if len(individual) > 0:
                 pop.append(individual)
             attempts += 1
-            if attempts % 100 == 0:
-                logger.info(f"Tried {attempts} individuals, population size: {len(pop)}")
+            if attempts % 100 == 0 and self.detail.enabled:
+                self.detail("Tried %d individuals, population size: %d", attempts, len(pop))
         if len(pop) < n:
-            logger.warning(f"Could only generate {len(pop)} individuals out of {n} requested")
+            logger.warning("Could only generate %d individuals out of %d requested", len(pop), n)
         return pop
 
     def _crossover(self, ind1, ind2):
@@ -262,7 +383,7 @@ class GeneticAlgorithm:
             if any(slot.day == s.day and check_time_conflict(slot, s)
                    for s in used_slots1_faculty[a.faculty_id] + used_slots1_room[a.room_id]):
                 continue
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 continue
             new_ind1.append(a)
             used_slots1_faculty[a.faculty_id].append(slot)
@@ -273,7 +394,7 @@ class GeneticAlgorithm:
             if any(slot.day == s.day and check_time_conflict(slot, s)
                    for s in used_slots1_faculty[a.faculty_id] + used_slots1_room[a.room_id]):
                 continue
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 continue
             new_ind1.append(a)
             used_slots1_faculty[a.faculty_id].append(slot)
@@ -284,7 +405,7 @@ class GeneticAlgorithm:
             if any(slot.day == s.day and check_time_conflict(slot, s)
                    for s in used_slots2_faculty[a.faculty_id] + used_slots2_room[a.room_id]):
                 continue
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 continue
             new_ind2.append(a)
             used_slots2_faculty[a.faculty_id].append(slot)
@@ -295,7 +416,7 @@ class GeneticAlgorithm:
             if any(slot.day == s.day and check_time_conflict(slot, s)
                    for s in used_slots2_faculty[a.faculty_id] + used_slots2_room[a.room_id]):
                 continue
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 continue
             new_ind2.append(a)
             used_slots2_faculty[a.faculty_id].append(slot)
@@ -315,47 +436,35 @@ class GeneticAlgorithm:
             if any(slot.day == s.day and check_time_conflict(slot, s)
                    for s in used_slots_per_faculty[a.faculty_id] + used_slots_per_room[a.room_id]):
                 continue
-            if check_break_conflict(slot, self.input_data.break_):
+            if self.problem.overlaps_break(slot.day, *slot_minutes(slot)):
                 continue
             temp_schedule.append(a)
             used_slots_per_faculty[a.faculty_id].append(slot)
             used_slots_per_room[a.room_id].append(slot)
         individual[:] = temp_schedule
 
+        room_index = RoomSlotIndex(self.rooms, self.assignable_slots)
+        for a in individual:
+            room_index.book(a.room_id, TimeSlot(day=a.day, startTime=a.startTime, endTime=a.endTime))
+
         for i in range(len(individual)):
             if random.random() < indpb:
                 subject_name = individual[i].subject_name
                 subject = next(s for s in self.input_data.subjects if s.name == subject_name)
                 old_slot = TimeSlot(day=individual[i].day, startTime=individual[i].startTime, endTime=individual[i].endTime)
                 used_slots_per_faculty[individual[i].faculty_id].remove(old_slot)
-                used_slots_per_room[self.fixed_room_id].remove(old_slot)
+                room_index.release(individual[i].room_id, old_slot)
 
                 assigned = False
                 for faculty in random.sample(subject.faculty, len(subject.faculty)):
-                    valid_slots = []
-                    for slot in self.assignable_slots:
-                        slot_duration = self._get_slot_duration(slot)
-                        if slot_duration != subject.time:
-                            continue
-                        for avail in faculty.availability:
-                            if slot.day == avail.day:
-                                try:
-                                    avail_start = time_to_minutes(avail.startTime)
-                                    avail_end = time_to_minutes(avail.endTime)
-                                    slot_start = time_to_minutes(slot.startTime)
-                                    slot_end = time_to_minutes(slot.endTime)
-                                    if avail_start <= slot_start and slot_end <= avail_end:
-                                        valid_slots.append(slot)
-                                        break
-                                except ValueError as e:
-                                    logger.error(f"Time parsing error in _mutate for faculty {faculty.id}: {e}")
-                                    continue
+                    valid_slots = self._candidate_slots(faculty.id, subject)
 
                     for slot in random.sample(valid_slots, len(valid_slots)):
                         if any(slot.day == s.day and check_time_conflict(slot, s)
-                               for s in used_slots_per_faculty[faculty.id] + used_slots_per_room[self.fixed_room_id]):
+                               for s in used_slots_per_faculty[faculty.id]):
                             continue
-                        if self.conflict_checker and not self.conflict_checker(faculty.id, slot, self.fixed_room_id, self.input_data):
+                        room_id = self._pick_room(room_index, faculty.id, slot)
+                        if room_id is None:
                             continue
                         individual[i] = ScheduleAssignment(
                             subject_name=subject.name,
@@ -364,53 +473,106 @@ class GeneticAlgorithm:
                             day=slot.day,
                             startTime=slot.startTime,
                             endTime=slot.endTime,
-                            room_id=self.fixed_room_id
+                            room_id=room_id
                         )
                         used_slots_per_faculty[faculty.id].append(slot)
-                        used_slots_per_room[self.fixed_room_id].append(slot)
+                        room_index.book(room_id, slot)
                         assigned = True
                         break
                     if assigned:
                         break
 
                 if not assigned:
-                    logger.warning(f"Could not mutate assignment for {subject.name} at index {i}")
+                    # Keep the original gene and its bookings
+                    used_slots_per_faculty[individual[i].faculty_id].append(old_slot)
+                    room_index.book(individual[i].room_id, old_slot)
+                    if self.detail.enabled:
+                        self.detail("Could not mutate assignment for %s at index %d", subject.name, i)
 
         return individual,
 
-    def run(self) -> Tuple[List[ScheduleAssignment], float]:
-        """Run the genetic algorithm to generate an optimized schedule."""
-        logger.info("Starting Genetic Algorithm...")
-        pop = self.toolbox.population(n=self.pop_size)
-        logger.info(f"Initial population created: {len(pop)} individuals")
+    def _evolve_generation(self, pop: List) -> None:
+        """Run selection, crossover, mutation and elitist replacement for one generation, in place."""
+        offspring = self.toolbox.select(pop, len(pop))
+        offspring = list(map(self.toolbox.clone, offspring))
+        self._vary(offspring)
 
-        fitnesses = list(map(self.toolbox.evaluate, pop))
-        for ind, fit in zip(pop, fitnesses):
+        invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
+        fitnesses = map(self.toolbox.evaluate, invalid_ind)
+        for ind, fit in zip(invalid_ind, fitnesses):
             ind.fitness.values = fit
 
-        for gen in range(self.generations):
-            logger.info(f"Generation {gen+1}/{self.generations}")
-            offspring = self.toolbox.select(pop, len(pop))
-            offspring = list(map(self.toolbox.clone, offspring))
-
-            for c1, c2 in zip(offspring[::2], offspring[1::2]):
-                if random.random() < 0.8:
-                    self.toolbox.mate(c1, c2)
-                    del c1.fitness.values
-                    del c2.fitness.values
-
-            for mutant in offspring:
-                if random.random() < 0.2:
-                    self.toolbox.mutate(mutant)
-                    del mutant.fitness.values
-
-            invalid_ind = [ind for ind in offspring if not ind.fitness.valid]
-            fitnesses = map(self.toolbox.evaluate, invalid_ind)
-            for ind, fit in zip(invalid_ind, fitnesses):
+        pop[:] = deap.tools.selBest(pop + offspring, k=self.pop_size)
+
+    def _vary(self, offspring: List) -> None:
+        """Crossover and mutate cloned parents in place, invalidating the fitness of the ones that changed."""
+        for c1, c2 in zip(offspring[::2], offspring[1::2]):
+            if random.random() < 0.8:
+                self.toolbox.mate(c1, c2)
+                del c1.fitness.values
+                del c2.fitness.values
+
+        for mutant in offspring:
+            if random.random() < 0.2:
+                self.toolbox.mutate(mutant)
+                del mutant.fitness.values
+
+    def run(self) -> Tuple[List[ScheduleAssignment], float]:
+        """Run the genetic algorithm to generate an optimized schedule."""
+        with self.timings.span("ga.init"):
+            pop = self.toolbox.population(n=self.pop_size)
+
+            fitnesses = list(map(self.toolbox.evaluate, pop))
+            for ind, fit in zip(pop, fitnesses):
                 ind.fitness.values = fit
 
-            pop[:] = deap.tools.selBest(pop + offspring, k=self.pop_size)
+        with self.timings.span("ga.generations"):
+            for gen in range(self.generations):
+                self._evolve_generation(pop)
+                self.timings.count("ga_generations")
+                if self.detail.enabled:
+                    self.detail("Generation %d/%d best fitness: %s", gen + 1, self.generations,
+                                min(ind.fitness.values[0] for ind in pop))
 
         best = deap.tools.selBest(pop, k=1)[0]
-        logger.info("Genetic Algorithm completed.")
-        return best, best.fitness.values[0]
+        logger.info("GA completed: population=%d generations=%d best_fitness=%s",
+                    len(pop), self.generations, best.fitness.values[0])
+        return self._expand_blocks(best), best.fitness.values[0]
+
+    def run_pareto(self, front_size: int = DEFAULT_FRONT_SIZE) -> List[Tuple[List[ScheduleAssignment], Tuple[float, float, float]]]:
+        """Run NSGA-II and return up to front_size non-dominated schedules with their objectives.
+
+        Objectives are (hard penalty, preference score less any
+        soft-constraint penalty, faculty load imbalance), so one run covers
+        the trade-offs that otherwise need
+        several runs with different weights. The front is thinned by crowding
+        distance to keep the returned schedules spread out, then ordered by
+        hard penalty and preference. Genes carry their preference score.
+        """
+        with self.timings.span("ga.init"):
+            pop = self._valid_population(self.pop_size, self.toolbox.pareto_individual)
+            for ind in pop:
+                ind.fitness.values = self.toolbox.evaluate_pareto(ind)
+            # Assigns the crowding distances the first generation's selection relies on
+            pop = deap.tools.selNSGA2(pop, len(pop))
+        if not pop:
+            return []
+
+        with self.timings.span("ga.generations"):
+            for gen in range(self.generations):
+                offspring = list(map(self.toolbox.clone, random.sample(pop, len(pop))))
+                self._vary(offspring)
+                for ind in offspring:
+                    if not ind.fitness.valid:
+                        ind.fitness.values = self.toolbox.evaluate_pareto(ind)
+                pop = deap.tools.selNSGA2(pop + offspring, self.pop_size)
+                self.timings.count("ga_generations")
+
+        front = deap.tools.sortNondominated(pop, len(pop), first_front_only=True)[0]
+        distinct = list({ind.fitness.values: ind for ind in front}.values())
+        chosen = deap.tools.selNSGA2(distinct, min(front_size, len(distinct)))
+        chosen.sort(key=lambda ind: (ind.fitness.values[0], -ind.fitness.values[1], ind.fitness.values[2]))
+        logger.info("NSGA-II completed: population=%d generations=%d front=%d returned=%d",
+                    len(pop), self.generations, len(front), len(chosen))
+        return [(self._expand_blocks([dataclasses.replace(a, priority_score=self._preference(a)) for a in ind]),
+                 ind.fitness.values) for ind in chosen]
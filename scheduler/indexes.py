@@ -0,0 +1,174 @@
+from typing import List, Dict, Tuple, Optional, Iterable, Hashable, Collection
+from collections import defaultdict
+from bisect import bisect_left
+from model import TimeSlot
+from utils import time_to_minutes
+
+SlotKey = Tuple[str, str, str]  # (day, startTime, endTime)
+Block = Tuple[int, TimeSlot]  # (bit mask of the day's grid periods, slot spanning them)
+
+def slot_key(slot: TimeSlot) -> SlotKey:
+    """Hashable key identifying a slot on the weekly grid."""
+    return (slot.day, slot.startTime, slot.endTime)
+
+class RoomSlotIndex:
+    """Per-room free-slot index over the weekly slot grid.
+
+    For every grid slot the index keeps the ordered set of rooms that are still
+    free, so picking a room for a candidate slot is O(1). Booking a room removes
+    it from every grid slot it overlaps on that day; slots outside the grid fall
+    back to the per-room booking lists.
+    """
+
+    def __init__(self, rooms: Iterable[str], slots: Iterable[TimeSlot]):
+        self.rooms = list(dict.fromkeys(rooms))
+        self._free: Dict[SlotKey, Dict[str, None]] = {}
+        self._grid_by_day: Dict[str, List[Tuple[int, int, SlotKey]]] = defaultdict(list)
+        self._bookings: Dict[Tuple[str, str], List[Tuple[int, int]]] = defaultdict(list)  # (room, day) -> intervals
+        for slot in slots:
+            key = slot_key(slot)
+            if key in self._free:
+                continue
+            self._free[key] = dict.fromkeys(self.rooms)
+            self._grid_by_day[slot.day].append((time_to_minutes(slot.startTime), time_to_minutes(slot.endTime), key))
+
+    def _overlaps_booking(self, room: str, day: str, start: int, end: int) -> bool:
+        return any(start < b_end and b_start < end for b_start, b_end in self._bookings[(room, day)])
+
+    def free_rooms(self, slot: TimeSlot) -> List[str]:
+        """Rooms that are free for the whole slot, in input order."""
+        key = slot_key(slot)
+        if key in self._free:
+            return list(self._free[key])
+        start, end = time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+        return [room for room in self.rooms if not self._overlaps_booking(room, slot.day, start, end)]
+
+    def first_free_room(self, slot: TimeSlot) -> Optional[str]:
+        """The first free room for the slot, or None if every room is taken."""
+        key = slot_key(slot)
+        if key in self._free:
+            return next(iter(self._free[key]), None)
+        free = self.free_rooms(slot)
+        return free[0] if free else None
+
+    def is_free(self, room: str, slot: TimeSlot) -> bool:
+        """Check whether a single room is free for the slot."""
+        key = slot_key(slot)
+        if key in self._free:
+            return room in self._free[key]
+        return room in self.rooms and not self._overlaps_booking(
+            room, slot.day, time_to_minutes(slot.startTime), time_to_minutes(slot.endTime))
+
+    def book(self, room: str, slot: TimeSlot) -> None:
+        """Mark the room as taken for the slot and every grid slot overlapping it."""
+        start, end = time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+        self._bookings[(room, slot.day)].append((start, end))
+        for grid_start, grid_end, key in self._grid_by_day.get(slot.day, ()):
+            if grid_start < end and start < grid_end:
+                self._free[key].pop(room, None)
+
+    def release(self, room: str, slot: TimeSlot) -> None:
+        """Undo a booking made with book()."""
+        start, end = time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+        bookings = self._bookings[(room, slot.day)]
+        if (start, end) not in bookings:
+            return
+        bookings.remove((start, end))
+        for grid_start, grid_end, key in self._grid_by_day.get(slot.day, ()):
+            if grid_start < end and start < grid_end and not self._overlaps_booking(room, slot.day, grid_start, grid_end):
+                # Re-insert while keeping the input order of rooms
+                free = self._free[key]
+                free[room] = None
+                self._free[key] = {r: None for r in self.rooms if r in free}
+
+class OccupancyIndex:
+    """Booked intervals per key (e.g. (faculty_id, day)), searchable by time.
+
+    Each key keeps its intervals sorted by start together with the longest
+    interval length, so finding what overlaps [start, end) is a binary search
+    plus a scan over the few intervals that can reach into it.
+    """
+
+    def __init__(self):
+        self._starts: Dict[Hashable, List[int]] = defaultdict(list)
+        self._entries: Dict[Hashable, List[Tuple[int, int, int]]] = defaultdict(list)  # (start, end, id) sorted
+        self._longest: Dict[Hashable, int] = defaultdict(int)
+
+    @classmethod
+    def build(cls, intervals: Iterable[Tuple[Hashable, int, int, int]]) -> "OccupancyIndex":
+        """Index (key, start, end, id) tuples in one sort."""
+        index = cls()
+        for key, start, end, idx in sorted(intervals, key=lambda item: (item[1], item[2], item[3])):
+            index._entries[key].append((start, end, idx))
+            index._starts[key].append(start)
+            index._longest[key] = max(index._longest[key], end - start)
+        return index
+
+    def overlapping(self, key: Hashable, start: int, end: int, exclude: Collection[int] = ()) -> List[int]:
+        """Ids of intervals under key overlapping [start, end), except the excluded ones."""
+        starts = self._starts.get(key)
+        if not starts:
+            return []
+        entries = self._entries[key]
+        found = []
+        # Only intervals starting within the longest length before `start` can still be running at `start`
+        for i in range(bisect_left(starts, start - self._longest[key] + 1), bisect_left(starts, end)):
+            entry_start, entry_end, idx = entries[i]
+            if start < entry_end and entry_start < end and idx not in exclude:
+                found.append(idx)
+        return found
+
+class ConsecutiveBlockIndex:
+    """Runs of back-to-back grid periods per day, for classes that need consecutive periods.
+
+    Each day's periods are numbered in time order and a block is kept as the
+    bit mask of its periods, so testing a whole block against a day's
+    occupancy mask is a single AND. Periods only chain when one ends exactly
+    where the next starts, so breaks split runs. Blocks of each (day, length)
+    are enumerated once and cached.
+    """
+
+    def __init__(self, slots: Iterable[TimeSlot]):
+        self._periods: Dict[str, List[Tuple[int, int, TimeSlot]]] = defaultdict(list)
+        seen = set()
+        for slot in slots:
+            key = slot_key(slot)
+            if key in seen:
+                continue
+            seen.add(key)
+            self._periods[slot.day].append((time_to_minutes(slot.startTime), time_to_minutes(slot.endTime), slot))
+        for periods in self._periods.values():
+            periods.sort(key=lambda period: period[:2])
+        self._blocks: Dict[Tuple[str, int], List[Block]] = {}
+
+    def blocks(self, day: str, length: int) -> List[Block]:
+        """Runs of adjacent periods on the day lasting exactly length minutes, earliest first."""
+        key = (day, length)
+        if key not in self._blocks:
+            periods = self._periods.get(day, [])
+            found = []
+            for first, (block_start, _, first_slot) in enumerate(periods):
+                mask, block_end = 0, block_start
+                for i in range(first, len(periods)):
+                    start, end, slot = periods[i]
+                    if start != block_end or end - block_start > length:
+                        break
+                    mask |= 1 << i
+                    block_end = end
+                    if block_end - block_start == length:
+                        found.append((mask, TimeSlot(day=day, startTime=first_slot.startTime, endTime=slot.endTime)))
+                        break
+            self._blocks[key] = found
+        return self._blocks[key]
+
+    def mask(self, day: str, start: int, end: int) -> int:
+        """Bit mask of the day's periods overlapping [start, end)."""
+        mask = 0
+        for i, (period_start, period_end, _) in enumerate(self._periods.get(day, ())):
+            if period_start < end and start < period_end:
+                mask |= 1 << i
+        return mask
+
+    def periods(self, day: str, mask: int) -> List[TimeSlot]:
+        """Grid slots of the day's periods in the mask, in time order."""
+        return [slot for i, (_, _, slot) in enumerate(self._periods.get(day, ())) if mask >> i & 1]
@@ -0,0 +1,86 @@
+import random
+from typing import List
+from model import ScheduleInput, Subject, Faculty, TimeSlot, PreferredSlot, Break, CollegeTime
+from utils import VALID_DAYS, time_to_minutes, minutes_to_time
+
+def generate_instance(
+    num_subjects: int = 10,
+    num_faculty: int = 5,
+    availability_density: float = 0.7,
+    preference_density: float = 0.3,
+    num_breaks: int = 1,
+    num_rooms: int = 1,
+    classes_per_week: int = 3,
+    durations: List[int] = None,
+    college_start: str = "09:00",
+    college_end: str = "16:30",
+    seed: int = 0
+) -> ScheduleInput:
+    """Generate a reproducible, realistic ScheduleInput for tests and benchmarks.
+
+    - **availability_density**: share of (day, hour) blocks in which a faculty member is available
+    - **preference_density**: probability that a subject or faculty member carries a preferred slot
+    - **num_breaks**: ALL_DAYS breaks spread evenly over the college day
+    """
+    rng = random.Random(seed)
+    durations = durations or [50]
+    day_start = time_to_minutes(college_start)
+    day_end = time_to_minutes(college_end)
+
+    def random_window(min_length: int) -> tuple:
+        length = rng.randrange(min_length, max(min_length + 1, day_end - day_start + 1), 10)
+        start = rng.randrange(day_start, max(day_start + 1, day_end - length + 1), 10)
+        return start, min(start + length, day_end)
+
+    def random_preference(day_choices: List[str]) -> PreferredSlot:
+        start, end = random_window(60)
+        return PreferredSlot(day=rng.choice(day_choices), startTime=minutes_to_time(start),
+                             endTime=minutes_to_time(end), priority=rng.randint(1, 5))
+
+    # Faculty availability is built from hour-long blocks, merged into windows
+    faculty_pool = []
+    for idx in range(num_faculty):
+        availability = []
+        for day in VALID_DAYS:
+            window_start = None
+            for block_start in range(day_start, day_end, 60):
+                block_end = min(block_start + 60, day_end)
+                if rng.random() < availability_density:
+                    if window_start is None:
+                        window_start = block_start
+                    window_end = block_end
+                elif window_start is not None:
+                    availability.append(TimeSlot(day=day, startTime=minutes_to_time(window_start), endTime=minutes_to_time(window_end)))
+                    window_start = None
+            if window_start is not None:
+                availability.append(TimeSlot(day=day, startTime=minutes_to_time(window_start), endTime=minutes_to_time(window_end)))
+        preferred = [random_preference(VALID_DAYS + ["ANY_DAY"])] if rng.random() < preference_density else []
+        faculty_pool.append(Faculty(id=f"F{idx + 1}", name=f"Faculty {idx + 1}", availability=availability, preferred_slots=preferred))
+
+    subjects = []
+    for idx in range(num_subjects):
+        teachers = rng.sample(faculty_pool, min(len(faculty_pool), rng.randint(1, 2))) if faculty_pool else []
+        duration = rng.choice(durations)
+        preferred = [random_preference(VALID_DAYS + ["ANY_DAY"])] if rng.random() < preference_density else []
+        subjects.append(Subject(
+            name=f"Subject {idx + 1}",
+            time=duration,
+            no_of_classes_per_week=max(1, classes_per_week + rng.randint(-1, 1)),
+            faculty=teachers,
+            is_special=rng.random() < 0.1,
+            preferred_slots=preferred
+        ))
+
+    breaks = []
+    for idx in range(num_breaks):
+        start = day_start + (day_end - day_start) * (idx + 1) // (num_breaks + 1)
+        start -= start % 10
+        length = 40 if idx == num_breaks // 2 else 10  # one lunch break, the rest short
+        breaks.append(Break(day="ALL_DAYS", startTime=minutes_to_time(start), endTime=minutes_to_time(start + length)))
+
+    return ScheduleInput(
+        subjects=subjects,
+        break_=breaks,
+        college_time=CollegeTime(startTime=college_start, endTime=college_end),
+        rooms=[f"R{idx + 1}" for idx in range(num_rooms)]
+    )
@@ -0,0 +1,117 @@
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Tuple
+
+# Upper bounds (in milliseconds) of the span histogram buckets
+SPAN_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, float("inf"))
+
+# Emit only every Nth per-item DEBUG line from hot loops; 1 logs them all
+LOG_SAMPLE_EVERY = max(1, int(os.environ.get("SCHEDULER_LOG_SAMPLE_EVERY", "1")))
+
+class DetailLog:
+    """Per-item DEBUG logging for hot loops: level-gated once, lazily formatted and sampled.
+
+    Check `enabled` before building arguments so a disabled loop costs a single
+    attribute lookup per item.
+    """
+
+    def __init__(self, logger: logging.Logger, sample_every: int = None):
+        self.logger = logger
+        self.enabled = logger.isEnabledFor(logging.DEBUG)
+        self.sample_every = sample_every or LOG_SAMPLE_EVERY
+        self.seen = 0
+
+    def __call__(self, msg: str, *args) -> None:
+        if not self.enabled:
+            return
+        self.seen += 1
+        if (self.seen - 1) % self.sample_every == 0:
+            self.logger.debug(msg, *args)
+
+class SolveTimings:
+    """Monotonic-clock spans and hot-path counters collected during one solve.
+
+    Spans with the same name accumulate, so a phase that runs once per section
+    or per day reports its total time.
+    """
+
+    def __init__(self):
+        self.spans: Dict[str, float] = {}  # span name -> seconds
+        self.counters: Dict[str, int] = defaultdict(int)
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under the given span name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + (time.perf_counter() - start)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a hot-path counter (conflict checks, candidates examined, ...)."""
+        self.counters[name] += amount
+
+    def merge_counters(self, counters: Dict[str, int]) -> None:
+        """Fold in counters collected by a worker process."""
+        for name, amount in counters.items():
+            self.counters[name] += amount
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Timings block returned to API clients, in milliseconds."""
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "spans_ms": {name: round(seconds * 1000, 3) for name, seconds in self.spans.items()},
+            "counters": dict(self.counters),
+        }
+
+class TimingHistograms:
+    """Process-wide histograms of span durations and counter totals, aggregated across solves."""
+
+    def __init__(self, buckets_ms: Tuple[float, ...] = SPAN_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self._bucket_counts: Dict[str, list] = {}
+        self._sums_ms: Dict[str, float] = defaultdict(float)
+        self._observations: Dict[str, int] = defaultdict(int)
+        self._counter_totals: Dict[str, int] = defaultdict(int)
+
+    def observe(self, timings: SolveTimings) -> None:
+        """Record every span and counter of a finished solve."""
+        with self._lock:
+            for name, seconds in timings.spans.items():
+                value_ms = seconds * 1000
+                buckets = self._bucket_counts.setdefault(name, [0] * len(self.buckets_ms))
+                buckets[bisect_left(self.buckets_ms, value_ms)] += 1
+                self._sums_ms[name] += value_ms
+                self._observations[name] += 1
+            for name, amount in timings.counters.items():
+                self._counter_totals[name] += amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cumulative bucket counts per span, Prometheus-style, plus counter totals."""
+        with self._lock:
+            spans = {}
+            for name, buckets in self._bucket_counts.items():
+                cumulative, running = [], 0
+                for count in buckets:
+                    running += count
+                    cumulative.append(running)
+                spans[name] = {
+                    "buckets_ms": [
+                        {"le": "+Inf" if bound == float("inf") else bound, "count": count}
+                        for bound, count in zip(self.buckets_ms, cumulative)
+                    ],
+                    "count": self._observations[name],
+                    "sum_ms": round(self._sums_ms[name], 3),
+                }
+            return {"spans": spans, "counters": dict(self._counter_totals)}
+
+# Shared by every SchedulerService in the process
+TIMING_HISTOGRAMS = TimingHistograms()
@@ -0,0 +1,58 @@
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+Window = Tuple[int, int]  # (start, end) in minutes since midnight
+
+def merge_intervals(windows: Iterable[Window]) -> List[Window]:
+    """Sort windows and merge the ones that overlap or touch."""
+    merged: List[List[int]] = []
+    for start, end in sorted(windows):
+        if end <= start:
+            continue  # Empty or inverted windows cannot contain or overlap anything
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+class IntervalSet:
+    """Disjoint, sorted windows of one day, queried by binary search.
+
+    Containment and overlap checks are O(log k) in the number of windows,
+    instead of a scan over every window the frontend sent.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, windows: Iterable[Window] = ()):
+        merged = merge_intervals(windows)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+
+    def contains(self, start: int, end: int) -> bool:
+        """Whether a single window covers all of [start, end)."""
+        i = bisect_right(self.starts, start) - 1
+        return i >= 0 and end <= self.ends[i]
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Whether any window overlaps [start, end)."""
+        i = bisect_right(self.ends, start)  # first window ending after start
+        return i < len(self.starts) and self.starts[i] < end
+
+    def covered(self, start: int, end: int) -> int:
+        """Minutes of [start, end) that fall inside the windows."""
+        minutes = 0
+        for i in range(bisect_right(self.ends, start), len(self.starts)):
+            if self.starts[i] >= end:
+                break
+            minutes += min(end, self.ends[i]) - max(start, self.starts[i])
+        return minutes
+
+    def __iter__(self) -> Iterator[Window]:
+        return iter(zip(self.starts, self.ends))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
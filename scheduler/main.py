@@ -1,20 +1,56 @@
-from fastapi import FastAPI, HTTPException, Query, Depends, Response
+from fastapi import FastAPI, HTTPException, Query, Depends, Response, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, PlainTextResponse
 from typing import Optional, List, Dict, Any
-from model import ScheduleInput, ScheduleAssignment, Break
-from scheduler import SchedulerService
+from contextlib import asynccontextmanager
+from model import ScheduleInput, ScheduleAssignment, Break, BatchScheduleInput, RepairInput, ScheduleValidationInput, WhatIfInput, SuggestionInput, DEFAULT_FRONT_SIZE
+from scheduler import SchedulerService, warm_up
+from instrumentation import TIMING_HISTOGRAMS
+from metrics import SCHEDULER_METRICS
+from recording import TraceRecorder
+from repair import DEFAULT_REPAIR_RADIUS
+from validation import validate_schedule
+from whatif import score_candidates, suggest_alternatives, DEFAULT_SUGGESTIONS
+from schedule_diff import diff_schedules
+from feasibility import InfeasibleScheduleError
 import logging
 import json
+import time
+import os
+import hmac
+import random
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def run_warm_up() -> None:
+    """Warm up before serving when SCHEDULER_WARMUP=1 or SCHEDULER_WARMUP_INPUT=<ScheduleInput JSON> is set."""
+    input_path = os.environ.get("SCHEDULER_WARMUP_INPUT")
+    if not input_path and os.environ.get("SCHEDULER_WARMUP", "").lower() not in ("1", "true", "yes", "on"):
+        return
+    try:
+        input_data = None
+        if input_path:
+            from pydantic import TypeAdapter
+            with open(input_path) as f:
+                input_data = TypeAdapter(ScheduleInput).validate_python(json.load(f))
+        timings = warm_up(input_data)
+        logger.info(f"Warm-up completed in {timings['total_ms']} ms: {timings['spans_ms']}")
+    except Exception as e:
+        # A failed warm-up only costs latency on the first request; keep serving
+        logger.error(f"Warm-up failed: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    run_warm_up()
+    yield
+
 app = FastAPI(
     title="Class Scheduler API",
     description="API for generating conflict-free class schedules",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -26,6 +62,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Endpoints that run a solve; their requests count towards queue depth and carry an engine label
+SOLVE_ENDPOINTS = {
+    "/api/generate-schedule",
+    "/generate_schedule",
+    "/api/generate-batch-schedule",
+    "/api/generate-schedules/stream",
+    "/api/repair-schedule",
+    "/api/generate-pareto-front",
+}
+
+# Solve endpoints that do not take use_ga, and the engine label their requests carry
+FIXED_ENGINE_ENDPOINTS = {"/api/repair-schedule": "repair", "/api/generate-pareto-front": "pareto"}
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count requests and record their latency per endpoint and engine."""
+    is_solve = request.url.path in SOLVE_ENDPOINTS
+    if request.url.path in FIXED_ENGINE_ENDPOINTS:
+        engine = FIXED_ENGINE_ENDPOINTS[request.url.path]
+    elif is_solve:
+        use_ga = request.query_params.get("use_ga", "false").lower() in ("1", "true", "yes", "on")
+        engine = "ga" if use_ga else "greedy"
+    else:
+        engine = "none"
+
+    started = time.perf_counter()
+    status = 500
+    try:
+        if is_solve:
+            with SCHEDULER_METRICS.track_request():
+                response = await call_next(request)
+        else:
+            response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Use the route template so path parameters do not explode label cardinality
+        route = request.scope.get("route")
+        endpoint = route.path if route is not None else "unmatched"
+        SCHEDULER_METRICS.requests.inc(endpoint=endpoint, method=request.method, engine=engine, status=str(status))
+        SCHEDULER_METRICS.request_latency.observe(time.perf_counter() - started, endpoint=endpoint, engine=engine)
+
+def require_admin(x_admin_token: Optional[str]) -> None:
+    """Reject the request unless it carries the admin token from SCHEDULER_ADMIN_TOKEN."""
+    expected = os.environ.get("SCHEDULER_ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=403, detail="Profiling is disabled: SCHEDULER_ADMIN_TOKEN is not set")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+# Records anonymised requests for offline replay when SCHEDULER_TRACE_FILE is set
+TRACE_RECORDER = TraceRecorder.from_env()
+
 # Create a singleton instance of the scheduler service
 scheduler_service = SchedulerService()
 
@@ -39,7 +128,18 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "generate_schedule": "/api/generate-schedule",
+            "generate_batch_schedule": "/api/generate-batch-schedule",
+            "generate_schedules_stream": "/api/generate-schedules/stream",
+            "generate_pareto_front": "/api/generate-pareto-front",
+            "analyze_feasibility": "/api/analyze-feasibility",
+            "repair_schedule": "/api/repair-schedule",
+            "validate_schedule": "/api/validate-schedule",
+            "score_edits": "/api/score-edits",
+            "suggest_alternatives": "/api/suggest-alternatives",
             "schedule_history": "/api/schedule-history",
+            "schedule_history_diff": "/api/schedule-history/diff",
+            "timings": "/api/timings",
+            "metrics": "/metrics",
             "health": "/api/health",
             "schedule_table": "/api/schedule-table"
         }
@@ -48,20 +148,71 @@ async def root():
 @app.post("/api/generate-schedule", response_model=Dict[str, Any])
 async def generate_schedule(
     input_data: ScheduleInput, 
-    use_ga: bool = Query(False, description="Use genetic algorithm for optimization")
+    use_ga: bool = Query(False, description="Use genetic algorithm for optimization"),
+    parallel_days: bool = Query(False, description="Fill each day's remaining slots in parallel (greedy engine only)"),
+    include_timings: bool = Query(False, description="Return per-phase timing spans and hot-path counters"),
+    profile: bool = Query(False, description="Admin only: run the solve under cProfile and return the hottest functions"),
+    profile_memory: bool = Query(False, description="Admin only: also trace allocations with tracemalloc"),
+    profile_top: int = Query(25, ge=1, le=500, description="Number of functions/allocation sites to report"),
+    seed: Optional[int] = Query(None, description="Seed for the random number generator, for reproducible GA runs"),
+    diff_from: Optional[int] = Query(None, description="Return only the changes relative to this schedule history entry"),
+    check_feasibility: bool = Query(False, description="Fail fast with a capacity report when the required classes cannot all fit"),
+    x_admin_token: Optional[str] = Header(None)
 ):
     """
     Generate a class schedule based on the provided input data.
     
     - **input_data**: The schedule input data including subjects, faculty, breaks, etc.
     - **use_ga**: Whether to use genetic algorithm for optimization (default: False)
+    - **parallel_days**: Run the Phase 2 slot fill for each day in its own worker process (default: False)
+    - **include_timings**: Add a `timings` block with per-phase spans and counters (default: False)
+    - **profile** / **profile_memory** / **profile_top**: Admin only (`X-Admin-Token` header). Add a `profile`
+      block with the top functions by cumulative time, optionally the top allocation sites, and a
+      `pstats_id` to download the raw dump from `/api/profiles/{pstats_id}`
+    - **seed**: Seed the random number generator before solving (default: unseeded)
+    - **diff_from**: Replace the weekly and tabular views with a `diff` against this history
+      entry (e.g. -1 for the previous schedule) and its `history_index` (default: full result)
+    - **check_feasibility**: Run the capacity and max-flow analysis of /api/analyze-feasibility
+      first and answer 422 with its report instead of searching a hopeless input (default: False)
     
     Returns a weekly schedule with time slots and assignments.
     """
+    if profile or profile_memory:
+        require_admin(x_admin_token)
     try:
         logger.info(f"Generating schedule with GA: {use_ga}")
-        result = scheduler_service.generate_schedule(input_data, use_ga)
+        recording = TRACE_RECORDER is not None and TRACE_RECORDER.should_record()
+        if recording and seed is None:
+            # Replays need the seed even when the client did not pick one
+            seed = random.randrange(2 ** 32)
+        if seed is not None:
+            random.seed(seed)
+        # Resolve the base before solving: the new schedule shifts negative history indexes
+        diff_base = scheduler_service.get_history_entry(diff_from)["schedule"] if diff_from is not None else None
+
+        started = time.perf_counter()
+        if profile or profile_memory:
+            # cProfile/tracemalloc are only loaded when an admin asks for a profile
+            from profiling import profile_call, PROFILE_STORE
+            result, report = profile_call(
+                scheduler_service.generate_schedule, input_data, use_ga, parallel_days, include_timings, check_feasibility,
+                top_n=profile_top, trace_memory=profile_memory, store=PROFILE_STORE)
+            result["profile"] = report
+        else:
+            result = scheduler_service.generate_schedule(input_data, use_ga, parallel_days, include_timings, check_feasibility)
+
+        if recording:
+            TRACE_RECORDER.record(input_data, "ga" if use_ga else "greedy", parallel_days, seed,
+                                  time.perf_counter() - started, result, scheduler_service.timings.as_dict())
+        if diff_base is not None:
+            history = scheduler_service.get_schedule_history()
+            result = {key: value for key, value in result.items() if key not in ("weekly_schedule", "tabular_schedule")}
+            result["diff"] = diff_schedules(diff_base, history[-1]["schedule"])
+            result["history_index"] = len(history) - 1
         return result
+    except InfeasibleScheduleError as e:
+        logger.error(f"Infeasible input: {str(e)}")
+        raise HTTPException(status_code=422, detail={"message": str(e), "report": e.report})
     except ValueError as e:
         logger.error(f"Bad request: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -77,7 +228,218 @@ async def generate_schedule_legacy(
     """
     Legacy endpoint for backward compatibility.
     """
-    return await generate_schedule(input_data, use_ga)
+    return await generate_schedule(input_data, use_ga, parallel_days=False, include_timings=False,
+                                   profile=False, profile_memory=False, profile_top=25, seed=None, diff_from=None,
+                                   x_admin_token=None, check_feasibility=False)
+
+@app.post("/api/generate-batch-schedule", response_model=Dict[str, Any])
+async def generate_batch_schedule(
+    batch: BatchScheduleInput,
+    use_ga: bool = Query(False, description="Use genetic algorithm for optimization"),
+    parallel: bool = Query(False, description="Solve independent groups of sections concurrently")
+):
+    """
+    Generate schedules for many sections that share faculty in a single solve.
+
+    - **batch**: The sections to schedule plus an optional shared faculty pool
+    - **use_ga**: Whether to use genetic algorithm for optimization (default: False)
+    - **parallel**: Split the batch into groups of sections sharing no faculty
+      and no rooms, and solve the groups in a process pool (default: False)
+
+    Faculty and rooms are booked in one occupancy index across all sections,
+    so no faculty member or room is double-booked between sections.
+    """
+    try:
+        logger.info(f"Generating batch schedule for {len(batch.sections)} sections with GA: {use_ga}")
+        return scheduler_service.generate_batch_schedule(batch, use_ga, parallel)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/generate-schedules/stream")
+async def generate_schedules_stream(
+    batch: BatchScheduleInput,
+    use_ga: bool = Query(False, description="Use genetic algorithm for optimization"),
+    parallel: bool = Query(False, description="Solve independent groups of sections concurrently")
+):
+    """
+    Generate schedules for many sections and stream them back as NDJSON.
+
+    - **batch**: The sections to schedule plus an optional shared faculty pool
+    - **use_ga**: Whether to use genetic algorithm for optimization (default: False)
+    - **parallel**: Solve independent groups of sections in a process pool (default: False)
+
+    Sections are solved against one shared occupancy index, as in
+    /api/generate-batch-schedule. Emits one `{"type": "section", ...}` line per section as soon as it is solved,
+    an `{"type": "error", ...}` line for sections that fail, and a final
+    `{"type": "summary", ...}` line with aggregate statistics.
+    """
+    try:
+        scheduler_service.validate_batch(batch)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    logger.info(f"Streaming schedules for {len(batch.sections)} sections with GA: {use_ga}")
+
+    # The stream is consumed from a worker thread, so solve on a dedicated
+    # service instead of sharing per-solve state with the singleton.
+    stream_service = SchedulerService()
+    stream_service.schedule_history = scheduler_service.schedule_history
+    records = stream_service.iter_section_schedules(batch, use_ga, parallel)
+    return StreamingResponse(
+        (json.dumps(record) + "\n" for record in records),
+        media_type="application/x-ndjson"
+    )
+
+@app.post("/api/analyze-feasibility", response_model=Dict[str, Any])
+async def analyze_feasibility(
+    input_data: ScheduleInput,
+    include_timings: bool = Query(False, description="Return per-phase timing spans and hot-path counters")
+):
+    """
+    Check, without searching, whether every required class can possibly be placed.
+
+    - **input_data**: Schedule input data
+    - **include_timings**: Add a `timings` block with per-phase spans and counters (default: False)
+
+    Returns `feasible`, the `issues` found (subject, faculty and room capacity bounds, and
+    `hall_violation` for subjects competing for too few faculty-slot-room cells) and the
+    per-subject and per-faculty capacity figures behind them.
+    """
+    try:
+        logger.info(f"Analyzing feasibility of {len(input_data.subjects)} subjects")
+        return scheduler_service.analyze_feasibility(input_data, include_timings)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/generate-pareto-front", response_model=Dict[str, Any])
+async def generate_pareto_front(
+    input_data: ScheduleInput,
+    front_size: int = Query(DEFAULT_FRONT_SIZE, ge=1, le=20, description="Maximum number of trade-off schedules to return"),
+    include_timings: bool = Query(False, description="Return per-phase timing spans and hot-path counters")
+):
+    """
+    Explore trade-offs in one GA run (NSGA-II) instead of re-running with different weights.
+
+    - **input_data**: Schedule input data
+    - **front_size**: Return at most this many non-dominated schedules (default: 5)
+    - **include_timings**: Add a `timings` block with per-phase spans and counters (default: False)
+
+    Returns `front`: schedules in the shape of /api/generate-schedule, each with an `objectives`
+    block (hard_penalty, preference_score, load_imbalance), best hard penalty first.
+    """
+    try:
+        logger.info(f"Generating Pareto front of up to {front_size} schedules")
+        return scheduler_service.generate_pareto_front(input_data, front_size, include_timings)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/repair-schedule", response_model=Dict[str, Any])
+async def repair_schedule(
+    repair: RepairInput,
+    max_radius: int = Query(DEFAULT_REPAIR_RADIUS, ge=0, le=20, description="How far, in timetable cells, a broken class may move"),
+    include_timings: bool = Query(False, description="Return per-phase timing spans and hot-path counters")
+):
+    """
+    Repair an existing schedule after an input change, moving only the classes that broke.
+
+    - **repair**: The original input, the existing schedule and the delta (changed faculty
+      availability, rooms taken offline, added breaks)
+    - **max_radius**: Broken classes move at most this many cells (days plus time slots) away (default: 2)
+    - **include_timings**: Add a `timings` block with per-phase spans and counters (default: False)
+
+    Returns the repaired schedule in the shape of /api/generate-schedule plus a `repair`
+    block with every moved class (before/after), and the classes that could not be re-placed.
+    """
+    try:
+        logger.info(f"Repairing schedule of {len(repair.schedule)} assignments with radius {max_radius}")
+        return scheduler_service.repair_schedule(repair.input_data, repair.schedule, repair.delta,
+                                                 max_radius, include_timings)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/validate-schedule", response_model=Dict[str, Any])
+async def validate_edited_schedule(validation: ScheduleValidationInput):
+    """
+    Check a (hand-edited) schedule against its input without solving anything.
+
+    - **validation**: The schedule input and the list of assignments to check
+
+    Returns `valid` plus every hard-constraint violation: faculty or room double
+    booking, break overlap, availability breach, unknown subject/faculty/room,
+    wrong duration and unmet weekly class counts. Each violation names the
+    indexes of the offending assignments. Invalid input data is rejected with 400.
+    """
+    try:
+        return validate_schedule(validation.input_data, validation.schedule)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/score-edits", response_model=Dict[str, Any])
+async def score_edits(what_if: WhatIfInput):
+    """
+    Score many candidate edits of a schedule at once, e.g. every target cell of a dragged class.
+
+    - **what_if**: The schedule input, the base schedule and the candidate moves/swaps
+
+    Returns, in candidate order, whether each edit is feasible, the hard violations
+    it would cause, and its change in penalty (violation count) and preference score
+    relative to the base schedule. Malformed candidates are rejected with 400.
+    """
+    try:
+        return score_candidates(what_if.input_data, what_if.schedule, what_if.candidates)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/api/suggest-alternatives", response_model=Dict[str, Any])
+async def suggest_alternative_slots(
+    request: SuggestionInput,
+    k: int = Query(DEFAULT_SUGGESTIONS, ge=1, le=100, description="Number of suggestions to return"),
+    include_swaps: bool = Query(True, description="Also suggest swapping cells with another class")
+):
+    """
+    The best feasible moves and swaps for one class of a schedule.
+
+    - **request**: The schedule input, the schedule and the index of the class to move
+    - **k**: How many suggestions to return (default: 10)
+    - **include_swaps**: Include pairwise swaps with classes of the same duration (default: True)
+
+    Moves may hand the class to another faculty member of the same subject. Suggestions are
+    ranked by preference gain, then by disruption (classes and faculty changed), then by how
+    far the class moves in time.
+    """
+    try:
+        return suggest_alternatives(request.input_data, request.schedule, request.assignment, k, include_swaps)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Internal server error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/api/schedule-history", response_model=List[Dict[str, Any]])
 async def get_schedule_history():
@@ -92,6 +454,65 @@ async def get_schedule_history():
         logger.error(f"Error retrieving schedule history: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@app.get("/api/schedule-history/diff", response_model=Dict[str, Any])
+async def diff_schedule_history(
+    base: int = Query(-2, description="History index of the earlier schedule (negative counts from the latest)"),
+    target: int = Query(-1, description="History index of the later schedule")
+):
+    """
+    What changed between two stored schedules: added, removed, moved and reassigned
+    classes, keyed on day/slot/room, plus per-faculty impact counts.
+    """
+    try:
+        return scheduler_service.diff_history(base, target)
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/api/schedule-history/diff", response_model=Dict[str, Any])
+async def diff_candidate_schedule(
+    candidate: List[ScheduleAssignment],
+    base: int = Query(-1, description="History index of the stored schedule to compare against")
+):
+    """
+    What a candidate schedule (e.g. an edited timetable) changes relative to a stored schedule.
+    """
+    try:
+        return scheduler_service.diff_history(base, candidate=[a.model_dump() for a in candidate])
+    except ValueError as e:
+        logger.error(f"Bad request: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/timings", response_model=Dict[str, Any])
+async def get_timings():
+    """
+    Histograms of per-phase solve times and counter totals since startup.
+    """
+    return TIMING_HISTOGRAMS.snapshot()
+
+@app.get("/api/profiles/{profile_id}")
+async def download_profile(profile_id: str, x_admin_token: Optional[str] = Header(None)):
+    """
+    Download a pstats dump captured with `profile=true`; load it locally with `pstats.Stats(path)`.
+    """
+    require_admin(x_admin_token)
+    from profiling import PROFILE_STORE
+    data = PROFILE_STORE.get(profile_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(
+        content=data,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="schedule-{profile_id}.pstats"'}
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Request, solve, cache and process metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(SCHEDULER_METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/api/schedule-table", response_class=HTMLResponse)
 async def get_schedule_table():
     """
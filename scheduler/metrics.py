@@ -0,0 +1,281 @@
+import os
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple
+from instrumentation import TIMING_HISTOGRAMS
+from utils import time_to_minutes, sweep_day_grid
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+LabelValues = Tuple[str, ...]
+
+# Request latency buckets (seconds), close to the Prometheus client defaults but
+# stretched to cover multi-second GA solves
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, float("inf"))
+FITNESS_BUCKETS = (0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0, float("inf"))
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for v in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+class _Metric:
+    """Base class for labelled metrics rendered in the Prometheus text format."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self.samples()
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                    for key, value in sorted(self._values.items())]
+
+class Gauge(_Metric):
+    """Value that can go up and down per label set."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        # An unlabelled gauge reports 0 before its first update
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                    for key, value in sorted(self._values.items())]
+
+class Histogram(_Metric):
+    """Bucketed observations per label set, with cumulative `le` buckets, `_sum` and `_count`."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets) if buckets[-1] == float("inf") else tuple(buckets) + (float("inf"),)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            counts[bisect_left(self.buckets, value)] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, counts in sorted(self._counts.items()):
+                running = 0
+                for bound, count in zip(self.buckets, counts):
+                    running += count
+                    labels = _format_labels(self.labelnames + ("le",), key + (_format_value(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {running}")
+                labels = _format_labels(self.labelnames, key)
+                lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+                lines.append(f"{self.name}_count{labels} {running}")
+        return lines
+
+class MetricsRegistry:
+    """Scheduler metrics exposed on /metrics, rendered without any client library."""
+
+    def __init__(self):
+        self.requests = Counter(
+            "scheduler_http_requests_total", "HTTP requests handled, by endpoint, engine and status.",
+            ("endpoint", "method", "engine", "status"))
+        self.request_latency = Histogram(
+            "scheduler_http_request_duration_seconds", "HTTP request latency, by endpoint and engine.",
+            ("endpoint", "engine"))
+        self.requests_in_flight = Gauge(
+            "scheduler_http_requests_in_flight", "Solve requests received and not yet answered.")
+        self.solves_in_flight = Gauge(
+            "scheduler_solves_in_flight", "Solves currently running.")
+        self.solves = Counter(
+            "scheduler_solves_total", "Finished solves (one per schedule or batch section), by engine.", ("engine",))
+        self.fitness = Histogram(
+            "scheduler_solve_fitness", "Final fitness of each solve, by engine.", ("engine",), buckets=FITNESS_BUCKETS)
+        self._caches: Dict[str, Callable] = {}
+
+    def register_cache(self, name: str, cached_function: Callable) -> None:
+        """Expose the hit/miss counts of a functools.lru_cache-wrapped function."""
+        self._caches[name] = cached_function
+
+    @contextmanager
+    def track_request(self) -> Iterator[None]:
+        """Count a solve request as in flight for the duration of the block."""
+        self.requests_in_flight.inc()
+        try:
+            yield
+        finally:
+            self.requests_in_flight.dec()
+
+    @contextmanager
+    def track_solve(self) -> Iterator[None]:
+        """Count a solve as running for the duration of the block."""
+        self.solves_in_flight.inc()
+        try:
+            yield
+        finally:
+            self.solves_in_flight.dec()
+
+    def record_solve(self, engine: str, fitness: float) -> None:
+        self.solves.inc(engine=engine)
+        self.fitness.observe(fitness, engine=engine)
+
+    def _queue_depth(self) -> List[str]:
+        # Solves run synchronously, so requests beyond the running solves are waiting their turn
+        depth = max(0, self.requests_in_flight.get() - self.solves_in_flight.get())
+        return [
+            "# HELP scheduler_queue_depth Solve requests waiting for a running solve to finish.",
+            "# TYPE scheduler_queue_depth gauge",
+            f"scheduler_queue_depth {_format_value(depth)}",
+        ]
+
+    def _cache_samples(self) -> List[str]:
+        hits, misses, ratios = [], [], []
+        for name, cached_function in sorted(self._caches.items()):
+            info = cached_function.cache_info()
+            labels = _format_labels(("cache",), (name,))
+            lookups = info.hits + info.misses
+            hits.append(f"scheduler_cache_hits_total{labels} {info.hits}")
+            misses.append(f"scheduler_cache_misses_total{labels} {info.misses}")
+            ratios.append(f"scheduler_cache_hit_ratio{labels} {_format_value(info.hits / lookups if lookups else 0)}")
+        return (
+            ["# HELP scheduler_cache_hits_total Cache lookups answered from the cache.",
+             "# TYPE scheduler_cache_hits_total counter"] + hits +
+            ["# HELP scheduler_cache_misses_total Cache lookups that had to compute the value.",
+             "# TYPE scheduler_cache_misses_total counter"] + misses +
+            ["# HELP scheduler_cache_hit_ratio Share of cache lookups answered from the cache.",
+             "# TYPE scheduler_cache_hit_ratio gauge"] + ratios
+        )
+
+    def _solver_samples(self) -> List[str]:
+        snapshot = TIMING_HISTOGRAMS.snapshot()
+        lines = [
+            "# HELP scheduler_ga_generations_total GA generations run across all solves.",
+            "# TYPE scheduler_ga_generations_total counter",
+            f"scheduler_ga_generations_total {snapshot['counters'].get('ga_generations', 0)}",
+            "# HELP scheduler_solver_events_total Hot-path solver counters (conflict checks, evaluations, ...).",
+            "# TYPE scheduler_solver_events_total counter",
+        ]
+        for name, total in sorted(snapshot["counters"].items()):
+            lines.append(f"scheduler_solver_events_total{_format_labels(('event',), (name,))} {total}")
+
+        lines += [
+            "# HELP scheduler_phase_duration_seconds Time spent in each solve phase.",
+            "# TYPE scheduler_phase_duration_seconds histogram",
+        ]
+        for phase, histogram in sorted(snapshot["spans"].items()):
+            for bucket in histogram["buckets_ms"]:
+                bound = bucket["le"] if bucket["le"] == "+Inf" else _format_value(bucket["le"] / 1000)
+                labels = _format_labels(("phase", "le"), (phase, bound))
+                lines.append(f"scheduler_phase_duration_seconds_bucket{labels} {bucket['count']}")
+            labels = _format_labels(("phase",), (phase,))
+            lines.append(f"scheduler_phase_duration_seconds_sum{labels} {_format_value(histogram['sum_ms'] / 1000)}")
+            lines.append(f"scheduler_phase_duration_seconds_count{labels} {histogram['count']}")
+        return lines
+
+    def _process_samples(self) -> List[str]:
+        lines = []
+        rss = _resident_memory_bytes()
+        if rss is not None:
+            lines += [
+                "# HELP process_resident_memory_bytes Resident memory size in bytes.",
+                "# TYPE process_resident_memory_bytes gauge",
+                f"process_resident_memory_bytes {rss}",
+            ]
+        if resource is not None:
+            # ru_maxrss is in kilobytes on Linux
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+            lines += [
+                "# HELP process_peak_resident_memory_bytes Peak resident memory size in bytes.",
+                "# TYPE process_peak_resident_memory_bytes gauge",
+                f"process_peak_resident_memory_bytes {peak}",
+            ]
+        return lines
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in (self.requests, self.request_latency, self.requests_in_flight,
+                       self.solves_in_flight, self.solves, self.fitness):
+            lines += metric.render()
+        lines += self._queue_depth()
+        lines += self._cache_samples()
+        lines += self._solver_samples()
+        lines += self._process_samples()
+        return "\n".join(lines) + "\n"
+
+def _resident_memory_bytes():
+    """Current RSS from /proc, or None where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+# Shared by the API and every SchedulerService in the process
+SCHEDULER_METRICS = MetricsRegistry()
+SCHEDULER_METRICS.register_cache("time_to_minutes", time_to_minutes)
+SCHEDULER_METRICS.register_cache("slot_grid", sweep_day_grid)
@@ -57,6 +57,12 @@ class CollegeTime:
     startTime: str  # e.g., "09:30" (24-hour format)
     endTime: str  # e.g., "14:50" (24-hour format)
 
+# Subject name of the solver's filler cells (virtual faculty "VF<n>") that keep every room fully used
+PLACEHOLDER_SUBJECT = "Available Slot"
+
+# Schedules returned by the NSGA-II mode unless the caller asks for more or fewer
+DEFAULT_FRONT_SIZE = 5
+
 @dataclass
 class ScheduleAssignment:
     subject_name: str
@@ -83,9 +89,90 @@ class ScheduleAssignment:
             "priority_score": self.priority_score
         }
 
+@dataclass
+class SoftConstraints:
+    max_periods_per_day: Optional[int] = None  # Classes per faculty member per day
+    max_consecutive_periods: Optional[int] = None  # Back-to-back classes per faculty member
+    minimize_gaps: bool = False  # Penalise idle time between a faculty member's classes
+    spread_subjects: bool = False  # Penalise a subject having two classes on the same day
+    weight: int = 10  # Penalty per unit: extra period, idle 50 minutes, repeated subject day
+
 @dataclass
 class ScheduleInput:
     subjects: List[Subject]
     break_: List[Break]
     college_time: CollegeTime
     rooms: List[str]
+    soft_constraints: Optional[SoftConstraints] = None  # None: no soft-constraint penalties
+
+@dataclass
+class SectionInput:
+    section_id: str  # e.g., "CSE-3A"
+    schedule_input: ScheduleInput
+
+@dataclass
+class BatchScheduleInput:
+    sections: List[SectionInput]
+    faculty: List[Faculty] = None  # Shared faculty pool; overrides section faculty with the same id
+
+    def __post_init__(self):
+        if self.faculty is None:
+            self.faculty = []
+
+@dataclass
+class FacultyAvailabilityChange:
+    faculty_id: str
+    availability: List[TimeSlot]  # Replaces every definition of this faculty member's availability
+
+@dataclass
+class ScheduleDelta:
+    faculty_availability: List[FacultyAvailabilityChange] = None
+    rooms_offline: List[str] = None  # Rooms that can no longer be used
+    breaks_added: List[Break] = None
+
+    def __post_init__(self):
+        if self.faculty_availability is None:
+            self.faculty_availability = []
+        if self.rooms_offline is None:
+            self.rooms_offline = []
+        if self.breaks_added is None:
+            self.breaks_added = []
+
+@dataclass
+class RepairInput:
+    input_data: ScheduleInput  # The input the existing schedule was generated from
+    schedule: List[ScheduleAssignment]  # The existing schedule, e.g. "schedule" of a history entry
+    delta: ScheduleDelta = None
+
+    def __post_init__(self):
+        if self.delta is None:
+            self.delta = ScheduleDelta()
+
+@dataclass
+class ScheduleValidationInput:
+    input_data: ScheduleInput
+    schedule: List[ScheduleAssignment]  # The (possibly hand-edited) schedule to check
+
+@dataclass
+class CandidateEdit:
+    kind: str  # "move" or "swap"
+    assignment: int  # Index of the edited assignment in the schedule
+    other: int = None  # swap: index of the assignment to exchange cells with
+    # move: the new position; fields left out keep their current value
+    day: str = None
+    startTime: str = None
+    endTime: str = None
+    room_id: str = None
+    faculty_id: str = None
+
+@dataclass
+class WhatIfInput:
+    input_data: ScheduleInput
+    schedule: List[ScheduleAssignment]  # The base schedule the candidates edit
+    candidates: List[CandidateEdit]
+
+@dataclass
+class SuggestionInput:
+    input_data: ScheduleInput
+    schedule: List[ScheduleAssignment]
+    assignment: int  # Index of the class to find alternatives for
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable
+from model import ScheduleInput, TimeSlot, Faculty, PreferredSlot
+from intervals import IntervalSet, Window
+from indexes import Block, ConsecutiveBlockIndex
+from utils import VALID_DAYS, time_to_minutes, build_break_index, BreakIndex
+
+_NO_WINDOWS = IntervalSet()
+
+def _parse(value: str, path: str) -> int:
+    """Parse one time field, naming the offending field on failure."""
+    try:
+        return time_to_minutes(value)
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError(f"Invalid time format in {path}: {value!r}. Expected HH:MM or HH:MM AM/PM")
+
+def _parse_preferences(preferences: List[PreferredSlot], path: str) -> None:
+    """Check the start and end of each preferred slot under path."""
+    for p_idx, pref in enumerate(preferences):
+        _parse(pref.startTime, f"{path}.preferred_slots[{p_idx}].startTime")
+        _parse(pref.endTime, f"{path}.preferred_slots[{p_idx}].endTime")
+
+def slot_minutes(slot: TimeSlot) -> Window:
+    """(start, end) minutes of a grid slot; grid labels repeat, so this is a cache lookup after the first call."""
+    return time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+
+@dataclass
+class NormalizedProblem:
+    """A ScheduleInput with every time parsed once into integer minutes.
+
+    Engines query faculty availability and breaks through this object instead
+    of re-parsing the input strings for every candidate slot.
+    """
+    college_start: int
+    college_end: int
+    breaks: BreakIndex  # day -> merged break windows, ALL_DAYS expanded
+    availability: Dict[str, Dict[str, IntervalSet]]  # faculty_id -> day -> merged windows
+    faculty: Dict[str, Faculty] = field(default_factory=dict)  # first definition of each faculty id
+
+    def is_available(self, faculty_id: str, day: str, start: int, end: int) -> bool:
+        """Whether the faculty's (merged) availability covers [start, end) on the day."""
+        return self.availability.get(faculty_id, {}).get(day, _NO_WINDOWS).contains(start, end)
+
+    def overlaps_break(self, day: str, start: int, end: int) -> bool:
+        """Whether [start, end) overlaps any break on the day (including ALL_DAYS breaks)."""
+        return self.breaks.get(day, _NO_WINDOWS).overlaps(start, end)
+
+    def valid_slots(self, faculty_id: str, slots: Iterable[TimeSlot], duration: int) -> List[TimeSlot]:
+        """Slots of the given duration that fall inside the faculty's availability."""
+        valid = []
+        for slot in slots:
+            start, end = slot_minutes(slot)
+            if end - start == duration and self.is_available(faculty_id, slot.day, start, end):
+                valid.append(slot)
+        return valid
+
+    def valid_blocks(self, faculty_id: str, blocks: ConsecutiveBlockIndex, length: int) -> List[Block]:
+        """Blocks of consecutive periods lasting length minutes inside the faculty's availability, by day."""
+        valid = []
+        for day in VALID_DAYS:
+            for mask, span in blocks.blocks(day, length):
+                if self.is_available(faculty_id, day, *slot_minutes(span)):
+                    valid.append((mask, span))
+        return valid
+
+def normalize_input(input_data: ScheduleInput) -> NormalizedProblem:
+    """Validate a ScheduleInput and parse all of its times in a single pass.
+
+    Errors name the exact field, e.g.
+    "Invalid time format in subjects[0].faculty[1].availability[2].startTime: '9.30'".
+    Preferred slots are checked the same way, e.g. subjects[1].preferred_slots[0].endTime.
+    """
+    college_start = _parse(input_data.college_time.startTime, "college_time.startTime")
+    college_end = _parse(input_data.college_time.endTime, "college_time.endTime")
+
+    for i, b in enumerate(input_data.break_):
+        if b.day not in VALID_DAYS and b.day != "ALL_DAYS":
+            raise ValueError(f"Invalid day in break_[{i}].day: {b.day}. Must be one of {VALID_DAYS} or ALL_DAYS")
+        _parse(b.startTime, f"break_[{i}].startTime")
+        _parse(b.endTime, f"break_[{i}].endTime")
+    # Every field parsed above, so building the index only hits the parse cache
+    breaks = build_break_index(input_data.break_)
+
+    faculty: Dict[str, Faculty] = {}
+    availability: Dict[str, Dict[str, IntervalSet]] = {}
+    for s_idx, subject in enumerate(input_data.subjects):
+        # Preference scoring reads these times later; parsed here they only hit the parse cache there
+        _parse_preferences(subject.preferred_slots, f"subjects[{s_idx}]")
+        for f_idx, member in enumerate(subject.faculty):
+            path = f"subjects[{s_idx}].faculty[{f_idx}]"
+            _parse_preferences(member.preferred_slots, path)
+            windows_by_day: Dict[str, List[Window]] = {}
+            for a_idx, avail in enumerate(member.availability):
+                window = (_parse(avail.startTime, f"{path}.availability[{a_idx}].startTime"),
+                          _parse(avail.endTime, f"{path}.availability[{a_idx}].endTime"))
+                windows_by_day.setdefault(avail.day, []).append(window)
+            if member.id not in faculty:
+                faculty[member.id] = member
+                # Overlapping or adjacent windows (one per drag in the frontend) merge into one
+                availability[member.id] = {day: IntervalSet(windows) for day, windows in windows_by_day.items()}
+    return NormalizedProblem(
+        college_start=college_start,
+        college_end=college_end,
+        breaks=breaks,
+        availability=availability,
+        faculty=faculty,
+    )
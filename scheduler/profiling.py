@@ -0,0 +1,101 @@
+import cProfile
+import marshal
+import pstats
+import threading
+import tracemalloc
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Number of pstats dumps kept for download; older ones are dropped first
+MAX_STORED_PROFILES = 20
+
+def _cumulative_rows(profiler: cProfile.Profile, top_n: int) -> List[Dict[str, Any]]:
+    """Top-N functions by cumulative time, like `pstats.print_stats` sorted by cumulative."""
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    rows = []
+    for func in stats.fcn_list[:top_n]:
+        primitive_calls, total_calls, total_time, cumulative_time, _ = stats.stats[func]
+        filename, lineno, name = func
+        rows.append({
+            "function": f"{filename}:{lineno}({name})",
+            "ncalls": total_calls,
+            "primitive_calls": primitive_calls,
+            "tottime_ms": round(total_time * 1000, 3),
+            "cumtime_ms": round(cumulative_time * 1000, 3),
+        })
+    return rows
+
+def _allocation_rows(snapshot: tracemalloc.Snapshot, top_n: int) -> List[Dict[str, Any]]:
+    """Top-N allocation sites by size still allocated at the end of the call."""
+    rows = []
+    for stat in snapshot.statistics("lineno")[:top_n]:
+        frame = stat.traceback[0]
+        rows.append({
+            "site": f"{frame.filename}:{frame.lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        })
+    return rows
+
+class ProfileStore:
+    """Bounded in-memory store of pstats dumps, downloadable by id."""
+
+    def __init__(self, max_profiles: int = MAX_STORED_PROFILES):
+        self.max_profiles = max_profiles
+        self._lock = threading.Lock()
+        self._profiles: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def add(self, data: bytes) -> str:
+        profile_id = uuid.uuid4().hex
+        with self._lock:
+            self._profiles[profile_id] = data
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[bytes]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+def profile_call(func: Callable, *args, top_n: int = 25, trace_memory: bool = False,
+                 store: Optional[ProfileStore] = None, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+    """Run func under cProfile (and optionally tracemalloc) and return (result, profile report).
+
+    The report holds the top-N functions by cumulative time and, with
+    trace_memory, the top-N allocation sites and peak traced memory. With a
+    store, the raw pstats dump is kept and its id is returned as "pstats_id"
+    so it can be loaded with `pstats.Stats` locally.
+    """
+    if top_n < 1:
+        raise ValueError("top_n must be at least 1")
+
+    # Leave tracemalloc running if someone else (e.g. the benchmark) started it
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func, *args, **kwargs)
+        snapshot = tracemalloc.take_snapshot() if trace_memory else None
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    report: Dict[str, Any] = {"cumulative": _cumulative_rows(profiler, top_n)}
+    if snapshot is not None:
+        report["allocations"] = _allocation_rows(snapshot, top_n)
+        report["peak_traced_kb"] = round(peak / 1024, 1)
+    if store is not None:
+        profiler.create_stats()
+        # Same format `pstats.Stats.dump_stats` writes
+        report["pstats_id"] = store.add(marshal.dumps(profiler.stats))
+    return result, report
+
+# Dumps served by /api/profiles/{profile_id}
+PROFILE_STORE = ProfileStore()
@@ -0,0 +1,75 @@
+import dataclasses
+import json
+import os
+import random
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+from model import ScheduleInput
+
+def anonymise_input(input_data: ScheduleInput) -> Dict[str, Any]:
+    """ScheduleInput as a dict with faculty, subjects and rooms replaced by stable pseudonyms.
+
+    Pseudonyms are assigned in order of first appearance, so the same faculty
+    member keeps one id across subjects and the replayed instance has exactly
+    the shape of the original. Times, days, durations and counts are kept.
+    """
+    data = dataclasses.asdict(input_data)
+    faculty_ids: Dict[str, str] = {}
+    subject_names: Dict[str, str] = {}
+    room_ids = {room: f"R{i + 1}" for i, room in enumerate(dict.fromkeys(data["rooms"]))}
+
+    for subject in data["subjects"]:
+        subject["name"] = subject_names.setdefault(subject["name"], f"S{len(subject_names) + 1}")
+        for faculty in subject["faculty"]:
+            pseudonym = faculty_ids.setdefault(faculty["id"], f"F{len(faculty_ids) + 1}")
+            faculty["id"] = pseudonym
+            faculty["name"] = f"Faculty {pseudonym}"
+    data["rooms"] = [room_ids[room] for room in data["rooms"]]
+    return data
+
+class TraceRecorder:
+    """Appends anonymised schedule requests and their outcome to a JSON-lines trace file."""
+
+    def __init__(self, path: str, sample_rate: float = 1.0):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        self.path = path
+        self.sample_rate = sample_rate
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["TraceRecorder"]:
+        """Recorder configured by SCHEDULER_TRACE_FILE / SCHEDULER_TRACE_SAMPLE_RATE, or None when disabled."""
+        path = os.environ.get("SCHEDULER_TRACE_FILE")
+        if not path:
+            return None
+        return cls(path, float(os.environ.get("SCHEDULER_TRACE_SAMPLE_RATE", "1")))
+
+    def should_record(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def record(self, input_data: ScheduleInput, engine: str, parallel_days: bool, seed: int,
+               elapsed_seconds: float, result: Dict[str, Any], timings: Dict[str, Any] = None) -> None:
+        """Append one request, its engine parameters and seed, and the resulting latency and fitness."""
+        entry = {
+            "recorded_at": datetime.now().isoformat(),
+            "engine": engine,
+            "parallel_days": parallel_days,
+            "seed": seed,
+            "elapsed_ms": round(elapsed_seconds * 1000, 3),
+            "fitness": result["fitness"],
+            "total_assignments": result["total_assignments"],
+            "timings": timings,
+            "input": anonymise_input(input_data),
+        }
+        line = json.dumps(entry, sort_keys=True)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+def read_trace(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of a trace file, skipping blank lines."""
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,57 @@
+import copy
+from bisect import bisect_left
+from typing import List, Tuple
+from model import ScheduleInput, ScheduleDelta, ScheduleAssignment, TimeSlot
+from utils import VALID_DAYS, time_to_minutes
+
+# Default neighbourhood searched around a broken assignment, in timetable cells
+DEFAULT_REPAIR_RADIUS = 2
+
+def apply_delta(input_data: ScheduleInput, delta: ScheduleDelta) -> ScheduleInput:
+    """A copy of input_data with the delta applied; the original input is left untouched."""
+    updated = copy.deepcopy(input_data)
+    known_faculty = {faculty.id for subject in updated.subjects for faculty in subject.faculty}
+
+    for i, change in enumerate(delta.faculty_availability):
+        if change.faculty_id not in known_faculty:
+            raise ValueError(f"Unknown faculty id in delta.faculty_availability[{i}].faculty_id: {change.faculty_id}")
+    new_availability = {change.faculty_id: change.availability for change in delta.faculty_availability}
+    for subject in updated.subjects:
+        for faculty in subject.faculty:
+            if faculty.id in new_availability:
+                faculty.availability = copy.deepcopy(new_availability[faculty.id])
+
+    for i, room in enumerate(delta.rooms_offline):
+        if room not in updated.rooms:
+            raise ValueError(f"Unknown room in delta.rooms_offline[{i}]: {room}")
+    offline = set(delta.rooms_offline)
+    updated.rooms = [room for room in updated.rooms if room not in offline]
+
+    updated.break_ = updated.break_ + copy.deepcopy(delta.breaks_added)
+    return updated
+
+def repair_neighbourhood(assignment: ScheduleAssignment, grid_slots: List[TimeSlot], time_slot_labels: List[str],
+                         duration: int, max_radius: int) -> List[Tuple[int, TimeSlot]]:
+    """Slots of the given duration within max_radius of the assignment, closest first.
+
+    grid_slots are grid periods, or the spans of consecutive-period blocks
+    when a block is re-placed as one class.
+
+    Distance is counted in timetable cells: one per day moved plus one per
+    time-slot column moved, so 0 is the assignment's own slot.
+    """
+    column_starts = [time_to_minutes(label.split('-')[0]) for label in time_slot_labels]
+    origin_day = VALID_DAYS.index(assignment.day)
+    origin_column = bisect_left(column_starts, time_to_minutes(assignment.startTime))
+
+    candidates = []
+    for slot in grid_slots:
+        start, end = time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+        if end - start != duration:
+            continue
+        day = VALID_DAYS.index(slot.day)
+        distance = abs(day - origin_day) + abs(bisect_left(column_starts, start) - origin_column)
+        if distance <= max_radius:
+            candidates.append((distance, day, start, slot))
+    candidates.sort(key=lambda c: c[:3])
+    return [(distance, slot) for distance, _, _, slot in candidates]
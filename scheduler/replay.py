@@ -0,0 +1,101 @@
+"""Replay recorded schedule requests against the current SchedulerService.
+
+Usage:
+    SCHEDULER_TRACE_FILE=trace.jsonl uvicorn main:app      # record
+    python replay.py trace.jsonl --output replay.json       # replay
+
+Each entry is solved again with its recorded engine parameters and seed, and
+the report lists latency and fitness deltas against the recording. With
+--max-fitness-drop the exit status is 1 when any entry got worse by more than
+the given amount, so the replay can gate a CI job.
+"""
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+
+from model import ScheduleInput
+from recording import read_trace
+from scheduler import SchedulerService
+
+_SCHEDULE_INPUT = TypeAdapter(ScheduleInput)
+
+def replay_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Solve one recorded request again and compare it with the recording."""
+    input_data = _SCHEDULE_INPUT.validate_python(entry["input"])
+    random.seed(entry["seed"])
+    started = time.perf_counter()
+    result = SchedulerService().generate_schedule(
+        input_data, use_ga=entry["engine"] == "ga", parallel_days=entry["parallel_days"])
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "recorded_at": entry["recorded_at"],
+        "engine": entry["engine"],
+        "subjects": len(input_data.subjects),
+        "rooms": len(input_data.rooms),
+        "recorded_ms": entry["elapsed_ms"],
+        "replayed_ms": round(elapsed_ms, 3),
+        "latency_ratio": round(elapsed_ms / entry["elapsed_ms"], 3) if entry["elapsed_ms"] else None,
+        "recorded_fitness": entry["fitness"],
+        "replayed_fitness": result["fitness"],
+        "fitness_delta": round(result["fitness"] - entry["fitness"], 6),
+    }
+
+def replay_trace(path: str, limit: int = None) -> Dict[str, Any]:
+    """Replay every entry of a trace file (or the first `limit`) and summarise the deltas."""
+    rows = []
+    for entry in read_trace(path):
+        if limit is not None and len(rows) >= limit:
+            break
+        rows.append(replay_entry(entry))
+
+    ratios = [row["latency_ratio"] for row in rows if row["latency_ratio"] is not None]
+    deltas = [row["fitness_delta"] for row in rows]
+    summary = {
+        "entries": len(rows),
+        "median_latency_ratio": round(statistics.median(ratios), 3) if ratios else None,
+        "max_latency_ratio": max(ratios) if ratios else None,
+        "mean_fitness_delta": round(statistics.mean(deltas), 6) if deltas else None,
+        "worst_fitness_delta": min(deltas) if deltas else None,
+        "fitness_regressions": sum(1 for delta in deltas if delta < 0),
+    }
+    return {"summary": summary, "results": rows}
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded request trace against the current scheduler")
+    parser.add_argument("trace", help="JSON-lines trace written with SCHEDULER_TRACE_FILE")
+    parser.add_argument("--limit", type=int, default=None, help="Replay only the first N entries")
+    parser.add_argument("--output", default=None, help="Where to write the JSON report")
+    parser.add_argument("--max-fitness-drop", type=float, default=None,
+                        help="Exit with status 1 if any entry's fitness drops by more than this")
+    args = parser.parse_args(argv)
+
+    # Solver logging would dominate the measurements
+    logging.disable(logging.INFO)
+
+    report = replay_trace(args.trace, args.limit)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    for row in report["results"]:
+        print(f"{row['engine']:>6} subjects={row['subjects']:<3} {row['recorded_ms']:>10.1f}ms -> "
+              f"{row['replayed_ms']:>10.1f}ms  fitness {row['recorded_fitness']:.3f} -> {row['replayed_fitness']:.3f}")
+    summary = report["summary"]
+    print(f"{summary['entries']} entries, median latency ratio {summary['median_latency_ratio']}, "
+          f"{summary['fitness_regressions']} fitness regressions")
+
+    if args.max_fitness_drop is not None and summary["worst_fitness_delta"] is not None \
+            and -summary["worst_fitness_delta"] > args.max_fitness_drop:
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, List, Tuple
+from model import PLACEHOLDER_SUBJECT
+from utils import VALID_DAYS, time_to_minutes
+
+Cell = Tuple[str, str, str, str]  # (day, startTime, endTime, room_id)
+
+def _cell(assignment: Dict[str, Any]) -> Cell:
+    return (assignment["day"], assignment["startTime"], assignment["endTime"], assignment["room_id"])
+
+def _position(assignment: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: assignment[key] for key in ("day", "startTime", "endTime", "room_id", "faculty_id")}
+
+def _order(assignment: Dict[str, Any]) -> Tuple[int, int, str]:
+    day = VALID_DAYS.index(assignment["day"]) if assignment["day"] in VALID_DAYS else len(VALID_DAYS)
+    return day, time_to_minutes(assignment["startTime"]), assignment["room_id"]
+
+def diff_schedules(before: List[Dict[str, Any]], after: List[Dict[str, Any]],
+                   include_placeholders: bool = False) -> Dict[str, Any]:
+    """What changed between two schedules (lists of assignment dicts, as stored in schedule history).
+
+    Classes are matched on their cell (day, slot, room) first: the same
+    subject in the same cell is unchanged, or "reassigned" when the faculty
+    differs. Classes that left a cell are then paired with classes of the
+    same subject that appeared in another cell, same faculty first, and
+    reported as "moved"; the rest are "removed" or "added". Candidates are
+    kept in per-(subject, faculty) and per-subject queues, so each class is
+    matched with a hash lookup and a popleft, and a diff costs one sort
+    plus linear work in the size of the schedules.
+    Placeholder cells are left out unless include_placeholders is set.
+    """
+    def real(schedule):
+        return [a for a in schedule if include_placeholders or a["subject_name"] != PLACEHOLDER_SUBJECT]
+
+    before_cells: Dict[Cell, List[Dict[str, Any]]] = defaultdict(list)
+    after_cells: Dict[Cell, List[Dict[str, Any]]] = defaultdict(list)
+    for assignment in real(before):
+        before_cells[_cell(assignment)].append(assignment)
+    for assignment in real(after):
+        after_cells[_cell(assignment)].append(assignment)
+
+    unchanged = 0
+    reassigned, left, arrived = [], [], []
+    for cell in before_cells.keys() | after_cells.keys():
+        old, new = before_cells.get(cell, []), after_cells.get(cell, [])
+        # Same subject and faculty first, then same subject with another faculty member
+        new_by_class: Dict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+        for i, b in enumerate(new):
+            new_by_class[(b["subject_name"], b["faculty_id"])].append(i)
+        matched, unmatched_old = set(), []
+        for a in old:
+            candidates = new_by_class.get((a["subject_name"], a["faculty_id"]))
+            if candidates:
+                matched.add(candidates.popleft())
+                unchanged += 1
+            else:
+                unmatched_old.append(a)
+        new_by_subject: Dict[str, Deque[int]] = defaultdict(deque)
+        for i, b in enumerate(new):
+            if i not in matched:
+                new_by_subject[b["subject_name"]].append(i)
+        for a in unmatched_old:
+            candidates = new_by_subject.get(a["subject_name"])
+            if not candidates:
+                left.append(a)
+                continue
+            match = new[candidates.popleft()]
+            reassigned.append({"subject_name": a["subject_name"], "day": cell[0], "startTime": cell[1],
+                               "endTime": cell[2], "room_id": cell[3],
+                               "from_faculty": a["faculty_id"], "to_faculty": match["faculty_id"]})
+        arrived.extend(new[i] for i in sorted(i for candidates in new_by_subject.values() for i in candidates))
+
+    # Pair classes that left a cell with classes of the same subject that arrived elsewhere, same faculty first
+    by_class: Dict[Tuple[str, str], Deque[int]] = defaultdict(deque)
+    arrived.sort(key=_order)
+    for i, b in enumerate(arrived):
+        by_class[(b["subject_name"], b["faculty_id"])].append(i)
+    moved, taken, still_left = [], set(), []
+    for a in sorted(left, key=_order):
+        candidates = by_class.get((a["subject_name"], a["faculty_id"]))
+        if candidates:
+            i = candidates.popleft()
+            taken.add(i)
+            moved.append({"subject_name": a["subject_name"], "from": _position(a), "to": _position(arrived[i])})
+        else:
+            still_left.append(a)
+    by_subject: Dict[str, Deque[int]] = defaultdict(deque)
+    for i, b in enumerate(arrived):
+        candidates = by_subject[b["subject_name"]]
+        if i not in taken:
+            candidates.append(i)
+    left = []
+    for a in still_left:
+        candidates = by_subject.get(a["subject_name"])
+        if candidates:
+            moved.append({"subject_name": a["subject_name"], "from": _position(a), "to": _position(arrived[candidates.popleft()])})
+        else:
+            left.append(a)
+    removed = sorted(left, key=_order)
+    added = sorted((arrived[i] for candidates in by_subject.values() for i in candidates), key=_order)
+    reassigned.sort(key=_order)
+    moved.sort(key=lambda m: _order(m["from"]))
+
+    impact: Dict[str, Dict[str, int]] = defaultdict(lambda: {"added": 0, "removed": 0, "moved": 0, "gained": 0, "lost": 0})
+    for a in added:
+        impact[a["faculty_id"]]["added"] += 1
+    for a in removed:
+        impact[a["faculty_id"]]["removed"] += 1
+    for m in moved:
+        if m["from"]["faculty_id"] == m["to"]["faculty_id"]:
+            impact[m["from"]["faculty_id"]]["moved"] += 1
+        else:
+            impact[m["from"]["faculty_id"]]["lost"] += 1
+            impact[m["to"]["faculty_id"]]["gained"] += 1
+    for r in reassigned:
+        impact[r["from_faculty"]]["lost"] += 1
+        impact[r["to_faculty"]]["gained"] += 1
+
+    return {
+        "summary": {"unchanged": unchanged, "added": len(added), "removed": len(removed),
+                    "moved": len(moved), "reassigned": len(reassigned)},
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+        "reassigned": reassigned,
+        "faculty_impact": {faculty_id: impact[faculty_id] for faculty_id in sorted(impact)},
+    }
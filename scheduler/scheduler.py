@@ -1,15 +1,24 @@
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterator
 from collections import defaultdict
-from model import ScheduleInput, ScheduleAssignment, TimeSlot, Break, Subject, Faculty
+from model import ScheduleInput, ScheduleAssignment, TimeSlot, Break, Subject, Faculty, BatchScheduleInput, SectionInput, ScheduleDelta, PLACEHOLDER_SUBJECT, DEFAULT_FRONT_SIZE
+from indexes import RoomSlotIndex, ConsecutiveBlockIndex
+from problem import NormalizedProblem, normalize_input, slot_minutes
+from decomposition import find_independent_components
+from validation import contiguous_runs, split_blocks
+from repair import apply_delta, repair_neighbourhood, DEFAULT_REPAIR_RADIUS
+from schedule_diff import diff_schedules
+from soft_constraints import LoadTracker
+from feasibility import analyze_feasibility, InfeasibleScheduleError
+from explanations import explain_unassigned
+from instrumentation import SolveTimings, DetailLog, TIMING_HISTOGRAMS
+from metrics import SCHEDULER_METRICS
 from utils import check_time_conflict, check_break_conflict, time_to_minutes, minutes_to_time, VALID_DAYS, generate_time_slots, generate_weekly_time_slots, calculate_preference_score
+import dataclasses
 import random
 from datetime import datetime
 import logging
 import copy
-import tabulate
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class ConstraintChecker:
@@ -19,6 +28,8 @@ class ConstraintChecker:
     def sort_subjects_by_constraints(self, subjects: List) -> List:
         """Sort subjects by scheduling difficulty and special class priority."""
         def sort_key(s):
+            # Consecutive-period blocks need whole free runs, so they go before anything fragments the day
+            block_priority = 0 if s.requires_consecutive else 1
             # Special classes get higher priority (lower sort value)
             special_priority = 0 if s.is_special else 1
             # Fewer faculty = harder to schedule
@@ -28,7 +39,7 @@ class ConstraintChecker:
             # Longer duration = harder to fit
             duration_constraint = s.time / 50  # Normalize to 50-minute periods
             
-            return (special_priority, faculty_constraint, class_priority, duration_constraint)
+            return (block_priority, special_priority, faculty_constraint, class_priority, duration_constraint)
         
         return sorted(subjects, key=sort_key)
 
@@ -76,6 +87,11 @@ class SchedulerService:
         self.faculty_schedule: Dict[str, Dict[str, List[TimeSlot]]] = {}  # faculty_id -> day -> slots
         self.room_schedule: Dict[str, Dict[str, List[TimeSlot]]] = {}     # room_id -> day -> slots
         self.subject_counts: Dict[str, int] = {}  # subject_name -> count
+        self.room_index: Optional[RoomSlotIndex] = None  # free rooms per grid slot for the current solve
+        self.block_index: Optional[ConsecutiveBlockIndex] = None  # runs of adjacent grid periods for the current solve
+        self.load_tracker: Optional[LoadTracker] = None  # soft-constraint counters, when the input configures any
+        self.problem: Optional[NormalizedProblem] = None  # parsed times of the current solve's input
+        self.timings = SolveTimings()  # spans and counters for the current solve
 
     def _validate_time(self, time_str: str, field: str) -> None:
         """Validate a time string format."""
@@ -84,20 +100,9 @@ class SchedulerService:
         except ValueError as e:
             raise ValueError(f"Invalid time format in {field}: {time_str}, error: {e}")
 
-    def _validate_input(self, input_data: ScheduleInput) -> None:
-        """Validate all time fields in input data."""
-        for subject in input_data.subjects:
-            for faculty in subject.faculty:
-                for avail in faculty.availability:
-                    self._validate_time(avail.startTime, f"faculty {faculty.id} availability startTime")
-                    self._validate_time(avail.endTime, f"faculty {faculty.id} availability endTime")
-        for b in input_data.break_:
-            self._validate_time(b.startTime, "break startTime")
-            self._validate_time(b.endTime, "break endTime")
-            if b.day not in VALID_DAYS and b.day != "ALL_DAYS":
-                raise ValueError(f"Invalid day in break: {b.day}. Must be one of {VALID_DAYS} or ALL_DAYS")
-        self._validate_time(input_data.college_time.startTime, "college_time startTime")
-        self._validate_time(input_data.college_time.endTime, "college_time endTime")
+    def _validate_input(self, input_data: ScheduleInput) -> NormalizedProblem:
+        """Validate all time fields in input data and return them parsed into minutes."""
+        return normalize_input(input_data)
 
     def _initialize_schedules(self, input_data: ScheduleInput):
         """Initialize faculty and room schedules."""
@@ -117,6 +122,7 @@ class SchedulerService:
 
     def _is_slot_available(self, faculty_id: str, room_id: str, time_slot: TimeSlot) -> bool:
         """Check if a slot is available for both faculty and room."""
+        self.timings.count("conflict_checks")
         # Check faculty availability
         if faculty_id in self.faculty_schedule:
             for existing_slot in self.faculty_schedule[faculty_id][time_slot.day]:
@@ -140,46 +146,25 @@ class SchedulerService:
         
         self.faculty_schedule[faculty_id][time_slot.day].append(time_slot)
         self.room_schedule[room_id][time_slot.day].append(time_slot)
+        if self.room_index is not None:
+            self.room_index.book(room_id, time_slot)
 
     def _is_valid_assignment(self, faculty_id: str, time_slot: TimeSlot, room_id: str, input_data: ScheduleInput) -> bool:
         """Enhanced validity check with better conflict detection."""
+        slot_start, slot_end = slot_minutes(time_slot)
         # Check for break conflicts (including ALL_DAYS)
-        if check_break_conflict(time_slot, input_data.break_):
+        if self.problem.overlaps_break(time_slot.day, slot_start, slot_end):
             return False
         
-        # Check faculty availability window
-        faculty = None
-        for subject in input_data.subjects:
-            for f in subject.faculty:
-                if f.id == faculty_id:
-                    faculty = f
-                    break
-            if faculty:
-                break
-        
-        if not faculty:
-            return False
-        
-        # Check if faculty is available during this time
-        faculty_available = False
-        for avail in faculty.availability:
-            if avail.day == time_slot.day:
-                avail_start = time_to_minutes(avail.startTime)
-                avail_end = time_to_minutes(avail.endTime)
-                slot_start = time_to_minutes(time_slot.startTime)
-                slot_end = time_to_minutes(time_slot.endTime)
-                if avail_start <= slot_start and slot_end <= avail_end:
-                    faculty_available = True
-                    break
-        
-        if not faculty_available:
+        # Check if faculty is available during this time (unknown faculty never are)
+        if not self.problem.is_available(faculty_id, time_slot.day, slot_start, slot_end):
             return False
         
         # Check slot availability
         return self._is_slot_available(faculty_id, room_id, time_slot)
 
-    def _add_assignment(self, assignment: ScheduleAssignment):
-        """Add an assignment and update tracking."""
+    def _add_assignment(self, assignment: ScheduleAssignment, count: bool = True):
+        """Add an assignment and update tracking; count=False for the extra periods of a block."""
         self.all_assignments.append(assignment)
         
         # Book the slot
@@ -189,152 +174,259 @@ class SchedulerService:
             endTime=assignment.endTime
         )
         self._book_slot(assignment.faculty_id, assignment.room_id, time_slot)
+        if self.load_tracker is not None and assignment.faculty_id in self.problem.faculty:
+            self.load_tracker.book(assignment.faculty_id, assignment.subject_name, time_slot.day,
+                                   *slot_minutes(time_slot), count=count)
         
         # Update subject count
-        if assignment.subject_name in self.subject_counts:
+        if count and assignment.subject_name in self.subject_counts:
             self.subject_counts[assignment.subject_name] += 1
 
-    def _build_weekly_schedule(self, schedule: List[ScheduleAssignment]) -> Dict[str, List[Any]]:
-        """Convert flat schedule into weekly table format."""
-        weekly_schedule = {day: [None] * len(self.time_slot_labels) for day in VALID_DAYS}
+    def _build_weekly_schedule(self, schedule: List[ScheduleAssignment], rooms: List[str]) -> Dict[str, Dict[str, List[Any]]]:
+        """Convert flat schedule into one weekly table per room."""
+        slot_indexes = {label: idx for idx, label in enumerate(self.time_slot_labels)}
+        room_schedules = {room: {day: [None] * len(self.time_slot_labels) for day in VALID_DAYS} for room in rooms}
         for assignment in schedule:
             slot_label = f"{assignment.startTime}-{assignment.endTime}"
-            try:
-                slot_idx = self.time_slot_labels.index(slot_label)
-                weekly_schedule[assignment.day][slot_idx] = assignment.model_dump()
-            except ValueError:
-                logger.warning(f"Slot {slot_label} not found in time_slot_labels")
-        return weekly_schedule
+            if slot_label not in slot_indexes:
+                logger.warning("Slot %s not found in time_slot_labels", slot_label)
+                continue
+            if assignment.room_id not in room_schedules:
+                logger.warning("Room %s not found in rooms", assignment.room_id)
+                continue
+            room_schedules[assignment.room_id][assignment.day][slot_indexes[slot_label]] = assignment.model_dump()
+        return room_schedules
 
     def _get_slot_duration(self, slot: TimeSlot) -> int:
         """Calculate the duration of a slot in minutes."""
         try:
             return time_to_minutes(slot.endTime) - time_to_minutes(slot.startTime)
         except ValueError as e:
-            logger.error(f"Failed to calculate slot duration: {e}")
+            logger.error("Failed to calculate slot duration: %s", e)
             return -1
 
     def _generate_weekly_slots(self, start_time: str, end_time: str, breaks: List[Break], subjects: List) -> Tuple[List[str], List[TimeSlot]]:
         """Generate time slots for all days using the updated generate_weekly_time_slots."""
         return generate_weekly_time_slots(start_time, end_time, breaks, subjects)
 
-    def _ultra_aggressive_fill_slots(self, schedule: List[ScheduleAssignment], input_data: ScheduleInput) -> List[ScheduleAssignment]:
-        """Ultra-aggressive slot filling to achieve 100% utilization."""
+    def _ultra_aggressive_fill_slots(self, schedule: List[ScheduleAssignment], input_data: ScheduleInput,
+                                     parallel_days: bool = False, max_workers: Optional[int] = None) -> List[ScheduleAssignment]:
+        """Ultra-aggressive slot filling to achieve 100% utilization of every room.
+
+        Faculty and room conflicts only exist within a day, so with
+        parallel_days=True each day is filled in its own worker process from a
+        snapshot of the Phase 1 bookings, and the days are merged in
+        VALID_DAYS order. The serial fill ranks subjects by the classes they
+        still need across the week; workers cannot see each other's days, so
+        each subject's remaining classes are split evenly across the days up
+        front and every worker ranks by its day's share. Soft-constraint
+        penalties are per day and stay exact. When Phase 1 left classes
+        unplaced, parallel output may therefore differ from the serial fill.
+        """
         new_assignments = schedule.copy()
         
         # Create a copy of subjects that can be modified
         subjects = copy.deepcopy(input_data.subjects)
         
-        # Get all available slots (excluding breaks)
-        available_slots = []
-        for day in VALID_DAYS:
-            for slot_label in self.time_slot_labels:
-                start_time, end_time = slot_label.split('-')
-                slot_obj = TimeSlot(day=day, startTime=start_time, endTime=end_time)
-                
-                # Skip break slots
-                if not check_break_conflict(slot_obj, input_data.break_):
-                    available_slots.append(slot_obj)
+        # Every day's own grid already leaves out that day's breaks
+        available_slots = list(self.fixed_slots)
         
-        logger.info(f"Total available slots (excluding breaks): {len(available_slots)}")
+        logger.debug("Phase 2 available slots (excluding breaks): %d x %d rooms", len(available_slots), len(input_data.rooms))
         
-        # Track assigned slots
+        # Track assigned (slot, room) cells
         assigned_slots = set()
         for assignment in new_assignments:
-            assigned_slots.add((assignment.day, assignment.startTime, assignment.endTime))
+            assigned_slots.add((assignment.day, assignment.startTime, assignment.endTime, assignment.room_id))
+        
+        phase1_count = len(new_assignments)
         
         # Sort slots by time for better distribution
         available_slots.sort(key=lambda s: (VALID_DAYS.index(s.day), time_to_minutes(s.startTime)))
         
-        # First pass: Try to fill each available slot with optimal assignments
-        for slot in available_slots:
-            slot_key = (slot.day, slot.startTime, slot.endTime)
+        if parallel_days:
+            slots_by_day = defaultdict(list)
+            for slot in available_slots:
+                slots_by_day[slot.day].append(slot)
             
-            # Skip if already assigned
-            if slot_key in assigned_slots:
-                continue
+            # Workers get a read-only copy of the Phase 1 bookings; history is not needed there
+            snapshot = copy.copy(self)
+            snapshot.schedule_history = []
+            snapshot.all_assignments = []
+            
+            days = [day for day in VALID_DAYS if slots_by_day[day]]
+            day_counts = self._day_quota_counts(subjects, len(days))
+            from concurrent.futures import ProcessPoolExecutor
+            logger.info("Phase 2 filling days=%d in parallel", len(days))
+            # The snapshot goes to each worker process once, not once per day
+            with self.timings.span("phase2.parallel_days"), ProcessPoolExecutor(
+                    max_workers=max_workers, initializer=_init_fill_worker,
+                    initargs=(snapshot, subjects, input_data, assigned_slots)) as pool:
+                day_results = list(pool.map(_fill_day_worker, [slots_by_day[day] for day in days], day_counts))
             
+            # Merge deterministically in day order, replaying bookings into the live indexes
+            for day_assignments, day_counters in day_results:
+                self.timings.merge_counters(day_counters)
+                for assignment in day_assignments:
+                    new_assignments.append(assignment)
+                    self._add_assignment(assignment)
+                    assigned_slots.add((assignment.day, assignment.startTime, assignment.endTime, assignment.room_id))
+        else:
+            # First pass: Try to fill each available slot with optimal assignments
+            with self.timings.span("phase2.preferred"):
+                self._fill_preferred_pass(available_slots, subjects, input_data, new_assignments, assigned_slots)
+            # Second pass: Fill ANY remaining slots with ANY available faculty
+            with self.timings.span("phase2.any_faculty"):
+                self._fill_any_faculty_pass(available_slots, subjects, input_data, new_assignments, assigned_slots)
+        
+        # Third pass: Create virtual subjects/faculty if needed for 100% utilization
+        filled_count = len(new_assignments) - phase1_count
+        remaining_slots = self._remaining_cells(available_slots, input_data, assigned_slots)
+        
+        if remaining_slots:
+            detail = DetailLog(logger)
+            # Create a virtual subject and faculty for each remaining slot
+            for i, (slot, room_id) in enumerate(remaining_slots):
+                virtual_faculty_id = f"VF{i+1}"
+                virtual_faculty_name = f"Virtual Faculty {i+1}"
+                
+                assignment = ScheduleAssignment(
+                    subject_name=PLACEHOLDER_SUBJECT,
+                    faculty_id=virtual_faculty_id,
+                    faculty_name=virtual_faculty_name,
+                    day=slot.day,
+                    startTime=slot.startTime,
+                    endTime=slot.endTime,
+                    room_id=room_id,
+                    is_special=False,
+                    priority_score=0
+                )
+                
+                new_assignments.append(assignment)
+                if detail.enabled:
+                    detail("Virtual assignment for %s %s-%s in %s", slot.day, slot.startTime, slot.endTime, room_id)
+        
+        logger.info("Phase 2 completed: filled=%d virtual=%d total_assignments=%d",
+                    filled_count, len(remaining_slots), len(new_assignments))
+        return new_assignments
+
+    def _day_quota_counts(self, subjects: List[Subject], num_days: int) -> List[Dict[str, int]]:
+        """Per day, the subject counts a parallel Phase 2 worker ranks by: each subject's remaining classes are
+        split evenly across the days, earlier days taking the remainder, and a worker sees its share as missing."""
+        day_counts = []
+        for i in range(num_days):
+            counts = dict(self.subject_counts)
+            for subject in subjects:
+                required = subject.no_of_classes_per_week
+                missing = max(0, required - self.subject_counts.get(subject.name, 0))
+                share = missing // num_days + (i < missing % num_days)
+                counts[subject.name] = required - share
+            day_counts.append(counts)
+        return day_counts
+
+    def _remaining_cells(self, available_slots: List[TimeSlot], input_data: ScheduleInput, assigned_slots: set) -> List[Tuple[TimeSlot, str]]:
+        """(slot, room) cells that are neither assigned in this schedule nor booked by another section."""
+        remaining_slots = []
+        for slot in available_slots:
+            for room_id in input_data.rooms:
+                slot_key = (slot.day, slot.startTime, slot.endTime, room_id)
+                if slot_key not in assigned_slots and self.room_index.is_free(room_id, slot):
+                    remaining_slots.append((slot, room_id))
+        return remaining_slots
+
+    def _fill_preferred_pass(self, available_slots: List[TimeSlot], subjects: List[Subject], input_data: ScheduleInput,
+                             new_assignments: List[ScheduleAssignment], assigned_slots: set) -> None:
+        """Phase 2, first pass: fill free cells with the best-ranked subject/faculty for each slot."""
+        detail = DetailLog(logger)
+        for slot in available_slots:
             slot_duration = self._get_slot_duration(slot)
             if slot_duration <= 0:
                 continue
             
             # Find compatible subject-faculty combinations
+            slot_start, slot_end = slot_minutes(slot)
             compatible_combinations = []
             for subject in subjects:
                 if subject.time == slot_duration:
                     for faculty in subject.faculty:
+                        self.timings.count("candidates_examined")
                         # Check if faculty is available for this slot
-                        faculty_available = False
-                        for avail in faculty.availability:
-                            if avail.day == slot.day:
-                                avail_start = time_to_minutes(avail.startTime)
-                                avail_end = time_to_minutes(avail.endTime)
-                                slot_start = time_to_minutes(slot.startTime)
-                                slot_end = time_to_minutes(slot.endTime)
-                                if avail_start <= slot_start and slot_end <= avail_end:
-                                    faculty_available = True
-                                    break
-                        
-                        if faculty_available:
+                        if self.problem.is_available(faculty.id, slot.day, slot_start, slot_end):
                             # Calculate preference score
                             pref_score = calculate_preference_score(slot, subject.preferred_slots, faculty.preferred_slots)
-                            
-                            # Calculate priority based on required classes vs. assigned
-                            required = subject.no_of_classes_per_week
-                            assigned = self.subject_counts.get(subject.name, 0)
-                            priority = required - assigned if assigned < required else 0
-                            
-                            compatible_combinations.append((subject, faculty, pref_score, priority))
+                            compatible_combinations.append((subject, faculty, pref_score))
             
             if not compatible_combinations:
-                logger.debug(f"No compatible combinations for slot {slot.day} {slot.startTime}-{slot.endTime}")
+                if detail.enabled:
+                    detail("No compatible combinations for slot %s %s-%s", slot.day, slot.startTime, slot.endTime)
                 continue
             
-            # Sort by priority (required classes first), then preference score
-            compatible_combinations.sort(key=lambda x: (x[3], x[2]), reverse=True)
-            
-            # Try to assign the best combination
-            assigned = False
-            for subject, faculty, pref_score, priority in compatible_combinations:
-                if self._is_valid_assignment(faculty.id, slot, self.single_room_id, input_data):
-                    assignment = ScheduleAssignment(
-                        subject_name=subject.name,
-                        faculty_id=faculty.id,
-                        faculty_name=faculty.name,
-                        day=slot.day,
-                        startTime=slot.startTime,
-                        endTime=slot.endTime,
-                        room_id=self.single_room_id,
-                        is_special=subject.is_special,
-                        priority_score=pref_score
-                    )
-                    
-                    new_assignments.append(assignment)
-                    self._add_assignment(assignment)
-                    assigned_slots.add(slot_key)
-                    assigned = True
-                    
-                    priority_msg = f", priority: {priority}" if priority > 0 else ""
-                    logger.debug(f"Filled slot {slot.day} {slot.startTime}-{slot.endTime} with {subject.name} by {faculty.name} (score: {pref_score}{priority_msg})")
+            # Fill every free room of this slot, one class per room
+            for room_id in self.room_index.free_rooms(slot):
+                slot_key = (slot.day, slot.startTime, slot.endTime, room_id)
+                if slot_key in assigned_slots:
+                    continue
+                
+                # Priority based on required classes vs. assigned changes as rooms are filled
+                ranked_combinations = []
+                for subject, faculty, pref_score in compatible_combinations:
+                    required = subject.no_of_classes_per_week
+                    assigned = self.subject_counts.get(subject.name, 0)
+                    priority = required - assigned if assigned < required else 0
+                    soft_cost = 0
+                    if self.load_tracker is not None:
+                        soft_cost = self.load_tracker.delta(faculty.id, subject.name, slot.day, [(slot_start, slot_end)])
+                    ranked_combinations.append((subject, faculty, pref_score, priority, pref_score - soft_cost))
+                
+                # Sort by priority (required classes first), then preference score less any soft-constraint penalty
+                ranked_combinations.sort(key=lambda x: (x[3], x[4]), reverse=True)
+                
+                # Try to assign the best combination
+                assigned = False
+                for subject, faculty, pref_score, priority, _ in ranked_combinations:
+                    if self._is_valid_assignment(faculty.id, slot, room_id, input_data):
+                        assignment = ScheduleAssignment(
+                            subject_name=subject.name,
+                            faculty_id=faculty.id,
+                            faculty_name=faculty.name,
+                            day=slot.day,
+                            startTime=slot.startTime,
+                            endTime=slot.endTime,
+                            room_id=room_id,
+                            is_special=subject.is_special,
+                            priority_score=pref_score
+                        )
+                        
+                        new_assignments.append(assignment)
+                        self._add_assignment(assignment)
+                        assigned_slots.add(slot_key)
+                        assigned = True
+                        
+                        if detail.enabled:
+                            detail("Filled slot %s %s-%s in %s with %s by %s (score: %s, priority: %s)",
+                                   slot.day, slot.startTime, slot.endTime, room_id, subject.name, faculty.name,
+                                   pref_score, priority)
+                        break
+                
+                if not assigned:
+                    if detail.enabled:
+                        detail("Could not fill slot %s %s-%s in %s", slot.day, slot.startTime, slot.endTime, room_id)
+                    # Every faculty is busy at this time, so the remaining rooms cannot be filled either
                     break
-            
-            if not assigned:
-                logger.debug(f"Could not fill slot {slot.day} {slot.startTime}-{slot.endTime}")
-        
-        # Second pass: Fill ANY remaining slots with ANY available faculty
-        remaining_slots = []
-        for slot in available_slots:
-            slot_key = (slot.day, slot.startTime, slot.endTime)
-            if slot_key not in assigned_slots:
-                remaining_slots.append(slot)
+
+    def _fill_any_faculty_pass(self, available_slots: List[TimeSlot], subjects: List[Subject], input_data: ScheduleInput,
+                               new_assignments: List[ScheduleAssignment], assigned_slots: set) -> None:
+        """Phase 2, second pass: fill any remaining cell with any available faculty."""
+        remaining_slots = self._remaining_cells(available_slots, input_data, assigned_slots)
         
         if remaining_slots:
-            logger.info(f"Second pass: Filling {len(remaining_slots)} remaining slots with any available faculty")
+            logger.debug("Second pass: filling %d remaining cells with any available faculty", len(remaining_slots))
+            detail = DetailLog(logger)
             
             # For each remaining slot, try ANY faculty that's available
-            for slot in remaining_slots:
-                slot_key = (slot.day, slot.startTime, slot.endTime)
+            for slot, room_id in remaining_slots:
+                slot_key = (slot.day, slot.startTime, slot.endTime, room_id)
                 slot_duration = self._get_slot_duration(slot)
+                slot_start, slot_end = slot_minutes(slot)
                 
                 # Find ANY subject with matching duration
                 for subject in subjects:
@@ -342,18 +434,8 @@ class SchedulerService:
                         # Try each faculty
                         for faculty in subject.faculty:
                             # Check basic availability
-                            faculty_available = False
-                            for avail in faculty.availability:
-                                if avail.day == slot.day:
-                                    avail_start = time_to_minutes(avail.startTime)
-                                    avail_end = time_to_minutes(avail.endTime)
-                                    slot_start = time_to_minutes(slot.startTime)
-                                    slot_end = time_to_minutes(slot.endTime)
-                                    if avail_start <= slot_start and slot_end <= avail_end:
-                                        faculty_available = True
-                                        break
-                            
-                            if faculty_available and self._is_slot_available(faculty.id, self.single_room_id, slot):
+                            if (self.problem.is_available(faculty.id, slot.day, slot_start, slot_end)
+                                    and self._is_slot_available(faculty.id, room_id, slot)):
                                 assignment = ScheduleAssignment(
                                     subject_name=subject.name,
                                     faculty_id=faculty.id,
@@ -361,7 +443,7 @@ class SchedulerService:
                                     day=slot.day,
                                     startTime=slot.startTime,
                                     endTime=slot.endTime,
-                                    room_id=self.single_room_id,
+                                    room_id=room_id,
                                     is_special=subject.is_special,
                                     priority_score=0  # No preference in second pass
                                 )
@@ -369,86 +451,559 @@ class SchedulerService:
                                 new_assignments.append(assignment)
                                 self._add_assignment(assignment)
                                 assigned_slots.add(slot_key)
-                                logger.info(f"Second pass: Filled slot {slot.day} {slot.startTime}-{slot.endTime} with {subject.name} by {faculty.name}")
+                                if detail.enabled:
+                                    detail("Second pass: filled slot %s %s-%s in %s with %s by %s", slot.day,
+                                           slot.startTime, slot.endTime, room_id, subject.name, faculty.name)
                                 break
                         
                         # If we assigned this slot, move to the next one
                         if slot_key in assigned_slots:
                             break
-        
-        # Third pass: Create virtual subjects/faculty if needed for 100% utilization
-        remaining_slots = []
-        for slot in available_slots:
-            slot_key = (slot.day, slot.startTime, slot.endTime)
-            if slot_key not in assigned_slots:
-                remaining_slots.append(slot)
-        
-        if remaining_slots:
-            logger.info(f"Third pass: Creating virtual assignments for {len(remaining_slots)} remaining slots")
-            
-            # Create a virtual subject and faculty for each remaining slot
-            for i, slot in enumerate(remaining_slots):
-                virtual_faculty_id = f"VF{i+1}"
-                virtual_faculty_name = f"Virtual Faculty {i+1}"
-                
-                assignment = ScheduleAssignment(
-                    subject_name=f"Available Slot",
-                    faculty_id=virtual_faculty_id,
-                    faculty_name=virtual_faculty_name,
-                    day=slot.day,
-                    startTime=slot.startTime,
-                    endTime=slot.endTime,
-                    room_id=self.single_room_id,
-                    is_special=False,
-                    priority_score=0
-                )
-                
-                new_assignments.append(assignment)
-                logger.info(f"Created virtual assignment for {slot.day} {slot.startTime}-{slot.endTime}")
-        
-        logger.info(f"Ultra-aggressive fill completed: {len(new_assignments)} total assignments")
-        return new_assignments
 
-    def generate_schedule(self, input_data: ScheduleInput, use_ga: bool = False) -> Dict[str, Any]:
-        """Generate a weekly schedule with 100% slot utilization."""
+    def generate_schedule(self, input_data: ScheduleInput, use_ga: bool = False, parallel_days: bool = False,
+                          include_timings: bool = False, check_feasibility: bool = False) -> Dict[str, Any]:
+        """Generate a weekly schedule with 100% slot utilization.
+
+        With include_timings the result carries a "timings" block of per-phase
+        spans and hot-path counters; timings are always folded into
+        TIMING_HISTOGRAMS. With check_feasibility, inputs whose required
+        classes cannot all fit raise InfeasibleScheduleError before any search.
+        """
+        self.timings = SolveTimings()
         try:
-            self._validate_input(input_data)
+            with self.timings.span("validation"):
+                problem = self._validate_input(input_data)
         except ValueError as e:
-            logger.error(f"Input validation failed: {e}")
+            logger.error("Input validation failed: %s", e)
             raise
 
-        # Reset all tracking
+        self._reset_tracking()
+        with SCHEDULER_METRICS.track_solve():
+            result = self._solve(input_data, use_ga, parallel_days, problem, check_feasibility)
+        TIMING_HISTOGRAMS.observe(self.timings)
+        SCHEDULER_METRICS.record_solve("ga" if use_ga else "greedy", result["fitness"])
+        if include_timings:
+            result["timings"] = self.timings.as_dict()
+        return result
+
+    def generate_pareto_front(self, input_data: ScheduleInput, front_size: Optional[int] = None,
+                              include_timings: bool = False) -> Dict[str, Any]:
+        """Run the GA in NSGA-II mode and return a small Pareto front of schedules from one solve.
+
+        Each schedule in "front" has the shape of generate_schedule plus an
+        "objectives" block (hard_penalty, preference_score, load_imbalance),
+        and is recorded in the schedule history so the trade-offs can be
+        compared with the history diff. front_size defaults to
+        model.DEFAULT_FRONT_SIZE.
+        """
+        if front_size is not None and front_size < 1:
+            raise ValueError("front_size must be at least 1")
+        self.timings = SolveTimings()
+        try:
+            with self.timings.span("validation"):
+                problem = self._validate_input(input_data)
+        except ValueError as e:
+            logger.error("Input validation failed: %s", e)
+            raise
+
+        self._reset_tracking()
+        with SCHEDULER_METRICS.track_solve():
+            self._prepare_solve(input_data, problem)
+            from genetic_algorithm import GeneticAlgorithm
+            ga = GeneticAlgorithm(
+                input_data=input_data,
+                fixed_slots=self.fixed_slots,
+                pop_size=50,
+                generations=30,
+                fixed_room_id=self.single_room_id,
+                conflict_checker=self._is_valid_assignment,
+                rooms=input_data.rooms,
+                timings=self.timings,
+                problem=self.problem
+            )
+            solutions = ga.run_pareto(DEFAULT_FRONT_SIZE if front_size is None else front_size)
+            front = []
+            with self.timings.span("rendering"):
+                for schedule, (hard_penalty, preference_score, load_imbalance) in solutions:
+                    # Front members are not booked, so their soft-constraint penalties are counted from the schedule
+                    load_tracker = None
+                    if input_data.soft_constraints is not None:
+                        load_tracker = LoadTracker.from_schedule(
+                            input_data.soft_constraints, self.problem.breaks, schedule,
+                            {subject.name: subject for subject in input_data.subjects}, self.problem.faculty)
+                    result = self._build_result(schedule, input_data, load_tracker)
+                    result["objectives"] = {"hard_penalty": hard_penalty, "preference_score": preference_score,
+                                            "load_imbalance": round(load_imbalance, 2)}
+                    front.append(result)
+        TIMING_HISTOGRAMS.observe(self.timings)
+        SCHEDULER_METRICS.record_solve("pareto", front[0]["fitness"] if front else 0.0)
+        result = {"front": front, "front_size": len(front)}
+        if include_timings:
+            result["timings"] = self.timings.as_dict()
+        return result
+
+    def analyze_feasibility(self, input_data: ScheduleInput, include_timings: bool = False) -> Dict[str, Any]:
+        """Capacity bounds and a max-flow check of whether input_data's required classes can all be placed.
+
+        Nothing is scheduled or recorded in history; see feasibility.analyze_feasibility.
+        """
+        self.timings = SolveTimings()
+        try:
+            with self.timings.span("validation"):
+                problem = self._validate_input(input_data)
+        except ValueError as e:
+            logger.error("Input validation failed: %s", e)
+            raise
+
+        self._reset_tracking()
+        self._prepare_solve(input_data, problem)
+        report = self._feasibility_report(input_data)
+        if include_timings:
+            report["timings"] = self.timings.as_dict()
+        return report
+
+    def _feasibility_report(self, input_data: ScheduleInput) -> Dict[str, Any]:
+        """analyze_feasibility against the prepared grid and the bookings already in the indexes."""
+        with self.timings.span("feasibility"):
+            report = analyze_feasibility(input_data, self.problem, self.fixed_slots, self.block_index,
+                                         self.room_index, self._faculty_free)
+        logger.info("Feasibility: feasible=%s issues=%d", report["feasible"], len(report["issues"]))
+        return report
+
+    def _faculty_free(self, faculty_id: str, slot: TimeSlot) -> bool:
+        """Whether nothing booked in the occupancy indexes overlaps the slot for the faculty member."""
+        return not any(check_time_conflict(slot, booked)
+                       for booked in self.faculty_schedule.get(faculty_id, {}).get(slot.day, ()))
+
+    def _booked(self, kind: str, resource_id: str, slot: TimeSlot) -> bool:
+        """Whether a "FACULTY" or "ROOM" is booked at the slot in the occupancy indexes (any batch section)."""
+        if kind == "ROOM":
+            return not self.room_index.is_free(resource_id, slot)
+        return not self._faculty_free(resource_id, slot)
+
+    def repair_schedule(self, input_data: ScheduleInput, schedule: List[ScheduleAssignment],
+                        delta: Optional[ScheduleDelta] = None, max_radius: int = DEFAULT_REPAIR_RADIUS,
+                        include_timings: bool = False) -> Dict[str, Any]:
+        """Repair an existing schedule after an input change instead of solving from scratch.
+
+        Assignments that still satisfy the changed input are kept as they are.
+        Broken ones are moved to the closest free cell within max_radius
+        (see repair_neighbourhood), keeping their faculty and room where
+        possible. The result has the shape of generate_schedule plus a
+        "repair" block listing what was moved and what could not be placed.
+        """
+        if max_radius < 0:
+            raise ValueError("max_radius must be at least 0")
+        self.timings = SolveTimings()
+        updated_input = apply_delta(input_data, delta) if delta is not None else input_data
+        try:
+            with self.timings.span("validation"):
+                problem = self._validate_input(updated_input)
+        except ValueError as e:
+            logger.error("Input validation failed: %s", e)
+            raise
+
+        self._reset_tracking()
+        with SCHEDULER_METRICS.track_solve():
+            self._prepare_solve(updated_input, problem)
+            with self.timings.span("repair"):
+                repaired, report = self._repair(updated_input, schedule, max_radius)
+            with self.timings.span("rendering"):
+                result = self._build_result(repaired, updated_input)
+        result["repair"] = report
+        TIMING_HISTOGRAMS.observe(self.timings)
+        SCHEDULER_METRICS.record_solve("repair", result["fitness"])
+        if include_timings:
+            result["timings"] = self.timings.as_dict()
+        return result
+
+    def _repair_violation(self, assignment: ScheduleAssignment, subjects: Dict[str, Subject],
+                          grid_cells: set, input_data: ScheduleInput) -> Optional[str]:
+        """Why an assignment breaks the current input, or None if it can stay."""
+        subject = subjects.get(assignment.subject_name)
+        if subject is None:
+            return "subject_removed"
+        if assignment.faculty_id not in {faculty.id for faculty in subject.faculty}:
+            return "faculty_removed"
+        if assignment.room_id not in input_data.rooms:
+            return "room_offline"
+        slot = TimeSlot(day=assignment.day, startTime=assignment.startTime, endTime=assignment.endTime)
+        start, end = slot_minutes(slot)
+        if self.problem.overlaps_break(slot.day, start, end):
+            return "break"
+        if (slot.day, slot.startTime, slot.endTime) not in grid_cells:
+            return "off_grid"
+        if not self.problem.is_available(assignment.faculty_id, slot.day, start, end):
+            return "faculty_unavailable"
+        if not self._is_slot_available(assignment.faculty_id, assignment.room_id, slot):
+            return "conflict"
+        return None
+
+    def _repair(self, input_data: ScheduleInput, schedule: List[ScheduleAssignment],
+                max_radius: int) -> Tuple[List[ScheduleAssignment], Dict[str, Any]]:
+        """Keep valid assignments, re-place broken ones nearby and drop placeholders that no longer fit.
+
+        The periods of a consecutive-period block are kept, moved or dropped
+        together as one class.
+        """
+        subjects = {subject.name: subject for subject in input_data.subjects}
+        grid_cells = {(slot.day, slot.startTime, slot.endTime) for slot in self.fixed_slots}
+
+        # Placeholders ("Available Slot" cells of virtual faculty) are not bookings; real classes may take their cells
+        outcome: List[List[ScheduleAssignment]] = [[assignment] for assignment in schedule]
+        broken = []
+        for unit in self._class_units(schedule, subjects):
+            assignments = [schedule[idx] for idx in unit]
+            subject = subjects.get(assignments[0].subject_name)
+            reason = next(filter(None, (self._repair_violation(a, subjects, grid_cells, input_data) for a in assignments)), None)
+            if (reason is None and subject.requires_consecutive
+                    and time_to_minutes(assignments[-1].endTime) - time_to_minutes(assignments[0].startTime) != subject.time):
+                reason = "incomplete_block"
+            if reason is None:
+                for i, assignment in enumerate(assignments):
+                    self._add_assignment(assignment, count=i == 0)
+            else:
+                for idx in unit:
+                    outcome[idx] = []
+                broken.append((unit, assignments, reason))
+        kept = len(self.all_assignments)
+
+        # Classes a subject still needs go first; Phase 2 extras beyond the weekly count are only kept if they fit
+        def still_required(assignment: ScheduleAssignment) -> bool:
+            subject = subjects.get(assignment.subject_name)
+            return subject is not None and self.subject_counts.get(subject.name, 0) < subject.no_of_classes_per_week
+
+        def as_class(assignments: List[ScheduleAssignment]) -> Dict[str, Any]:
+            """One report entry per class; a block spans from its first period to its last."""
+            return {**assignments[0].model_dump(), "endTime": assignments[-1].endTime}
+
+        moved, unplaced, dropped = [], [], []
+        pending = sorted(broken, key=lambda item: not still_required(item[1][0]))
+        for unit, assignments, reason in pending:
+            assignment = assignments[0]
+            required = still_required(assignment)
+            subject = subjects.get(assignment.subject_name)
+            if subject is not None and subject.requires_consecutive:
+                placed = self._place_block_near(assignment, subject, input_data, max_radius)
+            else:
+                placed = self._place_near(assignment, subject, input_data, max_radius)
+                if placed is not None:
+                    placed = [placed[0]], placed[1]
+            if placed is None:
+                if required:
+                    unplaced.append({"assignment": as_class(assignments), "reason": reason})
+                    logger.warning("Could not re-place required %s (%s) within radius %d",
+                                   assignment.subject_name, reason, max_radius)
+                else:
+                    dropped.append({"assignment": as_class(assignments), "reason": reason})
+                continue
+            new_assignments, distance = placed
+            outcome[unit[0]] = new_assignments
+            moved.append({"before": as_class(assignments), "after": as_class(new_assignments),
+                          "reason": reason, "distance": distance})
+
+        placeholders_removed = 0
+        for idx, cell in enumerate(outcome):
+            if len(cell) != 1 or cell[0].faculty_id in self.problem.faculty:
+                continue
+            assignment = cell[0]
+            slot = TimeSlot(day=assignment.day, startTime=assignment.startTime, endTime=assignment.endTime)
+            if ((slot.day, slot.startTime, slot.endTime) not in grid_cells
+                    or not self.room_index.is_free(assignment.room_id, slot)):
+                outcome[idx] = []
+                placeholders_removed += 1
+
+        logger.info("Repair completed: kept=%d moved=%d unplaced=%d dropped=%d placeholders_removed=%d",
+                    kept, len(moved), len(unplaced), len(dropped), placeholders_removed)
+        report = {
+            "max_radius": max_radius,
+            "kept": kept,
+            "moved": moved,
+            "unplaced": unplaced,  # Required classes with no free cell in reach
+            "dropped": dropped,  # Extra classes beyond the weekly count with no free cell in reach
+            "placeholders_removed": placeholders_removed,
+        }
+        return [assignment for cell in outcome for assignment in cell], report
+
+    def _class_units(self, schedule: List[ScheduleAssignment], subjects: Dict[str, Subject]) -> List[List[int]]:
+        """Indexes of the real classes in schedule, one list per class, in schedule order.
+
+        A consecutive-period block is one class: its periods (same faculty,
+        room and day, back to back) are cut into runs of the subject's
+        length, and a shorter leftover run becomes a class of its own.
+        """
+        units = []
+        block_periods: Dict[Tuple[str, str, str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+        for idx, assignment in enumerate(schedule):
+            if assignment.faculty_id not in self.problem.faculty:
+                continue
+            subject = subjects.get(assignment.subject_name)
+            if subject is not None and subject.requires_consecutive:
+                block_periods[(subject.name, assignment.faculty_id, assignment.room_id, assignment.day)].append(
+                    (time_to_minutes(assignment.startTime), time_to_minutes(assignment.endTime), idx))
+            else:
+                units.append([idx])
+        for (subject_name, _, _, _), periods in block_periods.items():
+            for run in contiguous_runs(periods):
+                units.extend([idx for _, _, idx in block] for block in split_blocks(run, subjects[subject_name].time))
+        return sorted(units)
+
+    def _place_near(self, assignment: ScheduleAssignment, subject: Optional[Subject], input_data: ScheduleInput,
+                    max_radius: int) -> Optional[Tuple[ScheduleAssignment, int]]:
+        """Book the closest valid cell for a broken assignment, preferring its own faculty and room."""
+        if subject is None:
+            return None
+        faculty_order = sorted(subject.faculty, key=lambda faculty: faculty.id != assignment.faculty_id)
+        room_order = sorted(input_data.rooms, key=lambda room: room != assignment.room_id)
+        candidates = repair_neighbourhood(assignment, self.fixed_slots, self.time_slot_labels, subject.time, max_radius)
+        for distance, slot in candidates:
+            for faculty in faculty_order:
+                self.timings.count("candidates_examined")
+                for room_id in room_order:
+                    if self._is_valid_assignment(faculty.id, slot, room_id, input_data):
+                        new_assignment = ScheduleAssignment(
+                            subject_name=subject.name,
+                            faculty_id=faculty.id,
+                            faculty_name=faculty.name,
+                            day=slot.day,
+                            startTime=slot.startTime,
+                            endTime=slot.endTime,
+                            room_id=room_id,
+                            is_special=subject.is_special,
+                            priority_score=calculate_preference_score(slot, subject.preferred_slots, faculty.preferred_slots)
+                        )
+                        self._add_assignment(new_assignment)
+                        return new_assignment, distance
+        return None
+
+    def _place_block_near(self, assignment: ScheduleAssignment, subject: Subject, input_data: ScheduleInput,
+                          max_radius: int) -> Optional[Tuple[List[ScheduleAssignment], int]]:
+        """Book the closest free block for a broken consecutive-period class, preferring its own faculty and room."""
+        faculty_order = sorted(subject.faculty, key=lambda faculty: faculty.id != assignment.faculty_id)
+        room_order = sorted(input_data.rooms, key=lambda room: room != assignment.room_id)
+        spans = [span for day in VALID_DAYS for _, span in self.block_index.blocks(day, subject.time)]
+        for distance, span in repair_neighbourhood(assignment, spans, self.time_slot_labels, subject.time, max_radius):
+            block = self._place_block(subject, spans=[span], faculty_order=faculty_order, room_order=room_order)
+            if block:
+                return block, distance
+        return None
+
+    def _reset_tracking(self):
+        """Forget all bookings from previous solves."""
         self.assignments.clear()
         self.all_assignments.clear()
         self.faculty_schedule.clear()
         self.room_schedule.clear()
         self.subject_counts.clear()
 
+    def _schedule_required_classes(self, input_data: ScheduleInput) -> List[ScheduleAssignment]:
+        """Phase 1: place the required number of classes for every subject, preferred slots first."""
+        schedule = []
+        subjects = self.constraint_checker.sort_subjects_by_constraints(input_data.subjects)
+
+        # Phase 1: Schedule minimum required classes with preferences
+        detail = DetailLog(logger)
+        unassigned_classes = 0
+        for subject in subjects:
+            required_classes = subject.no_of_classes_per_week
+            if detail.enabled:
+                detail("Scheduling %s (%s) - %d classes needed", subject.name,
+                       "SPECIAL" if subject.is_special else "REGULAR", required_classes)
+
+            for _ in range(required_classes):
+                if subject.requires_consecutive:
+                    block = self._place_block(subject)
+                    if block:
+                        schedule.extend(block)
+                        if detail.enabled:
+                            detail("Assigned %s block to %s at %s %s-%s in %s", subject.name, block[0].faculty_name,
+                                   block[0].day, block[0].startTime, block[-1].endTime, block[0].room_id)
+                    else:
+                        unassigned_classes += 1
+                        logger.debug("Could not assign consecutive block for %s", subject.name)
+                    continue
+
+                assigned = False
+
+                # Try each faculty for this subject
+                for faculty in subject.faculty:
+                    valid_slots = self.problem.valid_slots(faculty.id, self.fixed_slots, subject.time)
+
+                    if not valid_slots:
+                        continue
+
+                    # Get slots sorted by preference
+                    preferred_slots = self.constraint_checker.get_preferred_slots(subject, faculty, valid_slots)
+                    if self.load_tracker is not None:
+                        preferred_slots.sort(key=lambda item: item[1] - self.load_tracker.delta(
+                            faculty.id, subject.name, item[0].day, [slot_minutes(item[0])]), reverse=True)
+
+                    # Try preferred slots first, in the first room still free at that time
+                    for slot, preference_score in preferred_slots:
+                        self.timings.count("candidates_examined")
+                        room_id = self.room_index.first_free_room(slot)
+                        if room_id is None:
+                            continue
+                        if self._is_valid_assignment(faculty.id, slot, room_id, input_data):
+                            assignment = ScheduleAssignment(
+                                subject_name=subject.name,
+                                faculty_id=faculty.id,
+                                faculty_name=faculty.name,
+                                day=slot.day,
+                                startTime=slot.startTime,
+                                endTime=slot.endTime,
+                                room_id=room_id,
+                                is_special=subject.is_special,
+                                priority_score=preference_score
+                            )
+                            schedule.append(assignment)
+                            self._add_assignment(assignment)
+                            assigned = True
+
+                            if detail.enabled:
+                                detail("Assigned %s to %s at %s %s-%s in %s (preference score: %s)", subject.name,
+                                       faculty.name, slot.day, slot.startTime, slot.endTime, room_id, preference_score)
+                            break
+                    if assigned:
+                        break
+
+                if not assigned:
+                    unassigned_classes += 1
+                    logger.debug("Could not assign required class for %s", subject.name)
+
+        logger.info("Phase 1 completed: subjects=%d assignments=%d unassigned_required=%d",
+                    len(subjects), len(schedule), unassigned_classes)
+        return schedule
+
+    def _busy_mask(self, bookings: Dict[str, Dict[str, List[TimeSlot]]], key: str, day: str) -> int:
+        """Grid periods of the day that overlap any booking of a faculty member or room, as a bit mask."""
+        mask = 0
+        for slot in bookings.get(key, {}).get(day, ()):
+            mask |= self.block_index.mask(day, *slot_minutes(slot))
+        return mask
+
+    def _place_block(self, subject: Subject, spans: Optional[List[TimeSlot]] = None,
+                     faculty_order: Optional[List[Faculty]] = None,
+                     room_order: Optional[List[str]] = None) -> List[ScheduleAssignment]:
+        """Book one weekly class of a consecutive-period subject as adjacent grid periods, preferred blocks first.
+
+        Every period goes to the same faculty member and room, and a block is
+        only booked when all of its periods are free, so it is all or nothing.
+        Returns one assignment per period, or [] when no block fits. With
+        spans only those blocks are tried, in the given order; faculty_order
+        and room_order replace the subject's and the input's order (repair).
+        """
+        busy: Dict[Tuple[str, str, str], int] = {}
+
+        def is_free(kind: str, key: str, day: str, mask: int) -> bool:
+            if (kind, key, day) not in busy:
+                bookings = self.faculty_schedule if kind == "faculty" else self.room_schedule
+                busy[(kind, key, day)] = self._busy_mask(bookings, key, day)
+            return not busy[(kind, key, day)] & mask
+
+        for faculty in faculty_order or subject.faculty:
+            if spans is None:
+                blocks = self.problem.valid_blocks(faculty.id, self.block_index, subject.time)
+                scored = sorted(((calculate_preference_score(span, subject.preferred_slots, faculty.preferred_slots), mask, span)
+                                 for mask, span in blocks), key=lambda item: -item[0] + self._block_soft_cost(faculty.id, subject, item))
+            else:
+                scored = [(calculate_preference_score(span, subject.preferred_slots, faculty.preferred_slots),
+                           self.block_index.mask(span.day, *slot_minutes(span)), span)
+                          for span in spans if self.problem.is_available(faculty.id, span.day, *slot_minutes(span))]
+            for preference_score, mask, span in scored:
+                self.timings.count("candidates_examined")
+                if not is_free("faculty", faculty.id, span.day, mask):
+                    continue
+                room_id = next((room for room in room_order or self.room_index.rooms
+                                if is_free("room", room, span.day, mask)), None)
+                if room_id is None:
+                    continue
+                block = [ScheduleAssignment(
+                    subject_name=subject.name,
+                    faculty_id=faculty.id,
+                    faculty_name=faculty.name,
+                    day=period.day,
+                    startTime=period.startTime,
+                    endTime=period.endTime,
+                    room_id=room_id,
+                    is_special=subject.is_special,
+                    priority_score=preference_score
+                ) for period in self.block_index.periods(span.day, mask)]
+                for i, assignment in enumerate(block):
+                    self._add_assignment(assignment, count=i == 0)
+                return block
+        return []
+
+    def _block_soft_cost(self, faculty_id: str, subject: Subject, item: Tuple[int, int, TimeSlot]) -> int:
+        """Soft-constraint penalty a block would add, counting each of its periods as a class."""
+        if self.load_tracker is None:
+            return 0
+        _, mask, span = item
+        periods = [slot_minutes(period) for period in self.block_index.periods(span.day, mask)]
+        return self.load_tracker.delta(faculty_id, subject.name, span.day, periods)
+
+    def _prepare_solve(self, input_data: ScheduleInput, problem: Optional[NormalizedProblem] = None) -> None:
+        """Build the slot grid and occupancy indexes for input_data on top of existing bookings."""
         if not input_data.rooms:
             raise ValueError("At least one room must be provided.")
         self.single_room_id = input_data.rooms[0]
+        if problem is None:
+            with self.timings.span("validation"):
+                problem = normalize_input(input_data)
+        self.problem = problem
 
         # Initialize schedules
         self._initialize_schedules(input_data)
 
-        self.time_slot_labels, self.fixed_slots = self._generate_weekly_slots(
-            input_data.college_time.startTime,
-            input_data.college_time.endTime,
-            input_data.break_,
-            input_data.subjects
-        )
+        with self.timings.span("slot_generation"):
+            self.time_slot_labels, self.fixed_slots = self._generate_weekly_slots(
+                input_data.college_time.startTime,
+                input_data.college_time.endTime,
+                input_data.break_,
+                input_data.subjects
+            )
         if not self.time_slot_labels:
             raise ValueError("No valid time slots generated. Check college time, breaks, and subject durations.")
 
-        logger.info(f"Generated {len(self.time_slot_labels)} time slots: {self.time_slot_labels}")
-        
-        # Log ALL_DAYS breaks
-        all_days_breaks = [b for b in input_data.break_ if b.day == "ALL_DAYS"]
-        if all_days_breaks:
-            logger.info(f"ALL_DAYS breaks: {[(b.startTime, b.endTime) for b in all_days_breaks]}")
+        logger.info("Generated time_slots=%d rooms=%d", len(self.time_slot_labels), len(input_data.rooms))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Time slots: %s", self.time_slot_labels)
+            all_days_breaks = [(b.startTime, b.endTime) for b in input_data.break_ if b.day == "ALL_DAYS"]
+            if all_days_breaks:
+                logger.debug("ALL_DAYS breaks: %s", all_days_breaks)
+
+        # Index free rooms per grid slot, seeded with bookings from earlier sections of a batch
+        with self.timings.span("indexing"):
+            self.room_index = RoomSlotIndex(input_data.rooms, self.fixed_slots)
+            self.block_index = ConsecutiveBlockIndex(self.fixed_slots)
+            self.load_tracker = None
+            if input_data.soft_constraints is not None:
+                self.load_tracker = LoadTracker(input_data.soft_constraints, problem.breaks)
+                for faculty_id, booked_days in self.faculty_schedule.items():
+                    for day, booked_slots in booked_days.items():
+                        for booked_slot in booked_slots:
+                            self.load_tracker.book(faculty_id, None, day, *slot_minutes(booked_slot))
+            for room in input_data.rooms:
+                for booked_slots in self.room_schedule.get(room, {}).values():
+                    for booked_slot in booked_slots:
+                        self.room_index.book(room, booked_slot)
 
         self.constraint_checker = ConstraintChecker(input_data.subjects)
 
+    def _solve(self, input_data: ScheduleInput, use_ga: bool, parallel_days: bool = False,
+               problem: Optional[NormalizedProblem] = None, check_feasibility: bool = False) -> Dict[str, Any]:
+        """Schedule one class group on top of whatever is already booked in the occupancy indexes.
+
+        problem is the already-normalised input_data; it is built here when the
+        caller has not validated the input itself (batch sections).
+        """
+        self._prepare_solve(input_data, problem)
+        if check_feasibility:
+            report = self._feasibility_report(input_data)
+            if not report["feasible"]:
+                logger.warning("Infeasible input, skipping search: %s", report["issues"][0]["message"])
+                raise InfeasibleScheduleError(report)
+
         if use_ga:
             # Import GA only when needed to avoid circular imports
             from genetic_algorithm import GeneticAlgorithm
@@ -458,86 +1013,52 @@ class SchedulerService:
                 pop_size=50,
                 generations=30,
                 fixed_room_id=self.single_room_id,
-                conflict_checker=self._is_valid_assignment
+                conflict_checker=self._is_valid_assignment,
+                rooms=input_data.rooms,
+                timings=self.timings,
+                problem=self.problem
             )
             schedule, fitness = ga.run()
+            # Record the GA's bookings so later sections of a batch see them; a block counts as one class
+            subjects = {subject.name: subject for subject in input_data.subjects}
+            for unit in self._class_units(schedule, subjects):
+                for i, idx in enumerate(unit):
+                    self._add_assignment(schedule[idx], count=i == 0)
         else:
-            schedule = []
-            subjects = self.constraint_checker.sort_subjects_by_constraints(input_data.subjects)
-            
-            # Phase 1: Schedule minimum required classes with preferences
-            logger.info("Phase 1: Scheduling minimum required classes...")
-            for subject in subjects:
-                required_classes = subject.no_of_classes_per_week
-                logger.info(f"Scheduling {subject.name} ({'SPECIAL' if subject.is_special else 'REGULAR'}) - {required_classes} classes needed")
-                
-                for _ in range(required_classes):
-                    assigned = False
-                    
-                    # Try each faculty for this subject
-                    for faculty in subject.faculty:
-                        valid_slots = self.constraint_checker.get_valid_slots(
-                            faculty.availability,
-                            self.fixed_slots,
-                            subject.time
-                        )
-
-                        if not valid_slots:
-                            continue
-
-                        # Get slots sorted by preference
-                        preferred_slots = self.constraint_checker.get_preferred_slots(subject, faculty, valid_slots)
-                        
-                        # Try preferred slots first
-                        for slot, preference_score in preferred_slots:
-                            if self._is_valid_assignment(faculty.id, slot, self.single_room_id, input_data):
-                                assignment = ScheduleAssignment(
-                                    subject_name=subject.name,
-                                    faculty_id=faculty.id,
-                                    faculty_name=faculty.name,
-                                    day=slot.day,
-                                    startTime=slot.startTime,
-                                    endTime=slot.endTime,
-                                    room_id=self.single_room_id,
-                                    is_special=subject.is_special,
-                                    priority_score=preference_score
-                                )
-                                schedule.append(assignment)
-                                self._add_assignment(assignment)
-                                assigned = True
-                                
-                                pref_msg = f" (preference score: {preference_score})" if preference_score > 0 else ""
-                                logger.info(f"Assigned {subject.name} to {faculty.name} at {slot.day} {slot.startTime}-{slot.endTime}{pref_msg}")
-                                break
-                        if assigned:
-                            break
-                    
-                    if not assigned:
-                        logger.warning(f"Could not assign required class for {subject.name}")
-
-            logger.info(f"Phase 1 completed: {len(schedule)} assignments made")
+            with self.timings.span("phase1"):
+                schedule = self._schedule_required_classes(input_data)
 
             # Phase 2: Ultra-aggressively fill ALL remaining slots
-            logger.info("Phase 2: Ultra-aggressively filling remaining slots...")
-            schedule = self._ultra_aggressive_fill_slots(schedule, input_data)
+            schedule = self._ultra_aggressive_fill_slots(schedule, input_data, parallel_days)
 
+        with self.timings.span("rendering"):
+            return self._build_result(schedule, input_data)
+    
+    def _build_result(self, schedule: List[ScheduleAssignment], input_data: ScheduleInput,
+                      load_tracker: Optional[LoadTracker] = None) -> Dict[str, Any]:
+        """Compute statistics, render the weekly and tabular views and record the schedule in history.
+
+        Soft-constraint penalties come from load_tracker, or from the solve's
+        own bookings when it is not given.
+        """
         # Calculate final statistics
         unassigned_slots = []
-        weekly_schedule = self._build_weekly_schedule(schedule)
+        rooms = input_data.rooms
+        room_schedules = self._build_weekly_schedule(schedule, rooms)
         
-        # Count break slots (including ALL_DAYS)
+        # Count cells outside a day's own grid (breaks, or another day's slot times) in every room
         break_slot_count = 0
-        total_slots = len(VALID_DAYS) * len(self.time_slot_labels)
+        total_slots = len(VALID_DAYS) * len(self.time_slot_labels) * len(rooms)
+        grid_cells = {(slot.day, f"{slot.startTime}-{slot.endTime}") for slot in self.fixed_slots}
         
         for day in VALID_DAYS:
             for idx, slot_label in enumerate(self.time_slot_labels):
-                start_time, end_time = slot_label.split('-')
-                slot_obj = TimeSlot(day=day, startTime=start_time, endTime=end_time)
-                
-                if check_break_conflict(slot_obj, input_data.break_):
-                    break_slot_count += 1
-                elif weekly_schedule[day][idx] is None:
-                    unassigned_slots.append(f"{day} {slot_label}")
+                if (day, slot_label) not in grid_cells:
+                    break_slot_count += len(rooms)
+                    continue
+                for room in rooms:
+                    if room_schedules[room][day][idx] is None:
+                        unassigned_slots.append(f"{day} {slot_label}" if len(rooms) == 1 else f"{day} {slot_label} {room}")
 
         # Calculate fitness score
         total_available_slots = total_slots - break_slot_count
@@ -547,17 +1068,12 @@ class SchedulerService:
         total_preference_score = sum(assignment.priority_score for assignment in schedule)
         avg_preference_score = total_preference_score / len(schedule) if schedule else 0
         
-        logger.info(f"FINAL RESULTS:")
-        logger.info(f"  Total slots: {total_slots}")
-        logger.info(f"  Break slots: {break_slot_count}")
-        logger.info(f"  Available slots: {total_available_slots}")
-        logger.info(f"  Assigned slots: {len(schedule)}")
-        logger.info(f"  Unassigned slots: {len(unassigned_slots)}")
-        logger.info(f"  Fitness: {fitness:.3f}")
-        logger.info(f"  Avg preference score: {avg_preference_score:.1f}")
+        logger.info("Final results: total_slots=%d break_slots=%d available_slots=%d assigned=%d unassigned=%d "
+                    "fitness=%.3f avg_preference_score=%.1f", total_slots, break_slot_count, total_available_slots,
+                    len(schedule), len(unassigned_slots), fitness, avg_preference_score)
         
         # Generate tabular format
-        tabular_schedule = self._generate_tabular_schedule(weekly_schedule)
+        tabular_schedule = self._generate_tabular_schedule(room_schedules)
         
         # Save schedule to history
         schedule_data = {
@@ -568,10 +1084,12 @@ class SchedulerService:
         }
         self.schedule_history.append(schedule_data)
 
-        return {
+        result = {
             "weekly_schedule": {
                 "time_slots": self.time_slot_labels,
-                "days": weekly_schedule
+                # "days" keeps the single-room shape (the first room) for existing clients
+                "days": room_schedules[self.single_room_id],
+                "rooms": room_schedules
             },
             "tabular_schedule": tabular_schedule,
             "unassigned": unassigned_slots,
@@ -582,11 +1100,22 @@ class SchedulerService:
             "total_available_slots": total_available_slots,
             "utilization_percentage": round((len(schedule) / total_available_slots) * 100, 1) if total_available_slots > 0 else 0
         }
-    
-    def _generate_tabular_schedule(self, weekly_schedule: Dict[str, List[Any]]) -> Dict[str, Any]:
+        # Why required classes are missing, from the grid and occupancy indexes rather than another search
+        result["unassigned_classes"] = explain_unassigned(input_data, self.problem, schedule, self.fixed_slots,
+                                                          self.block_index, self._booked)
+        for explanation in result["unassigned_classes"]:
+            logger.warning("Unassigned %d class(es) of %s: %s (%s)", explanation["missing"],
+                           explanation["subject_name"], explanation["reason"], explanation["message"])
+        load_tracker = load_tracker or self.load_tracker
+        if load_tracker is not None:
+            result["soft_constraints"] = {"penalty": load_tracker.penalty, "breakdown": load_tracker.breakdown()}
+        return result
+
+    def _generate_tabular_schedule(self, room_schedules: Dict[str, Dict[str, List[Any]]]) -> Dict[str, Any]:
         """Generate a tabular representation of the schedule."""
         # Create headers
         headers = ["Time Slot"] + VALID_DAYS
+        multi_room = len(room_schedules) > 1
         
         # Create rows
         rows = []
@@ -594,16 +1123,19 @@ class SchedulerService:
             row = [time_slot]
             
             for day in VALID_DAYS:
-                assignment = weekly_schedule[day][i]
-                if assignment:
-                    cell = f"{assignment['subject_name']}\n{assignment['faculty_name']}"
-                else:
-                    cell = "---"
+                entries = []
+                for room, weekly_schedule in room_schedules.items():
+                    assignment = weekly_schedule[day][i]
+                    if assignment:
+                        entry = f"{assignment['subject_name']}\n{assignment['faculty_name']}"
+                        entries.append(f"{entry}\n{room}" if multi_room else entry)
+                cell = "\n".join(entries) if entries else "---"
                 row.append(cell)
             
             rows.append(row)
         
-        # Create HTML table
+        # Create HTML table; tabulate is only needed here, so keep it off the import path
+        import tabulate
         html_table = tabulate.tabulate(rows, headers=headers, tablefmt="html")
         
         # Create text table
@@ -613,6 +1145,269 @@ class SchedulerService:
             "html": html_table,
         }
     
+    def validate_batch(self, batch: BatchScheduleInput) -> None:
+        """Validate every section of a batch before any of them is solved."""
+        if not batch.sections:
+            raise ValueError("At least one section must be provided.")
+        pool_ids = set()
+        for f_idx, faculty in enumerate(batch.faculty):
+            if faculty.id in pool_ids:
+                raise ValueError(f"Duplicate faculty id in shared faculty pool: {faculty.id}")
+            pool_ids.add(faculty.id)
+            for a_idx, avail in enumerate(faculty.availability):
+                self._validate_time(avail.startTime, f"faculty[{f_idx}].availability[{a_idx}].startTime")
+                self._validate_time(avail.endTime, f"faculty[{f_idx}].availability[{a_idx}].endTime")
+        seen_ids = set()
+        for section in batch.sections:
+            if section.section_id in seen_ids:
+                raise ValueError(f"Duplicate section_id in batch: {section.section_id}")
+            seen_ids.add(section.section_id)
+            try:
+                self._validate_input(section.schedule_input)
+            except ValueError as e:
+                raise ValueError(f"Section {section.section_id}: {e}")
+            if not section.schedule_input.rooms:
+                raise ValueError(f"Section {section.section_id}: At least one room must be provided.")
+
+    def _resolve_section_input(self, section: SectionInput, faculty_pool: Dict[str, Faculty]) -> ScheduleInput:
+        """Replace section-local faculty with their shared-pool definitions, matched by id."""
+        if not faculty_pool:
+            return section.schedule_input
+        subjects = [
+            dataclasses.replace(subject, faculty=[faculty_pool.get(f.id, f) for f in subject.faculty])
+            for subject in section.schedule_input.subjects
+        ]
+        return dataclasses.replace(section.schedule_input, subjects=subjects)
+
+    def _plan_section_waves(self, batch: BatchScheduleInput) -> List[List[SectionInput]]:
+        """Group sections into waves that share no faculty and no rooms.
+
+        Sections are placed most-contended first, each into the earliest wave
+        holding none of its neighbours. Sections within one wave only compete
+        with bookings from earlier waves, so they are independent of each other.
+        """
+        resources = {}
+        for section in batch.sections:
+            faculty_ids = {f.id for subject in section.schedule_input.subjects for f in subject.faculty}
+            rooms = set(section.schedule_input.rooms)
+            resources[section.section_id] = {f"F:{fid}" for fid in faculty_ids} | {f"R:{room}" for room in rooms}
+
+        holders = defaultdict(set)
+        for section_id, section_resources in resources.items():
+            for resource in section_resources:
+                holders[resource].add(section_id)
+
+        neighbours = {
+            section_id: set().union(*(holders[r] for r in section_resources)) - {section_id}
+            for section_id, section_resources in resources.items()
+        }
+
+        def contention(section: SectionInput):
+            required = sum(s.no_of_classes_per_week for s in section.schedule_input.subjects)
+            return (-len(neighbours[section.section_id]), -required)
+
+        waves: List[List[SectionInput]] = []
+        wave_members: List[set] = []
+        for section in sorted(batch.sections, key=contention):
+            for wave, members in zip(waves, wave_members):
+                if not (members & neighbours[section.section_id]):
+                    wave.append(section)
+                    members.add(section.section_id)
+                    break
+            else:
+                waves.append([section])
+                wave_members.append({section.section_id})
+        return waves
+
+    def _iter_solved_sections(self, batch: BatchScheduleInput, waves: List[List[SectionInput]], use_ga: bool) -> Iterator[Dict[str, Any]]:
+        """Solve sections wave by wave against one shared occupancy index, yielding section/error records."""
+        faculty_pool = {f.id: f for f in batch.faculty}
+        self._reset_tracking()
+
+        for wave in waves:
+            for section in wave:
+                self.timings = SolveTimings()
+                try:
+                    result = self._solve(self._resolve_section_input(section, faculty_pool), use_ga)
+                    TIMING_HISTOGRAMS.observe(self.timings)
+                except ValueError as e:
+                    logger.error("Section %s failed: %s", section.section_id, e)
+                    yield {"type": "error", "section_id": section.section_id, "detail": str(e)}
+                    continue
+
+                # The HTML table is only needed by /api/schedule-table; leave it out of the stream
+                record = {key: value for key, value in result.items() if key != "tabular_schedule"}
+                record["type"] = "section"
+                record["section_id"] = section.section_id
+                yield record
+
+    def _iter_components_in_pool(self, batch: BatchScheduleInput, components: List[List[SectionInput]], use_ga: bool,
+                                 max_workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Solve independent components in a process pool, yielding each component's records as it finishes.
+
+        Section timings solved in the workers are folded into this process's TIMING_HISTOGRAMS.
+        """
+        logger.info("Solving components=%d in a process pool", len(components))
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_solve_component, BatchScheduleInput(sections=component, faculty=batch.faculty), use_ga)
+                for component in components
+            ]
+            for future in as_completed(futures):
+                records, history, timings = future.result()
+                self.schedule_history.extend(history)
+                for section_timings in timings:
+                    TIMING_HISTOGRAMS.observe(section_timings)
+                yield from records
+
+    def _track_batch_solve(self, records: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Count a batch as one running solve until its last section record is produced."""
+        with SCHEDULER_METRICS.track_solve():
+            yield from records
+
+    def iter_section_schedules(self, batch: BatchScheduleInput, use_ga: bool = False, parallel: bool = False,
+                               max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Solve a batch without double-booking faculty or rooms, yielding each section as soon as it is ready.
+
+        Sections are solved wave by wave (see _plan_section_waves). With
+        parallel=True the batch is first split into components that share no
+        faculty and no rooms, and components are solved concurrently in a
+        process pool. A summary record follows the last section.
+        """
+        waves = self._plan_section_waves(batch)
+        components = find_independent_components(batch) if parallel else [batch.sections]
+        if len(components) > 1:
+            records = self._iter_components_in_pool(batch, components, use_ga, max_workers)
+        else:
+            records = self._iter_solved_sections(batch, waves, use_ga)
+        records = self._track_batch_solve(records)
+
+        solved = 0
+        failed_sections = []
+        total_assignments = 0
+        fitness_sum = 0.0
+        utilization_sum = 0.0
+        started = datetime.now()
+
+        engine = "ga" if use_ga else "greedy"
+        for record in records:
+            if record["type"] == "error":
+                failed_sections.append(record["section_id"])
+            else:
+                SCHEDULER_METRICS.record_solve(engine, record["fitness"])
+                solved += 1
+                total_assignments += record["total_assignments"]
+                fitness_sum += record["fitness"]
+                utilization_sum += record["utilization_percentage"]
+            yield record
+
+        yield {
+            "type": "summary",
+            "sections": len(batch.sections),
+            "solved_sections": solved,
+            "failed_sections": failed_sections,
+            "waves": [[section.section_id for section in wave] for wave in waves],
+            "components": [[section.section_id for section in component] for component in components],
+            "total_assignments": total_assignments,
+            "average_fitness": fitness_sum / solved if solved else 0.0,
+            "average_utilization_percentage": round(utilization_sum / solved, 1) if solved else 0,
+            "elapsed_seconds": round((datetime.now() - started).total_seconds(), 3)
+        }
+
+    def generate_batch_schedule(self, batch: BatchScheduleInput, use_ga: bool = False, parallel: bool = False,
+                                max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Solve a whole batch of sections in one pass and return every section keyed by section_id."""
+        self.validate_batch(batch)
+        solved_sections = {}
+        errors = {}
+        summary = {}
+        for record in self.iter_section_schedules(batch, use_ga, parallel, max_workers):
+            record_type = record.pop("type")
+            if record_type == "section":
+                solved_sections[record.pop("section_id")] = record
+            elif record_type == "error":
+                errors[record["section_id"]] = record["detail"]
+            else:
+                summary = record
+        # Components finish in any order; report sections in batch order
+        sections = {s.section_id: solved_sections[s.section_id] for s in batch.sections if s.section_id in solved_sections}
+        return {"sections": sections, "errors": errors, "summary": summary}
+
     def get_schedule_history(self) -> List[Dict]:
         """Return the history of generated schedules."""
         return self.schedule_history
+
+    def get_history_entry(self, index: int) -> Dict[str, Any]:
+        """One history entry; negative indexes count from the latest (-1)."""
+        if not -len(self.schedule_history) <= index < len(self.schedule_history):
+            raise ValueError(f"No schedule history entry {index}; history has {len(self.schedule_history)} entries")
+        return self.schedule_history[index]
+
+    def diff_history(self, base: int, target: Optional[int] = None,
+                     candidate: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Diff history entry `base` against history entry `target` or against a candidate schedule."""
+        before = self.get_history_entry(base)["schedule"]
+        after = candidate if candidate is not None else self.get_history_entry(-1 if target is None else target)["schedule"]
+        return diff_schedules(before, after)
+
+def _solve_component(batch: BatchScheduleInput, use_ga: bool) -> Tuple[List[Dict[str, Any]], List[Dict], List[SolveTimings]]:
+    """Process-pool worker: solve one independent component on a fresh service.
+
+    TIMING_HISTOGRAMS is per process, so each solved section's timings are
+    returned for the parent to observe.
+    """
+    service = SchedulerService()
+    records, timings = [], []
+    for record in service.iter_section_schedules(batch, use_ga):
+        if record["type"] == "section":
+            timings.append(service.timings)
+        if record["type"] != "summary":
+            records.append(record)
+    return records, service.schedule_history, timings
+
+_FILL_STATE: Optional[Tuple[SchedulerService, List[Subject], ScheduleInput, set]] = None
+
+def _init_fill_worker(service: SchedulerService, subjects: List[Subject], input_data: ScheduleInput,
+                      assigned_slots: set) -> None:
+    """Process-pool initializer: keep the Phase 1 snapshot for every day this worker fills."""
+    global _FILL_STATE
+    _FILL_STATE = (service, subjects, input_data, assigned_slots)
+
+def _fill_day_worker(day_slots: List[TimeSlot], subject_counts: Dict[str, int]) -> Tuple[List[ScheduleAssignment], Dict[str, int]]:
+    """Process-pool worker: run both Phase 2 fill passes for a single day on a copy of the Phase 1 state.
+
+    Bookings left over from another day this worker filled never clash with
+    this day, and the day's quota replaces the subject counts.
+    """
+    service, subjects, input_data, assigned_slots = _FILL_STATE
+    service.timings = SolveTimings()
+    service.subject_counts = subject_counts
+    new_assignments = []
+    service._fill_preferred_pass(day_slots, subjects, input_data, new_assignments, assigned_slots)
+    service._fill_any_faculty_pass(day_slots, subjects, input_data, new_assignments, assigned_slots)
+    return new_assignments, dict(service.timings.counters)
+
+def warm_up(input_data: Optional[ScheduleInput] = None, include_ga: bool = True) -> Dict[str, Any]:
+    """Load the lazily imported engine and rendering modules and prime per-input caches.
+
+    With input_data, the input is validated and solved once with the greedy
+    engine on a throwaway service, which builds its slot grid, room index and
+    time parsing cache without touching schedule history or solve metrics.
+    Returns the timings block of the warm-up.
+    """
+    timings = SolveTimings()
+    with timings.span("imports"):
+        import tabulate  # noqa: F401
+        if include_ga:
+            from genetic_algorithm import _ensure_deap_types
+            _ensure_deap_types()
+
+    if input_data is not None:
+        service = SchedulerService()
+        service.timings = timings
+        with timings.span("validation"):
+            problem = service._validate_input(input_data)
+        service._reset_tracking()
+        service._solve(input_data, use_ga=False, problem=problem)
+    return timings.as_dict()
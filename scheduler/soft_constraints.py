@@ -0,0 +1,141 @@
+from bisect import insort
+from collections import defaultdict
+from typing import Collection, Dict, Iterable, List, Optional, Set, Tuple
+from model import SoftConstraints, ScheduleAssignment, Subject
+from intervals import IntervalSet, Window
+from utils import BreakIndex, time_to_minutes
+
+# Classes at most this many minutes apart count as back to back; a short break is no rest
+BACK_TO_BACK_GAP = 10
+# Idle time between classes is penalised per whole standard period
+IDLE_PERIOD_MINUTES = 50
+
+DayTerms = Tuple[int, int, int]  # (periods over the daily limit, periods over the run limit, idle periods)
+
+_NO_BREAKS = IntervalSet()
+
+class LoadTracker:
+    """Soft-constraint penalty of a schedule, kept up to date as classes are booked and unbooked.
+
+    Counters live per (faculty_id, day) and per (subject_name, day). Booking
+    a class only marks its faculty-day for rescoring, so the penalty after a
+    change costs one pass over that day's few classes instead of a rescan of
+    the whole schedule, and delta() prices a candidate class the same way.
+    """
+
+    def __init__(self, config: SoftConstraints, breaks: Optional[BreakIndex] = None):
+        self.config = config
+        self.breaks = breaks or {}
+        self._classes: Dict[Tuple[str, str], List[Window]] = defaultdict(list)  # (faculty_id, day) -> sorted
+        self._terms: Dict[Tuple[str, str], DayTerms] = {}
+        self._dirty: Set[Tuple[str, str]] = set()
+        self._totals = [0, 0, 0]
+        self._subject_days: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._repeated_days = 0  # classes beyond the first of a subject on the same day
+
+    def book(self, faculty_id: str, subject_name: Optional[str], day: str, start: int, end: int,
+             count: bool = True) -> None:
+        """Record a class; subject_name None (another section's booking) or count=False (extra periods of a
+        block) leave the subject spread untouched."""
+        insort(self._classes[(faculty_id, day)], (start, end))
+        self._dirty.add((faculty_id, day))
+        if subject_name is not None and count:
+            self._repeated_days += self._subject_days[(subject_name, day)] > 0
+            self._subject_days[(subject_name, day)] += 1
+
+    def unbook(self, faculty_id: str, subject_name: Optional[str], day: str, start: int, end: int,
+               count: bool = True) -> None:
+        """Undo a book() with the same arguments."""
+        classes = self._classes[(faculty_id, day)]
+        if (start, end) not in classes:
+            return
+        classes.remove((start, end))
+        self._dirty.add((faculty_id, day))
+        if subject_name is not None and count and self._subject_days[(subject_name, day)] > 0:
+            self._subject_days[(subject_name, day)] -= 1
+            self._repeated_days -= self._subject_days[(subject_name, day)] > 0
+
+    def _day_terms(self, day: str, classes: Iterable[Window]) -> DayTerms:
+        config = self.config
+        classes = list(classes)
+        extra = 0
+        if config.max_periods_per_day is not None:
+            extra = max(0, len(classes) - config.max_periods_per_day)
+        over_run, idle, run, previous_end = 0, 0, 0, None
+        for start, end in classes:
+            if previous_end is not None and start - previous_end <= BACK_TO_BACK_GAP:
+                run += 1
+            else:
+                if previous_end is not None and config.minimize_gaps:
+                    # Breaks are nobody's idle time
+                    idle += start - previous_end - self.breaks.get(day, _NO_BREAKS).covered(previous_end, start)
+                run = 1
+            if config.max_consecutive_periods is not None and run > config.max_consecutive_periods:
+                over_run += 1
+            previous_end = end
+        return extra, over_run, idle // IDLE_PERIOD_MINUTES
+
+    def day_terms(self, day: str, classes: Iterable[Window]) -> DayTerms:
+        """Penalty units of one faculty member's sorted classes on a day, without booking them."""
+        return self._day_terms(day, classes)
+
+    def _refresh(self, key: Tuple[str, str]) -> DayTerms:
+        if key in self._dirty:
+            self._dirty.discard(key)
+            old = self._terms.get(key, (0, 0, 0))
+            new = self._day_terms(key[1], self._classes[key])
+            for i in range(3):
+                self._totals[i] += new[i] - old[i]
+            self._terms[key] = new
+        return self._terms.get(key, (0, 0, 0))
+
+    def breakdown(self) -> Dict[str, int]:
+        """Penalty units per soft constraint."""
+        for key in list(self._dirty):
+            self._refresh(key)
+        return {
+            "daily_load": self._totals[0],
+            "consecutive": self._totals[1],
+            "idle_gaps": self._totals[2],
+            "subject_spread": self._repeated_days if self.config.spread_subjects else 0,
+        }
+
+    @property
+    def penalty(self) -> int:
+        """Total weighted soft-constraint penalty of everything booked."""
+        return self.config.weight * sum(self.breakdown().values())
+
+    def delta(self, faculty_id: str, subject_name: Optional[str], day: str, windows: Iterable[Window]) -> int:
+        """How much the penalty would grow if the faculty member taught the windows (one class) on the day."""
+        key = (faculty_id, day)
+        current = self._refresh(key)
+        classes = list(self._classes.get(key, ()))
+        for window in windows:
+            insort(classes, window)
+        units = sum(self._day_terms(day, classes)) - sum(current)
+        if self.config.spread_subjects and subject_name is not None and self._subject_days.get((subject_name, day), 0) > 0:
+            units += 1
+        return self.config.weight * units
+
+    @classmethod
+    def from_schedule(cls, config: SoftConstraints, breaks: Optional[BreakIndex], schedule: Iterable[ScheduleAssignment],
+                      subjects: Dict[str, Subject], faculty_ids: Collection[str]) -> "LoadTracker":
+        """A tracker with every class of a finished schedule booked; placeholders and unknown faculty are skipped.
+
+        Back-to-back periods of a consecutive-period subject count as one
+        class for the subject spread, like the engines book them.
+        """
+        tracker = cls(config, breaks)
+        block_ends: Dict[Tuple[str, str, str], int] = {}
+        for a in sorted(schedule, key=lambda a: (a.day, time_to_minutes(a.startTime))):
+            if a.faculty_id not in faculty_ids:
+                continue
+            start, end = time_to_minutes(a.startTime), time_to_minutes(a.endTime)
+            subject = subjects.get(a.subject_name)
+            count = True
+            if subject is not None and subject.requires_consecutive:
+                key = (a.subject_name, a.faculty_id, a.day)
+                count = block_ends.get(key) != start
+                block_ends[key] = end
+            tracker.book(a.faculty_id, a.subject_name, a.day, start, end, count=count)
+        return tracker
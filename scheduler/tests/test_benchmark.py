@@ -0,0 +1,41 @@
+import sys
+import os
+import dataclasses
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from instance_generator import generate_instance
+from benchmark import run_benchmark
+
+# Test Case 64: The instance generator is reproducible for a given seed
+def test_generate_instance_is_seeded():
+    first = generate_instance(num_subjects=8, num_faculty=4, num_rooms=2, seed=7)
+    second = generate_instance(num_subjects=8, num_faculty=4, num_rooms=2, seed=7)
+    other = generate_instance(num_subjects=8, num_faculty=4, num_rooms=2, seed=8)
+    assert dataclasses.asdict(first) == dataclasses.asdict(second)
+    assert dataclasses.asdict(first) != dataclasses.asdict(other)
+    assert len(first.subjects) == 8
+    assert first.rooms == ["R1", "R2"]
+    assert all(subject.faculty for subject in first.subjects)
+
+# Test Case 65: Availability density controls how much faculty time is offered
+def test_generate_instance_availability_density():
+    def offered_windows(density):
+        instance = generate_instance(num_subjects=4, num_faculty=4, availability_density=density, seed=1)
+        return sum(len(f.availability) for s in instance.subjects for f in s.faculty)
+    assert offered_windows(0.0) == 0
+    assert offered_windows(1.0) > 0
+
+# Test Case 66: Benchmark report rows carry timing, memory and quality metrics
+def test_run_benchmark_report():
+    report = run_benchmark(sizes=["small"], engines=["greedy"], seeds=[0])
+    assert len(report["results"]) == 1
+    row = report["results"][0]
+    assert row["engine"] == "greedy"
+    assert row["wall_time_seconds"] > 0
+    assert row["peak_memory_kib"] > 0
+    assert 0 <= row["real_utilization_percentage"] <= row["utilization_percentage"]
+    with pytest.raises(ValueError):
+        run_benchmark(sizes=["huge"], engines=["greedy"], seeds=[0])
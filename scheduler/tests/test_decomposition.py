@@ -0,0 +1,57 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, BatchScheduleInput, SectionInput
+from decomposition import find_independent_components
+from scheduler import SchedulerService
+
+def section(section_id, faculty_ids, rooms):
+    return SectionInput(section_id=section_id, schedule_input=ScheduleInput(
+        subjects=[
+            Subject(name=f"Subject {fid}", time=50, no_of_classes_per_week=2,
+                    faculty=[Faculty(id=fid, name=f"Faculty {fid}", availability=[TimeSlot(day="MONDAY", startTime="09:00", endTime="12:00")])])
+            for fid in faculty_ids
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=rooms
+    ))
+
+# Test Case 61: Sections linked through faculty or rooms end up in one component
+def test_find_independent_components():
+    batch = BatchScheduleInput(sections=[
+        section("A", ["T1"], ["R1"]),
+        section("B", ["T2"], ["R2"]),
+        section("C", ["T1"], ["R3"]),
+        section("D", ["T3"], ["R2"]),
+        section("E", ["T4"], ["R4"])
+    ])
+    components = [[s.section_id for s in component] for component in find_independent_components(batch)]
+    assert components == [["A", "C"], ["B", "D"], ["E"]]
+
+# Test Case 62: Parallel component solve matches the serial solve
+def test_parallel_batch_matches_serial():
+    batch = BatchScheduleInput(sections=[
+        section("A", ["T1"], ["R1"]),
+        section("B", ["T2"], ["R2"]),
+        section("C", ["T1", "T3"], ["R3"])
+    ])
+    serial = SchedulerService().generate_batch_schedule(batch)
+    parallel_service = SchedulerService()
+    parallel = parallel_service.generate_batch_schedule(batch, parallel=True, max_workers=2)
+    assert list(parallel["sections"]) == ["A", "B", "C"]
+    assert parallel["summary"]["components"] == [["A", "C"], ["B"]]
+    for section_id in ["A", "B", "C"]:
+        assert parallel["sections"][section_id]["weekly_schedule"] == serial["sections"][section_id]["weekly_schedule"]
+    assert len(parallel_service.get_schedule_history()) == 3
+
+# Test Case 121: Timings of sections solved in worker processes reach this process's histograms
+def test_parallel_batch_records_worker_timings():
+    from instrumentation import TIMING_HISTOGRAMS
+    batch = BatchScheduleInput(sections=[section("A", ["T1"], ["R1"]), section("B", ["T2"], ["R2"])])
+    before = TIMING_HISTOGRAMS.snapshot()["spans"].get("phase1", {}).get("count", 0)
+    SchedulerService().generate_batch_schedule(batch, parallel=True, max_workers=2)
+    assert TIMING_HISTOGRAMS.snapshot()["spans"]["phase1"]["count"] == before + 2
@@ -0,0 +1,85 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, SectionInput, BatchScheduleInput
+from scheduler import SchedulerService
+from explanations import SLOTS_TAKEN, BREAK_OVERLAP, FACULTY_UNAVAILABLE, OFF_GRID
+
+def make_subject(name, faculty_id, availability):
+    return Subject(name=name, time=50, no_of_classes_per_week=1,
+                   faculty=[Faculty(id=faculty_id, name=faculty_id, availability=availability)])
+
+# Test Case 111: A class squeezed out by another names the cell and the assignment holding it
+def test_slots_taken_names_blocking_assignment():
+    monday = [TimeSlot("MONDAY", "09:00", "09:50")]
+    input_data = ScheduleInput(
+        subjects=[make_subject("Math", "T1", monday), make_subject("Physics", "T2", monday)],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="09:50"),
+        rooms=["R1"]
+    )
+    for use_ga in (False, True):
+        service = SchedulerService()
+        result = service.generate_schedule(input_data, use_ga=use_ga)
+        placed = service.schedule_history[-1]["schedule"][0]["subject_name"]
+        squeezed, faculty_id = ("Physics", "T2") if placed == "Math" else ("Math", "T1")
+        [explanation] = result["unassigned_classes"]
+        assert (explanation["subject_name"], explanation["missing"], explanation["reason"]) == (squeezed, 1, SLOTS_TAKEN)
+        assert explanation["blocking_assignments"] == [0]
+        assert explanation["candidates"] == [{"day": "MONDAY", "startTime": "09:00", "endTime": "09:50",
+                                              "faculty_id": faculty_id, "faculty_busy": [], "rooms_taken": {"R1": [0]}}]
+
+# Test Case 112: Availability problems are told apart without searching
+def test_availability_reasons():
+    input_data = ScheduleInput(
+        subjects=[
+            make_subject("Math", "T1", [TimeSlot("MONDAY", "09:00", "10:40")]),
+            make_subject("Lab", "T2", [TimeSlot("MONDAY", "10:20", "11:30")]),   # 50 minutes only across the break
+            make_subject("Art", "T3", [TimeSlot("MONDAY", "15:00", "17:00")]),   # after college hours
+            make_subject("Bio", "T4", [TimeSlot("MONDAY", "09:30", "10:30")]),   # long enough, but between grid slots
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="11:00")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=["R1"]
+    )
+    result = SchedulerService().generate_schedule(input_data)
+    reasons = {e["subject_name"]: e["reason"] for e in result["unassigned_classes"]}
+    assert reasons == {"Lab": BREAK_OVERLAP, "Art": FACULTY_UNAVAILABLE, "Bio": OFF_GRID}
+
+# Test Case 113: A batch section blocked by an earlier section points at the other section
+def test_other_section_holds_faculty():
+    monday = [TimeSlot("MONDAY", "09:00", "09:50")]
+
+    def section(section_id, room):
+        return SectionInput(section_id, ScheduleInput(
+            subjects=[make_subject("Math", "T1", monday)],
+            break_=[],
+            college_time=CollegeTime(startTime="09:00", endTime="09:50"),
+            rooms=[room]
+        ))
+
+    result = SchedulerService().generate_batch_schedule(BatchScheduleInput([section("A", "R1"), section("B", "R2")]))
+    assert result["sections"]["A"]["unassigned_classes"] == []
+    [explanation] = result["sections"]["B"]["unassigned_classes"]
+    assert explanation["reason"] == SLOTS_TAKEN
+    assert explanation["candidates"][0]["faculty_busy"] == ["other_section"]
+    assert explanation["blocking_assignments"] == []
+
+# Test Case 116: Messages about consecutive-period subjects speak of blocks
+def test_block_message_wording():
+    input_data = ScheduleInput(
+        subjects=[
+            make_subject("Math", "T1", [TimeSlot("TUESDAY", "09:00", "11:30")]),
+            Subject(name="Lab", time=100, no_of_classes_per_week=2, requires_consecutive=True,
+                    faculty=[Faculty(id="T2", name="T2", availability=[TimeSlot("MONDAY", "09:00", "11:30")])]),
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="11:30"),
+        rooms=["R1"]
+    )
+    [explanation] = SchedulerService().generate_schedule(input_data)["unassigned_classes"]
+    assert (explanation["subject_name"], explanation["reason"]) == ("Lab", SLOTS_TAKEN)
+    assert explanation["message"] == "All 2 candidate blocks of consecutive periods of Lab are taken"
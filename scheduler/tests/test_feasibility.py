@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime
+from scheduler import SchedulerService
+from feasibility import InfeasibleScheduleError
+
+def make_input(math_classes=1, physics_classes=1, rooms=("R1",)):
+    monday = [TimeSlot("MONDAY", "09:00", "09:50")]
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=math_classes, faculty=[Faculty(id="T1", name="Alice", availability=monday)]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=physics_classes, faculty=[Faculty(id="T2", name="Bob", availability=monday)]),
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="09:50"),
+        rooms=list(rooms)
+    )
+
+# Test Case 108: An input that fits is reported feasible with every class placeable
+def test_feasible_input():
+    report = SchedulerService().analyze_feasibility(make_input(rooms=("R1", "R2")))
+    assert report["feasible"], report["issues"]
+    assert report["placeable_regular_classes"] == report["required_classes"] == 2
+    assert report["subjects"]["Math"] == {"required": 1, "candidate_slots": 1, "upper_bound": 1}
+
+# Test Case 109: Subjects that each fit alone but compete for one cell fail Hall's condition
+def test_hall_violation_names_competing_subjects():
+    report = SchedulerService().analyze_feasibility(make_input())
+    assert not report["feasible"]
+    assert [issue["type"] for issue in report["issues"]] == ["hall_violation"]
+    assert report["issues"][0]["subjects"] == ["Math", "Physics"]
+    assert (report["issues"][0]["required"], report["issues"][0]["capacity"]) == (2, 1)
+
+# Test Case 110: With check_feasibility a hopeless input fails before any search
+def test_generate_fails_fast_on_infeasible_input():
+    service = SchedulerService()
+    with pytest.raises(InfeasibleScheduleError) as error:
+        service.generate_schedule(make_input(math_classes=3), use_ga=True, check_feasibility=True)
+    types = {issue["type"] for issue in error.value.report["issues"]}
+    assert {"subject_capacity", "faculty_capacity"} <= types
+    assert "ga.init" not in service.timings.as_dict()["spans_ms"]
+    assert service.schedule_history == []
+
+# Test Case 114: The legacy endpoint never runs the feasibility gate
+def test_legacy_endpoint_skips_feasibility_gate():
+    import dataclasses
+    from fastapi.testclient import TestClient
+    from main import app
+    payload = dataclasses.asdict(make_input())
+    client = TestClient(app)
+    response = client.post("/generate_schedule", json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json()["unassigned_classes"][0]["subject_name"] in ("Math", "Physics")
+    assert client.post("/api/generate-schedule?check_feasibility=true", json=payload).status_code == 422
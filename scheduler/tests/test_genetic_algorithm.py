@@ -125,4 +125,55 @@ def test_ga_multiple_rooms():
     ga = GeneticAlgorithm(input_data, pop_size=10, generations=5)
     schedule, fitness = ga.run()
     assert len(schedule) == 2
-    assert fitness == 0
\ No newline at end of file
+    assert fitness == 0
+# Test Case 60: GA genes carry a room chosen from every available room
+def test_ga_assigns_rooms_from_all_rooms():
+    from utils import generate_weekly_time_slots
+    input_data = ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=1, faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50")])]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=1, faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50")])])
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="09:50"),
+        rooms=["R1", "R2"]
+    )
+    _, fixed_slots = generate_weekly_time_slots("09:00", "09:50", [], input_data.subjects)
+    ga = GeneticAlgorithm(input_data, fixed_slots, pop_size=6, generations=3, rooms=input_data.rooms)
+    schedule, _ = ga.run()
+    assert sorted(a.subject_name for a in schedule) == ["Math", "Physics"]
+    assert sorted(a.room_id for a in schedule) == ["R1", "R2"]
+
+# Test Case 104: NSGA-II mode returns a small, mutually non-dominated front in one run
+def test_ga_pareto_front():
+    import random
+    from utils import generate_weekly_time_slots
+    from model import PreferredSlot
+    random.seed(2)
+    days = ["MONDAY", "TUESDAY"]
+    input_data = ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=2,
+                    preferred_slots=[PreferredSlot(day="MONDAY", startTime="09:00", endTime="10:40")],
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day, "09:00", "12:20") for day in days]),
+                             Faculty(id="T2", name="Bob", availability=[TimeSlot(day, "09:00", "12:20") for day in days])]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=2,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot(day, "09:00", "12:20") for day in days])]),
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="12:20"),
+        rooms=["R1"]
+    )
+    _, fixed_slots = generate_weekly_time_slots("09:00", "12:20", [], input_data.subjects)
+    ga = GeneticAlgorithm(input_data, fixed_slots, pop_size=12, generations=4, rooms=input_data.rooms)
+    front = ga.run_pareto(front_size=3)
+    assert 1 <= len(front) <= 3
+    objectives = [values for _, values in front]
+    assert objectives == sorted(objectives, key=lambda v: (v[0], -v[1], v[2]))
+    for i, a in enumerate(objectives):
+        for b in objectives[i + 1:]:
+            assert not (b[0] <= a[0] and b[1] >= a[1] and b[2] <= a[2])
+            assert not (a[0] <= b[0] and a[1] >= b[1] and a[2] <= b[2])
+    schedule, values = front[0]
+    assert values == ga._objectives(schedule)
+    assert sum(a.priority_score for a in schedule) == values[1]
@@ -0,0 +1,52 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import TimeSlot
+from indexes import RoomSlotIndex, ConsecutiveBlockIndex
+
+def grid():
+    return [
+        TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50"),
+        TimeSlot(day="MONDAY", startTime="09:50", endTime="10:40"),
+        TimeSlot(day="TUESDAY", startTime="09:00", endTime="09:50")
+    ]
+
+# Test Case 56: Booking a room removes it only from overlapping grid slots
+def test_room_index_book_removes_room_from_overlapping_slots():
+    index = RoomSlotIndex(["R1", "R2"], grid())
+    index.book("R1", TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50"))
+    assert index.first_free_room(TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50")) == "R2"
+    assert index.free_rooms(TimeSlot(day="MONDAY", startTime="09:50", endTime="10:40")) == ["R1", "R2"]
+    assert index.is_free("R1", TimeSlot(day="TUESDAY", startTime="09:00", endTime="09:50"))
+
+# Test Case 57: Releasing a booking restores the room in input order
+def test_room_index_release_restores_room_order():
+    index = RoomSlotIndex(["R1", "R2"], grid())
+    slot = TimeSlot(day="MONDAY", startTime="09:00", endTime="09:50")
+    index.book("R1", slot)
+    index.book("R2", slot)
+    assert index.first_free_room(slot) is None
+    index.release("R1", slot)
+    assert index.free_rooms(slot) == ["R1"]
+
+# Test Case 58: Off-grid slots fall back to the per-room bookings
+def test_room_index_off_grid_slot():
+    index = RoomSlotIndex(["R1", "R2"], grid())
+    index.book("R1", TimeSlot(day="MONDAY", startTime="09:00", endTime="10:40"))
+    assert index.free_rooms(TimeSlot(day="MONDAY", startTime="09:30", endTime="10:00")) == ["R2"]
+    assert index.free_rooms(TimeSlot(day="MONDAY", startTime="09:50", endTime="10:40")) == ["R2"]
+
+# Test Case 101: Consecutive blocks chain adjacent periods only and stop at breaks
+def test_consecutive_blocks_split_at_breaks():
+    periods = [("09:00", "09:50"), ("09:50", "10:40"), ("10:40", "11:30"), ("11:40", "12:30"), ("12:30", "13:20")]
+    index = ConsecutiveBlockIndex([TimeSlot(day="MONDAY", startTime=start, endTime=end) for start, end in periods])
+    blocks = index.blocks("MONDAY", 100)
+    assert [(span.startTime, span.endTime) for _, span in blocks] == [("09:00", "10:40"), ("09:50", "11:30"), ("11:40", "13:20")]
+    assert [mask for mask, _ in blocks] == [0b00011, 0b00110, 0b11000]
+    assert index.blocks("MONDAY", 200) == []
+    assert index.blocks("TUESDAY", 100) == []
+    assert index.mask("MONDAY", 600, 700) == 0b00110
+    assert [p.startTime for p in index.periods("MONDAY", blocks[1][0])] == ["09:50", "10:40"]
@@ -0,0 +1,82 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import SolveTimings, TimingHistograms
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+
+# Test Case 67: Spans with the same name accumulate and counters add up
+def test_solve_timings_accumulate():
+    timings = SolveTimings()
+    with timings.span("phase"):
+        pass
+    first = timings.spans["phase"]
+    with timings.span("phase"):
+        pass
+    timings.count("checks")
+    timings.count("checks", 2)
+    timings.merge_counters({"checks": 4, "other": 1})
+    assert timings.spans["phase"] >= first
+    assert timings.as_dict()["counters"] == {"checks": 7, "other": 1}
+
+# Test Case 68: Histogram buckets are cumulative and end with +Inf
+def test_timing_histograms_snapshot():
+    histograms = TimingHistograms(buckets_ms=(1, 10, float("inf")))
+    fast, slow = SolveTimings(), SolveTimings()
+    fast.spans["phase1"] = 0.0005
+    slow.spans["phase1"] = 0.5
+    slow.count("conflict_checks", 3)
+    histograms.observe(fast)
+    histograms.observe(slow)
+    snapshot = histograms.snapshot()
+    assert snapshot["spans"]["phase1"]["buckets_ms"] == [
+        {"le": 1, "count": 1},
+        {"le": 10, "count": 1},
+        {"le": "+Inf", "count": 2},
+    ]
+    assert snapshot["spans"]["phase1"]["count"] == 2
+    assert snapshot["counters"] == {"conflict_checks": 3}
+
+# Test Case 69: Timings are only returned when requested
+def test_generate_schedule_include_timings():
+    service = SchedulerService()
+    input_data = generate_instance(num_subjects=4, num_faculty=2, num_rooms=1, seed=3)
+    assert "timings" not in service.generate_schedule(input_data)
+
+    result = service.generate_schedule(input_data, include_timings=True)
+    timings = result["timings"]
+    for span in ("validation", "slot_generation", "phase1", "rendering"):
+        assert span in timings["spans_ms"]
+    assert timings["counters"]["conflict_checks"] > 0
+    assert timings["total_ms"] >= timings["spans_ms"]["phase1"]
+
+# Test Case 75: Hot-loop detail logs are gated on DEBUG and sampled
+def test_detail_log_gating_and_sampling(caplog):
+    import logging
+    from instrumentation import DetailLog
+    logger = logging.getLogger("scheduler.test_detail")
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        detail = DetailLog(logger)
+        assert not detail.enabled
+        detail("never %s", "shown")
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        detail = DetailLog(logger, sample_every=3)
+        for i in range(7):
+            detail("item %d", i)
+    assert [record.getMessage() for record in caplog.records] == ["item 0", "item 3", "item 6"]
+
+# Test Case 76: A solve logs per-phase summaries at INFO, not one line per assignment
+def test_solve_info_logging_is_summarised(caplog):
+    import logging
+    input_data = generate_instance(num_subjects=8, num_faculty=4, num_rooms=2, seed=5)
+    with caplog.at_level(logging.INFO):
+        result = SchedulerService().generate_schedule(input_data)
+    info_lines = [record for record in caplog.records if record.levelno == logging.INFO]
+    assert result["total_assignments"] > len(info_lines)
+    assert len(info_lines) <= 6
@@ -0,0 +1,42 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import TimeSlot, Break
+from intervals import IntervalSet, merge_intervals
+from utils import build_break_index, check_break_conflict
+
+# Test Case 83: Overlapping and adjacent windows merge; empty ones are dropped
+def test_merge_intervals():
+    windows = [(780, 900), (540, 600), (600, 660), (570, 620), (700, 700), (950, 900)]
+    assert merge_intervals(windows) == [(540, 660), (780, 900)]
+
+    availability = IntervalSet(windows)
+    assert len(availability) == 2
+    # A class spanning two adjacent windows fits in the merged one
+    assert availability.contains(580, 640)
+    assert availability.contains(540, 660)
+    assert not availability.contains(650, 790)
+    assert not availability.contains(500, 560)
+    assert not IntervalSet().contains(540, 600)
+
+# Test Case 84: Overlap checks are half-open and match the linear break check
+def test_interval_overlap_and_break_index():
+    breaks = IntervalSet([(660, 670), (780, 840)])
+    assert breaks.overlaps(650, 661)
+    assert breaks.overlaps(790, 800)
+    assert not breaks.overlaps(600, 660)  # ends as the break starts
+    assert not breaks.overlaps(670, 780)  # fits between the breaks
+    assert not breaks.overlaps(900, 960)
+
+    break_list = [Break(day="ALL_DAYS", startTime="11:00", endTime="11:10"),
+                  Break(day="FRIDAY", startTime="13:00", endTime="14:00")]
+    index = build_break_index(break_list)
+    for day in ("MONDAY", "FRIDAY"):
+        for start, end in [("10:00", "11:00"), ("10:30", "11:30"), ("13:30", "14:30"), ("14:00", "15:00")]:
+            slot = TimeSlot(day=day, startTime=start, endTime=end)
+            assert check_break_conflict(slot, index) == check_break_conflict(slot, break_list)
+    assert check_break_conflict(TimeSlot(day="FRIDAY", startTime="13:30", endTime="14:30"), index)
+    assert not check_break_conflict(TimeSlot(day="MONDAY", startTime="13:30", endTime="14:30"), index)
@@ -0,0 +1,71 @@
+import sys
+import os
+from functools import lru_cache
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from metrics import Counter, Gauge, Histogram, MetricsRegistry, SCHEDULER_METRICS
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+
+# Test Case 70: Metrics render in the Prometheus text format with escaped labels
+def test_metric_rendering():
+    requests = Counter("requests_total", "Requests.", ("endpoint",))
+    requests.inc(endpoint='/a"b')
+    requests.inc(2, endpoint='/a"b')
+    in_flight = Gauge("in_flight", "In flight.")
+    latency = Histogram("latency_seconds", "Latency.", ("engine",), buckets=(0.1, 1))
+    latency.observe(0.05, engine="greedy")
+    latency.observe(5, engine="greedy")
+
+    assert requests.render() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{endpoint="/a\\"b"} 3',
+    ]
+    assert in_flight.samples() == ["in_flight 0"]
+    assert latency.samples() == [
+        'latency_seconds_bucket{engine="greedy",le="0.1"} 1',
+        'latency_seconds_bucket{engine="greedy",le="1"} 1',
+        'latency_seconds_bucket{engine="greedy",le="+Inf"} 2',
+        'latency_seconds_sum{engine="greedy"} 5.05',
+        'latency_seconds_count{engine="greedy"} 2',
+    ]
+    with pytest.raises(ValueError):
+        requests.inc(engine="ga")
+
+# Test Case 71: Queue depth and cache hit ratio are derived at render time
+def test_registry_queue_depth_and_cache_ratio():
+    registry = MetricsRegistry()
+
+    @lru_cache(maxsize=None)
+    def square(x):
+        return x * x
+
+    square(2)
+    square(2)
+    square(3)
+    registry.register_cache("square", square)
+    with registry.track_request(), registry.track_request(), registry.track_solve():
+        text = registry.render()
+    assert "scheduler_queue_depth 1\n" in text
+    assert 'scheduler_cache_hit_ratio{cache="square"} 0.3333333333333333' in text
+    assert "scheduler_solves_in_flight 0\n" in registry.render()
+
+# Test Case 72: Every solve is counted with its engine and final fitness
+def test_solves_are_recorded():
+    before = SCHEDULER_METRICS.render()
+    SchedulerService().generate_schedule(generate_instance(num_subjects=4, num_faculty=2, num_rooms=1, seed=3))
+    after = SCHEDULER_METRICS.render()
+
+    def solves(text):
+        for line in text.splitlines():
+            if line.startswith('scheduler_solves_total{engine="greedy"}'):
+                return float(line.split()[-1])
+        return 0
+
+    assert solves(after) == solves(before) + 1
+    assert 'scheduler_solve_fitness_count{engine="greedy"}' in after
+    assert "scheduler_solves_in_flight 0\n" in after
@@ -0,0 +1,61 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, PreferredSlot
+from problem import normalize_input
+
+def make_input(availability=None, breaks=None):
+    faculty = Faculty(id="F1", name="Alice", availability=availability or [
+        TimeSlot(day="MONDAY", startTime="09:00", endTime="12:00"),
+        TimeSlot(day="MONDAY", startTime="1:00 PM", endTime="3:00 PM"),
+    ])
+    return ScheduleInput(
+        subjects=[Subject(name="Math", time=50, no_of_classes_per_week=2, faculty=[faculty])],
+        break_=breaks if breaks is not None else [Break(day="ALL_DAYS", startTime="11:00", endTime="11:10")],
+        college_time=CollegeTime(startTime="09:00", endTime="15:00"),
+        rooms=["R1"],
+    )
+
+# Test Case 81: Times are parsed once into minutes, with ALL_DAYS breaks expanded per day
+def test_normalize_input_parses_minutes():
+    problem = normalize_input(make_input())
+    assert (problem.college_start, problem.college_end) == (540, 900)
+    assert list(problem.availability["F1"]["MONDAY"]) == [(540, 720), (780, 900)]
+    assert all(list(problem.breaks[day]) == [(660, 670)] for day in problem.breaks)
+    assert problem.is_available("F1", "MONDAY", 780, 830)
+    assert not problem.is_available("F1", "MONDAY", 700, 750)
+    assert not problem.is_available("F2", "MONDAY", 540, 590)
+    assert problem.overlaps_break("FRIDAY", 650, 700)
+    slots = [TimeSlot("MONDAY", "09:00", "09:50"), TimeSlot("TUESDAY", "09:00", "09:50"), TimeSlot("MONDAY", "13:00", "13:40")]
+    assert problem.valid_slots("F1", slots, 50) == [slots[0]]
+
+# Test Case 82: Malformed input is rejected with the exact field path
+def test_normalize_input_field_paths():
+    bad_availability = [TimeSlot(day="MONDAY", startTime="09:00", endTime="12:00"),
+                        TimeSlot(day="MONDAY", startTime="9.30", endTime="12:00")]
+    with pytest.raises(ValueError, match=r"subjects\[0\]\.faculty\[0\]\.availability\[1\]\.startTime: '9\.30'"):
+        normalize_input(make_input(availability=bad_availability))
+    with pytest.raises(ValueError, match=r"break_\[0\]\.endTime"):
+        normalize_input(make_input(breaks=[Break(day="MONDAY", startTime="11:00", endTime="25:00")]))
+    with pytest.raises(ValueError, match=r"break_\[0\]\.day"):
+        normalize_input(make_input(breaks=[Break(day="FUNDAY", startTime="11:00", endTime="11:10")]))
+    input_data = make_input()
+    input_data.college_time = CollegeTime(startTime="nine", endTime="15:00")
+    with pytest.raises(ValueError, match=r"college_time\.startTime"):
+        normalize_input(input_data)
+
+# Test Case 122: Malformed subject and faculty preferred slots are rejected with their field paths
+def test_normalize_input_preferred_slot_paths():
+    input_data = make_input()
+    input_data.subjects[0].preferred_slots = [PreferredSlot(day="MONDAY", startTime="09:00", endTime="10 o'clock")]
+    with pytest.raises(ValueError, match=r"subjects\[0\]\.preferred_slots\[0\]\.endTime"):
+        normalize_input(input_data)
+    input_data = make_input()
+    input_data.subjects[0].faculty[0].preferred_slots = [PreferredSlot(day="ANY_DAY", startTime="09:00", endTime="10:00"),
+                                                         PreferredSlot(day="ANY_DAY", startTime="", endTime="10:00")]
+    with pytest.raises(ValueError, match=r"subjects\[0\]\.faculty\[0\]\.preferred_slots\[1\]\.startTime"):
+        normalize_input(input_data)
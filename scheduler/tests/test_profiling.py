@@ -0,0 +1,37 @@
+import sys
+import os
+import marshal
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from profiling import profile_call, ProfileStore
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+
+# Test Case 73: Profiling a solve returns the result plus the hottest functions
+def test_profile_call_reports_cumulative_functions():
+    service = SchedulerService()
+    input_data = generate_instance(num_subjects=4, num_faculty=2, num_rooms=1, seed=3)
+    result, report = profile_call(service.generate_schedule, input_data, top_n=5)
+    assert result["total_assignments"] > 0
+    assert len(report["cumulative"]) == 5
+    assert "generate_schedule" in report["cumulative"][0]["function"]
+    cumtimes = [row["cumtime_ms"] for row in report["cumulative"]]
+    assert cumtimes == sorted(cumtimes, reverse=True)
+    assert "allocations" not in report
+
+# Test Case 74: Memory tracing and pstats dumps are opt-in
+def test_profile_call_memory_and_store():
+    store = ProfileStore(max_profiles=1)
+    _, report = profile_call(lambda: [bytearray(1024) for _ in range(100)], top_n=3, trace_memory=True, store=store)
+    assert report["allocations"] and report["peak_traced_kb"] > 0
+    stats = marshal.loads(store.get(report["pstats_id"]))
+    assert any(name == "<lambda>" for _, _, name in stats)
+
+    _, second = profile_call(lambda: None, store=store)
+    assert store.get(report["pstats_id"]) is None
+    assert store.get(second["pstats_id"]) is not None
+    with pytest.raises(ValueError):
+        profile_call(lambda: None, top_n=0)
@@ -0,0 +1,44 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from recording import anonymise_input, TraceRecorder, read_trace
+from replay import replay_trace
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+
+# Test Case 77: Anonymisation replaces ids consistently and keeps the instance shape
+def test_anonymise_input():
+    input_data = generate_instance(num_subjects=6, num_faculty=3, num_rooms=2, seed=9)
+    data = anonymise_input(input_data)
+
+    original_ids = [f.id for s in input_data.subjects for f in s.faculty]
+    pseudonyms = [f["id"] for s in data["subjects"] for f in s["faculty"]]
+    # Same faculty -> same pseudonym, different faculty -> different pseudonyms
+    assert len(set(zip(original_ids, pseudonyms))) == len(set(original_ids)) == len(set(pseudonyms))
+    assert data["rooms"] == ["R1", "R2"]
+    assert [s["name"] for s in data["subjects"]] == [f"S{i + 1}" for i in range(6)]
+    assert data["subjects"][0]["faculty"][0]["availability"] == \
+        [{"day": a.day, "startTime": a.startTime, "endTime": a.endTime} for a in input_data.subjects[0].faculty[0].availability]
+
+# Test Case 78: Recorded requests replay against the service with fitness deltas
+def test_record_and_replay(tmp_path):
+    trace = tmp_path / "trace.jsonl"
+    recorder = TraceRecorder(str(trace))
+    input_data = generate_instance(num_subjects=4, num_faculty=2, num_rooms=1, seed=3)
+    result = SchedulerService().generate_schedule(input_data)
+    recorder.record(input_data, "greedy", False, 42, 0.01, result)
+
+    entries = list(read_trace(str(trace)))
+    assert len(entries) == 1
+    assert entries[0]["seed"] == 42 and entries[0]["fitness"] == result["fitness"]
+
+    report = replay_trace(str(trace))
+    assert report["summary"]["entries"] == 1
+    assert report["results"][0]["fitness_delta"] == 0
+    assert report["summary"]["fitness_regressions"] == 0
+    with pytest.raises(ValueError):
+        TraceRecorder(str(trace), sample_rate=0)
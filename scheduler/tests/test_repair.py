@@ -0,0 +1,105 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from model import (ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, ScheduleAssignment,
+                   ScheduleDelta, FacultyAvailabilityChange)
+from repair import apply_delta
+from scheduler import SchedulerService
+from utils import check_time_conflict
+
+def make_input(rooms=("R1", "R2")):
+    days = ["MONDAY", "TUESDAY", "WEDNESDAY"]
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=3,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day, "09:00", "12:00") for day in days])]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=2,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot(day, "09:00", "12:00") for day in days])]),
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="10:50")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=list(rooms)
+    )
+
+def solve(input_data):
+    service = SchedulerService()
+    service.generate_schedule(input_data)
+    return service, [ScheduleAssignment(**a) for a in service.schedule_history[-1]["schedule"]]
+
+# Test Case 88: Without a delta every assignment is kept in place
+def test_repair_without_delta_keeps_schedule():
+    input_data = make_input()
+    service, schedule = solve(input_data)
+    result = service.repair_schedule(input_data, schedule)
+    assert result["repair"]["moved"] == [] and result["repair"]["unplaced"] == []
+    assert result["repair"]["kept"] == sum(1 for a in schedule if a.faculty_id in ("T1", "T2"))
+    assert service.schedule_history[-1]["schedule"] == [a.model_dump() for a in schedule]
+
+# Test Case 89: Only classes broken by an availability change move, and they stay conflict-free
+def test_repair_moves_only_broken_classes():
+    input_data = make_input()
+    service, schedule = solve(input_data)
+    delta = ScheduleDelta(faculty_availability=[FacultyAvailabilityChange(
+        "T1", [TimeSlot(day, "09:00", "12:00") for day in ["TUESDAY", "WEDNESDAY"]])])
+    result = service.repair_schedule(input_data, schedule, delta, max_radius=10)
+    report = result["repair"]
+
+    broken = [a for a in schedule if a.faculty_id == "T1" and a.day == "MONDAY"]
+    assert len(report["moved"]) + len(report["unplaced"]) + len(report["dropped"]) == len(broken)
+    assert all(m["before"]["day"] == "MONDAY" and m["after"]["day"] != "MONDAY" for m in report["moved"])
+    assert all(m["reason"] == "faculty_unavailable" for m in report["moved"])
+    assert report["unplaced"] == []
+
+    repaired = [ScheduleAssignment(**a) for a in service.schedule_history[-1]["schedule"]]
+    untouched = [a for a in schedule if a not in broken and a.faculty_id in ("T1", "T2")]
+    assert all(a in repaired for a in untouched)
+    for i, a in enumerate(repaired):
+        for b in repaired[i + 1:]:
+            slot_a, slot_b = TimeSlot(a.day, a.startTime, a.endTime), TimeSlot(b.day, b.startTime, b.endTime)
+            if check_time_conflict(slot_a, slot_b):
+                assert a.room_id != b.room_id and a.faculty_id != b.faculty_id
+
+# Test Case 90: Deltas are validated and never modify the original input
+def test_apply_delta_validates_and_copies():
+    input_data = make_input()
+    updated = apply_delta(input_data, ScheduleDelta(rooms_offline=["R2"],
+                                                    breaks_added=[Break(day="MONDAY", startTime="09:00", endTime="09:50")]))
+    assert updated.rooms == ["R1"] and input_data.rooms == ["R1", "R2"]
+    assert len(updated.break_) == 2 and len(input_data.break_) == 1
+    with pytest.raises(ValueError, match=r"delta\.rooms_offline\[0\]"):
+        apply_delta(input_data, ScheduleDelta(rooms_offline=["R9"]))
+    with pytest.raises(ValueError, match=r"delta\.faculty_availability\[0\]\.faculty_id"):
+        apply_delta(input_data, ScheduleDelta(faculty_availability=[FacultyAvailabilityChange("T9", [])]))
+
+# Test Case 115: A consecutive-period block is re-placed whole and counted once
+def test_repair_moves_block_as_one_class():
+    input_data = ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=1,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]),
+            Subject(name="Lab", time=100, no_of_classes_per_week=1, requires_consecutive=True,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]),
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="10:50")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=["R1"]
+    )
+    service, schedule = solve(input_data)
+    assert sum(a.subject_name == "Lab" and a.day == "MONDAY" for a in schedule) == 2
+    delta = ScheduleDelta(faculty_availability=[FacultyAvailabilityChange("T2", [TimeSlot("TUESDAY", "09:00", "12:00")])])
+    result = service.repair_schedule(input_data, schedule, delta, max_radius=10)
+    report = result["repair"]
+
+    assert report["unplaced"] == [] and len(report["moved"]) == 1
+    move = report["moved"][0]
+    assert (move["before"]["day"], move["before"]["startTime"], move["before"]["endTime"]) == ("MONDAY", "09:00", "10:40")
+    assert (move["after"]["day"], move["after"]["startTime"], move["after"]["endTime"]) == ("TUESDAY", "09:00", "10:40")
+    labs = sorted((a["startTime"], a["endTime"], a["room_id"])
+                  for a in service.schedule_history[-1]["schedule"] if a["subject_name"] == "Lab")
+    assert labs == [("09:00", "09:50", "R1"), ("09:50", "10:40", "R1")]
+    assert service.subject_counts["Lab"] == 1
+    assert "Lab" not in {e["subject_name"] for e in result["unassigned_classes"]}
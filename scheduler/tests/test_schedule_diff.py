@@ -0,0 +1,51 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from model import ScheduleAssignment, PLACEHOLDER_SUBJECT
+from scheduler import SchedulerService
+from schedule_diff import diff_schedules
+
+def entry(subject, faculty_id, day, start, end, room):
+    return ScheduleAssignment(subject, faculty_id, faculty_id, day, start, end, room).model_dump()
+
+BEFORE = [
+    entry("Math", "T1", "MONDAY", "09:00", "09:50", "R1"),
+    entry("Physics", "T2", "MONDAY", "09:50", "10:40", "R1"),
+    entry("Chemistry", "T3", "TUESDAY", "09:00", "09:50", "R1"),
+    entry("Biology", "T4", "TUESDAY", "09:50", "10:40", "R1"),
+    entry(PLACEHOLDER_SUBJECT, "VF1", "FRIDAY", "09:00", "09:50", "R1"),
+]
+
+# Test Case 99: Unchanged, reassigned, moved, added and removed classes are told apart
+def test_diff_schedules_categories():
+    after = [
+        entry("Math", "T1", "MONDAY", "09:00", "09:50", "R1"),         # unchanged
+        entry("Physics", "T5", "MONDAY", "09:50", "10:40", "R1"),      # reassigned T2 -> T5
+        entry("Chemistry", "T3", "WEDNESDAY", "11:00", "11:50", "R2"),  # moved
+        entry("History", "T6", "TUESDAY", "09:50", "10:40", "R1"),      # added; Biology removed
+        entry(PLACEHOLDER_SUBJECT, "VF7", "SATURDAY", "09:00", "09:50", "R1"),
+    ]
+    diff = diff_schedules(BEFORE, after)
+    assert diff["summary"] == {"unchanged": 1, "added": 1, "removed": 1, "moved": 1, "reassigned": 1}
+    assert diff["reassigned"][0]["from_faculty"] == "T2" and diff["reassigned"][0]["to_faculty"] == "T5"
+    assert diff["moved"][0]["from"]["day"] == "TUESDAY" and diff["moved"][0]["to"]["room_id"] == "R2"
+    assert [a["subject_name"] for a in diff["added"]] == ["History"]
+    assert [a["subject_name"] for a in diff["removed"]] == ["Biology"]
+    assert diff["faculty_impact"]["T2"]["lost"] == 1 and diff["faculty_impact"]["T5"]["gained"] == 1
+    assert diff["faculty_impact"]["T3"]["moved"] == 1
+    assert "T1" not in diff["faculty_impact"]
+    assert diff_schedules(BEFORE, after, include_placeholders=True)["summary"]["moved"] == 2
+
+# Test Case 100: History entries are diffed by index, and bad indexes are rejected
+def test_diff_history_entries():
+    service = SchedulerService()
+    service.schedule_history = [{"schedule": BEFORE}, {"schedule": BEFORE[1:]}]
+    diff = service.diff_history(-2, -1)
+    assert diff["summary"]["removed"] == 1 and diff["summary"]["unchanged"] == 3
+    assert service.diff_history(0, candidate=BEFORE)["summary"]["unchanged"] == 4
+    with pytest.raises(ValueError):
+        service.diff_history(5)
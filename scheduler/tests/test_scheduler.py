@@ -8,7 +8,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 import pytest
-from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break
+import random
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, BatchScheduleInput, SectionInput
 from scheduler import SchedulerService
 
 @pytest.fixture
@@ -235,4 +236,199 @@ def test_csp_soft_constraint_optimization():
     )
     scheduler = SchedulerService()
     result = scheduler.generate_schedule(input_data, use_ga=False)
-    assert result["fitness"] == 0  # Should pick preferred slot
\ No newline at end of file
+    assert result["fitness"] == 0  # Should pick preferred slot
+def make_section_input(faculty_id="T1", subject_name="Math", rooms=None):
+    return ScheduleInput(
+        subjects=[
+            Subject(
+                name=subject_name,
+                time=50,
+                no_of_classes_per_week=2,
+                faculty=[Faculty(id=faculty_id, name=f"Faculty {faculty_id}", availability=[TimeSlot(day=day, startTime="09:00", endTime="12:00") for day in ["MONDAY", "TUESDAY"]])]
+            )
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="10:50")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=rooms or ["R1"]
+    )
+
+# Test Case 51: Streamed sections arrive in order followed by a summary
+def test_iter_section_schedules_streams_sections_then_summary():
+    batch = BatchScheduleInput(sections=[
+        SectionInput(section_id="A", schedule_input=make_section_input("T1")),
+        SectionInput(section_id="B", schedule_input=make_section_input("T2", "Physics"))
+    ])
+    scheduler = SchedulerService()
+    records = list(scheduler.iter_section_schedules(batch))
+    assert [r["type"] for r in records] == ["section", "section", "summary"]
+    assert [r["section_id"] for r in records[:2]] == ["A", "B"]
+    assert "tabular_schedule" not in records[0]
+    assert records[-1]["solved_sections"] == 2
+    assert records[-1]["total_assignments"] == records[0]["total_assignments"] + records[1]["total_assignments"]
+
+# Test Case 52: Duplicate section ids are rejected before solving
+def test_validate_batch_rejects_duplicate_sections():
+    batch = BatchScheduleInput(sections=[
+        SectionInput(section_id="A", schedule_input=make_section_input()),
+        SectionInput(section_id="A", schedule_input=make_section_input())
+    ])
+    with pytest.raises(ValueError):
+        SchedulerService().validate_batch(batch)
+
+# Test Case 53: Shared faculty is never double-booked across sections
+def test_batch_schedule_shares_faculty_occupancy():
+    batch = BatchScheduleInput(sections=[
+        SectionInput(section_id="A", schedule_input=make_section_input("T1", rooms=["R1"])),
+        SectionInput(section_id="B", schedule_input=make_section_input("T1", rooms=["R2"]))
+    ])
+    result = SchedulerService().generate_batch_schedule(batch)
+    assert set(result["sections"]) == {"A", "B"}
+    booked = set()
+    for section in result["sections"].values():
+        for day, cells in section["weekly_schedule"]["days"].items():
+            for cell in cells:
+                if cell and cell["faculty_id"] == "T1":
+                    key = (day, cell["startTime"])
+                    assert key not in booked
+                    booked.add(key)
+
+# Test Case 54: Sections sharing no faculty or rooms land in the same wave
+def test_batch_schedule_groups_independent_sections_into_waves():
+    batch = BatchScheduleInput(sections=[
+        SectionInput(section_id="A", schedule_input=make_section_input("T1", rooms=["R1"])),
+        SectionInput(section_id="B", schedule_input=make_section_input("T2", rooms=["R2"])),
+        SectionInput(section_id="C", schedule_input=make_section_input("T1", rooms=["R3"]))
+    ])
+    waves = SchedulerService().generate_batch_schedule(batch)["summary"]["waves"]
+    assert len(waves) == 2
+    assert any(set(wave) >= {"B"} and len(wave) == 2 for wave in waves)
+
+# Test Case 55: Shared faculty pool overrides section-local availability
+def test_batch_schedule_uses_shared_faculty_pool():
+    pool = [Faculty(id="T1", name="Pool T1", availability=[TimeSlot(day="MONDAY", startTime="09:00", endTime="10:40")])]
+    batch = BatchScheduleInput(
+        sections=[SectionInput(section_id="A", schedule_input=make_section_input("T1"))],
+        faculty=pool
+    )
+    section = SchedulerService().generate_batch_schedule(batch)["sections"]["A"]
+    t1_cells = [cell for cells in section["weekly_schedule"]["days"].values() for cell in cells if cell and cell["faculty_id"] == "T1"]
+    assert t1_cells
+    assert all(cell["day"] == "MONDAY" and cell["faculty_name"] == "Pool T1" for cell in t1_cells)
+
+# Test Case 59: Every room is scheduled, without double-booking any faculty
+def test_greedy_schedules_all_rooms():
+    input_data = make_section_input(rooms=["R1", "R2"])
+    input_data.subjects.append(Subject(
+        name="Physics", time=50, no_of_classes_per_week=2,
+        faculty=[Faculty(id="T2", name="Faculty T2", availability=[TimeSlot(day="MONDAY", startTime="09:00", endTime="12:00")])]
+    ))
+    result = SchedulerService().generate_schedule(input_data)
+    rooms = result["weekly_schedule"]["rooms"]
+    assert set(rooms) == {"R1", "R2"}
+    assert result["weekly_schedule"]["days"] == rooms["R1"]
+    monday_r2 = [cell for cell in rooms["R2"]["MONDAY"] if cell]
+    assert any(not cell["faculty_id"].startswith("VF") for cell in monday_r2)
+    for idx in range(len(result["weekly_schedule"]["time_slots"])):
+        faculty_ids = [rooms[room]["MONDAY"][idx]["faculty_id"] for room in rooms if rooms[room]["MONDAY"][idx]]
+        assert len(faculty_ids) == len(set(faculty_ids))
+
+# Test Case 63: Per-day parallel fill books the same cells as the serial fill
+def test_parallel_days_fill_matches_serial():
+    input_data = make_section_input(rooms=["R1", "R2"])
+    input_data.subjects.append(Subject(
+        name="Physics", time=50, no_of_classes_per_week=1,
+        faculty=[Faculty(id="T2", name="Faculty T2", availability=[TimeSlot(day=day, startTime="09:00", endTime="12:00") for day in ["MONDAY", "WEDNESDAY"]])]
+    ))
+    serial = SchedulerService().generate_schedule(input_data)
+    parallel = SchedulerService().generate_schedule(input_data, parallel_days=True)
+    assert parallel["total_assignments"] == serial["total_assignments"]
+    assert parallel["unassigned"] == serial["unassigned"]
+    for room, days in parallel["weekly_schedule"]["rooms"].items():
+        for day, cells in days.items():
+            real = [(c["subject_name"], c["faculty_id"]) for c in cells if c and not c["faculty_id"].startswith("VF")]
+            expected = [(c["subject_name"], c["faculty_id"]) for c in serial["weekly_schedule"]["rooms"][room][day] if c and not c["faculty_id"].startswith("VF")]
+            assert real == expected
+
+# Test Case 120: Parallel day workers split each subject's missing classes evenly instead of all chasing the weekly gap
+def test_parallel_days_split_missing_classes_across_days():
+    input_data = make_section_input()
+    input_data.subjects[0].no_of_classes_per_week = 5
+    service = SchedulerService()
+    service.subject_counts = {"Math": 1}
+    day_counts = service._day_quota_counts(input_data.subjects, 3)
+    # 4 classes missing over 3 days: 2, 1 and 1 left to place
+    assert [5 - counts["Math"] for counts in day_counts] == [2, 1, 1]
+    assert service.subject_counts == {"Math": 1}
+    parallel = SchedulerService().generate_schedule(input_data, parallel_days=True)
+    assert parallel["total_assignments"] == SchedulerService().generate_schedule(input_data)["total_assignments"]
+
+# Test Case 79: Warm-up primes caches without recording a schedule
+def test_warm_up_primes_without_side_effects():
+    from scheduler import warm_up
+    from instance_generator import generate_instance
+    from metrics import SCHEDULER_METRICS
+    solves_before = SCHEDULER_METRICS.solves.samples()
+    timings = warm_up(generate_instance(num_subjects=4, num_faculty=2, num_rooms=1, seed=3))
+    assert {"imports", "validation", "slot_generation", "phase1"} <= set(timings["spans_ms"])
+    assert SCHEDULER_METRICS.solves.samples() == solves_before
+
+# Test Case 80: Importing the service does not load GA or rendering machinery
+def test_cold_import_is_lazy():
+    import subprocess
+    code = (
+        "import sys, scheduler, genetic_algorithm, deap.creator; "
+        "assert 'tabulate' not in sys.modules; "
+        "assert 'concurrent.futures.process' not in sys.modules; "
+        "assert not hasattr(deap.creator, 'FitnessMin')"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+    # The API module must not pull in the GA either
+    code = (
+        "import sys, main; "
+        "assert 'genetic_algorithm' not in sys.modules; "
+        "assert 'deap' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+def make_lab_input():
+    days = ["MONDAY", "TUESDAY", "WEDNESDAY"]
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=3,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day, "09:00", "13:00") for day in days])]),
+            Subject(name="Lab", time=150, no_of_classes_per_week=2, requires_consecutive=True,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot(day, "09:00", "13:00") for day in days])]),
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="11:30", endTime="11:40")],
+        college_time=CollegeTime(startTime="09:00", endTime="13:00"),
+        rooms=["R1", "R2"]
+    )
+
+def lab_blocks(schedule):
+    """(day, room) -> sorted (start, end) periods of the Lab subject."""
+    blocks = {}
+    for a in schedule:
+        if a["subject_name"] == "Lab":
+            blocks.setdefault((a["day"], a["room_id"]), []).append((a["startTime"], a["endTime"]))
+    return {key: sorted(periods) for key, periods in blocks.items()}
+
+# Test Case 102: Both engines place consecutive subjects as whole blocks of adjacent periods in one room
+@pytest.mark.parametrize("use_ga", [False, True])
+def test_consecutive_subject_placed_as_blocks(use_ga):
+    from validation import validate_schedule
+    from model import ScheduleAssignment
+    random.seed(4)
+    input_data = make_lab_input()
+    service = SchedulerService()
+    result = service.generate_schedule(input_data, use_ga=use_ga)
+    assert "09:50-10:40" in result["weekly_schedule"]["time_slots"]
+    schedule = service.schedule_history[-1]["schedule"]
+    blocks = lab_blocks(schedule)
+    assert len(blocks) == 2
+    for periods in blocks.values():
+        assert periods == [("09:00", "09:50"), ("09:50", "10:40"), ("10:40", "11:30")]
+    report = validate_schedule(input_data, [ScheduleAssignment(**a) for a in schedule])
+    assert report["valid"], report["violations"]
+    # Each block is booked as one class, so later batch sections see the real counts
+    assert service.subject_counts["Lab"] == 2
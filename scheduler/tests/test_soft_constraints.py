@@ -0,0 +1,87 @@
+import sys
+import os
+import random
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, SoftConstraints
+from intervals import IntervalSet
+from scheduler import SchedulerService
+from soft_constraints import LoadTracker
+
+def minutes(hhmm):
+    hours, mins = hhmm.split(":")
+    return int(hours) * 60 + int(mins)
+
+# Test Case 105: Each soft constraint is counted per faculty-day, and breaks are not idle time
+def test_tracker_counts_each_constraint():
+    config = SoftConstraints(max_periods_per_day=3, max_consecutive_periods=2, minimize_gaps=True, spread_subjects=True)
+    tracker = LoadTracker(config, {"MONDAY": IntervalSet([(minutes("11:30"), minutes("11:40"))])})
+    for start, end in [("09:00", "09:50"), ("09:50", "10:40"), ("10:40", "11:30"), ("11:40", "12:30"), ("14:10", "15:00")]:
+        tracker.book("T1", "Math", "MONDAY", minutes(start), minutes(end))
+    # 5 classes against a limit of 3; a run of 4 (the 10-minute break does not end it); 100 idle minutes
+    assert tracker.breakdown() == {"daily_load": 2, "consecutive": 2, "idle_gaps": 2, "subject_spread": 4}
+    assert tracker.penalty == 10 * 10
+
+# Test Case 106: Incremental counters match a tracker rebuilt from scratch, and delta prices one booking
+def test_tracker_incremental_matches_rebuild():
+    random.seed(5)
+    config = SoftConstraints(max_periods_per_day=2, max_consecutive_periods=1, minimize_gaps=True, spread_subjects=True)
+    tracker = LoadTracker(config)
+    booked = []
+    for _ in range(60):
+        if booked and random.random() < 0.3:
+            tracker.unbook(*booked.pop(random.randrange(len(booked))))
+            continue
+        start = random.choice(range(540, 900, 50))
+        item = (random.choice(["T1", "T2"]), random.choice(["Math", "Physics"]), random.choice(["MONDAY", "TUESDAY"]), start, start + 50)
+        before = tracker.penalty
+        predicted = tracker.delta(item[0], item[1], item[2], [item[3:]])
+        tracker.book(*item)
+        booked.append(item)
+        assert tracker.penalty - before == predicted
+    rebuilt = LoadTracker(config)
+    for item in booked:
+        rebuilt.book(*item)
+    assert tracker.breakdown() == rebuilt.breakdown()
+
+# Test Case 107: With spread_subjects the greedy engine puts a subject's classes on different days
+def test_greedy_spreads_subjects_across_days():
+    availability = [TimeSlot("MONDAY", "09:00", "10:40"), TimeSlot("TUESDAY", "09:00", "10:40")]
+    input_data = ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=2, faculty=[Faculty(id="T1", name="Alice", availability=availability)]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=2, faculty=[Faculty(id="T2", name="Bob", availability=availability)]),
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="10:40"),
+        rooms=["R1"],
+        soft_constraints=SoftConstraints(spread_subjects=True)
+    )
+    service = SchedulerService()
+    result = service.generate_schedule(input_data)
+    days = {}
+    for a in service.schedule_history[-1]["schedule"]:
+        days.setdefault(a["subject_name"], []).append(a["day"])
+    assert sorted(days["Math"]) == ["MONDAY", "TUESDAY"]
+    assert sorted(days["Physics"]) == ["MONDAY", "TUESDAY"]
+    assert result["soft_constraints"]["breakdown"]["subject_spread"] == 0
+
+# Test Case 117: The GA's cached per-faculty-day soft penalty matches a tracker rebuilt from the schedule
+def test_ga_soft_penalty_matches_full_rescan():
+    from instance_generator import generate_instance
+    from genetic_algorithm import GeneticAlgorithm
+    input_data = generate_instance(num_subjects=10, num_faculty=4, num_rooms=2, seed=5)
+    input_data.soft_constraints = SoftConstraints(max_periods_per_day=2, max_consecutive_periods=1,
+                                                  minimize_gaps=True, spread_subjects=True)
+    service = SchedulerService()
+    service._prepare_solve(input_data)
+    ga = GeneticAlgorithm(input_data=input_data, fixed_slots=service.fixed_slots, pop_size=4, generations=1,
+                          rooms=input_data.rooms, problem=service.problem, conflict_checker=service._is_valid_assignment)
+    random.seed(3)
+    for _ in range(10):
+        individual = ga._create_individual()
+        rebuilt = LoadTracker.from_schedule(input_data.soft_constraints, service.problem.breaks, individual,
+                                            ga.subjects, service.problem.faculty)
+        assert ga._soft_penalty(individual) == rebuilt.penalty
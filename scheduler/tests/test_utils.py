@@ -0,0 +1,42 @@
+import sys
+import os
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import Subject, Break
+from utils import generate_weekly_time_slots, sweep_day_grid, duration_demand
+
+def make_subject(name, time, classes=2):
+    return Subject(name=name, time=time, no_of_classes_per_week=classes, faculty=[])
+
+# Test Case 85: Day-specific breaks only shape their own day's grid
+def test_weekly_grid_uses_each_days_breaks():
+    breaks = [Break(day="ALL_DAYS", startTime="11:00", endTime="11:10"),
+              Break(day="FRIDAY", startTime="09:50", endTime="10:40")]
+    labels, slots = generate_weekly_time_slots("09:00", "12:30", breaks, [make_subject("Math", 50)])
+    by_day = {}
+    for slot in slots:
+        by_day.setdefault(slot.day, []).append(f"{slot.startTime}-{slot.endTime}")
+    assert by_day["MONDAY"] == ["09:00-09:50", "09:50-10:40", "11:30-12:20"]
+    assert by_day["FRIDAY"] == ["09:00-09:50", "11:30-12:20"]
+    assert labels == by_day["MONDAY"]
+
+# Test Case 86: Longer durations keep slots of their own on a mixed grid
+def test_sweep_grid_mixed_durations():
+    demand = duration_demand([make_subject("Math", 50, 4), make_subject("Lab", 100, 2)])
+    assert demand == ((50, 200), (100, 200))
+    grid = sweep_day_grid(540, 840, ((690, 700),), demand)
+    assert {end - start for start, end in grid} == {50, 100}
+    assert all(a_end <= b_start for (_, a_end), (b_start, _) in zip(grid, grid[1:]))
+    assert all(end <= 690 or start >= 700 for start, end in grid)
+    # A single duration tiles the day exactly like the fixed-step grid
+    assert sweep_day_grid(540, 840, (), ((50, 100),)) == tuple((t, t + 50) for t in range(540, 791, 50))
+
+# Test Case 87: Grids are cached across requests with the same configuration
+def test_sweep_grid_is_cached():
+    subjects = [make_subject("Math", 45)]
+    generate_weekly_time_slots("08:00", "13:00", [], subjects)
+    hits = sweep_day_grid.cache_info().hits
+    generate_weekly_time_slots("08:00", "13:00", [], subjects)
+    assert sweep_day_grid.cache_info().hits >= hits + 6
@@ -0,0 +1,86 @@
+import sys
+import os
+import random
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from model import ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, ScheduleAssignment
+from scheduler import SchedulerService
+from validation import validate_schedule, overlapping_pairs
+
+def make_input():
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=2,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=1,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]),
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="10:50")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=["R1", "R2"]
+    )
+
+def assign(subject, faculty_id, start, end, room, day="MONDAY"):
+    return ScheduleAssignment(subject_name=subject, faculty_id=faculty_id, faculty_name=faculty_id,
+                              day=day, startTime=start, endTime=end, room_id=room)
+
+# Test Case 91: A solver-generated schedule has no violations
+def test_generated_schedule_is_valid():
+    input_data = make_input()
+    service = SchedulerService()
+    service.generate_schedule(input_data)
+    schedule = [ScheduleAssignment(**a) for a in service.schedule_history[-1]["schedule"]]
+    report = validate_schedule(input_data, schedule)
+    assert report["valid"], report["violations"]
+    assert report["checked_assignments"] + report["placeholders"] == len(schedule)
+
+# Test Case 92: Hand edits are reported by type with the offending assignment indexes
+def test_hand_edited_schedule_violations():
+    schedule = [
+        assign("Math", "T1", "09:00", "09:50", "R1"),
+        assign("Physics", "T2", "09:00", "09:50", "R1"),   # room double booking with 0
+        assign("Math", "T1", "09:30", "10:20", "R2"),      # faculty double booking with 0
+        assign("Physics", "T2", "10:30", "11:20", "R2"),   # overlaps the break
+        assign("Math", "T1", "09:00", "09:50", "R9", day="TUESDAY"),  # unknown room, not available
+        assign("Available Slot", "VF1", "11:10", "12:00", "R1"),  # placeholder, ignored
+    ]
+    report = validate_schedule(make_input(), schedule)
+    assert not report["valid"]
+    assert report["placeholders"] == 1
+    by_type = {}
+    for violation in report["violations"]:
+        by_type.setdefault(violation["type"], []).append(violation["assignments"])
+    assert by_type["room_double_booking"] == [[0, 1]]
+    assert by_type["faculty_double_booking"] == [[0, 2]]
+    assert by_type["break_overlap"] == [[3]]
+    assert by_type["unknown_room"] == [[4]]
+    assert by_type["availability_breach"] == [[4]]
+    assert "unmet_class_count" not in by_type
+
+# Test Case 93: The sweep finds exactly the pairs a pairwise scan finds
+def test_overlapping_pairs_matches_pairwise():
+    rng = random.Random(7)
+    intervals = []
+    for idx in range(200):
+        start = rng.randrange(0, 600)
+        intervals.append((start, start + rng.randrange(1, 60), idx))
+    expected = {(a[2], b[2]) for a in intervals for b in intervals
+                if a[2] < b[2] and a[0] < b[1] and b[0] < a[1]}
+    assert set(overlapping_pairs(intervals)) == expected
+
+# Test Case 103: Consecutive subjects count complete blocks and flag partial ones
+def test_consecutive_blocks_are_counted_per_block():
+    input_data = make_input()
+    input_data.subjects.append(Subject(name="Lab", time=100, no_of_classes_per_week=1, requires_consecutive=True,
+                                       faculty=[Faculty(id="T3", name="Cy", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]))
+    full = [assign("Lab", "T3", "09:00", "09:50", "R2"), assign("Lab", "T3", "09:50", "10:40", "R2")]
+    report = validate_schedule(input_data, full)
+    assert "incomplete_block" not in report["counts"]
+    assert "duration_mismatch" not in report["counts"]
+    assert all(v["subject_name"] != "Lab" for v in report["violations"] if v["type"] == "unmet_class_count")
+
+    report = validate_schedule(input_data, full[:1])
+    assert report["counts"]["incomplete_block"] == 1
+    assert any(v["subject_name"] == "Lab" for v in report["violations"] if v["type"] == "unmet_class_count")
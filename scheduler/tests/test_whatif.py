@@ -0,0 +1,186 @@
+import sys
+import os
+import dataclasses
+import random
+
+# Add the parent directory to system path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from model import (ScheduleInput, Subject, Faculty, TimeSlot, CollegeTime, Break, ScheduleAssignment,
+                   CandidateEdit, PreferredSlot)
+from instance_generator import generate_instance
+from scheduler import SchedulerService
+from validation import validate_schedule
+from whatif import score_candidates, suggest_alternatives
+
+def make_input():
+    days = ["MONDAY", "TUESDAY"]
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=1,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day, "09:00", "12:00") for day in days])],
+                    preferred_slots=[PreferredSlot(day="TUESDAY", startTime="09:00", endTime="10:00", priority=1)]),
+            Subject(name="Physics", time=50, no_of_classes_per_week=1,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot("MONDAY", "09:00", "12:00")])]),
+        ],
+        break_=[Break(day="ALL_DAYS", startTime="10:40", endTime="10:50")],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=["R1", "R2"]
+    )
+
+SCHEDULE = [
+    ScheduleAssignment("Math", "T1", "Alice", "MONDAY", "09:00", "09:50", "R1"),
+    ScheduleAssignment("Physics", "T2", "Bob", "MONDAY", "09:50", "10:40", "R1"),
+    ScheduleAssignment("Math", "T1", "Alice", "MONDAY", "11:10", "12:00", "R2"),
+]
+
+# Test Case 94: Moves report feasibility, the violations they cause and the deltas
+def test_score_moves():
+    candidates = [
+        CandidateEdit(kind="move", assignment=0, day="TUESDAY"),                     # legal and preferred
+        CandidateEdit(kind="move", assignment=0, startTime="10:20", room_id="R2"),   # overlaps the break
+        CandidateEdit(kind="move", assignment=1, startTime="11:10", room_id="R2"),   # room taken by assignment 2
+        CandidateEdit(kind="move", assignment=1, day="TUESDAY"),                     # Bob is not available
+        CandidateEdit(kind="move", assignment=0, startTime="09:50"),                 # Alice free, R1 taken by 1
+    ]
+    results = score_candidates(make_input(), SCHEDULE, candidates)["results"]
+    assert results[0] == {"feasible": True, "violations": {}, "penalty_delta": 0, "preference_delta": 50}
+    assert results[1]["violations"] == {"break_overlap": 1}
+    assert results[2]["violations"] == {"room_double_booking": 1} and results[2]["penalty_delta"] == 1
+    assert results[3]["violations"] == {"availability_breach": 1}
+    assert results[4]["violations"] == {"room_double_booking": 1}
+
+# Test Case 95: Swaps exchange cells and are checked against each other; bad candidates are rejected
+def test_score_swaps_and_rejects_bad_candidates():
+    results = score_candidates(make_input(), SCHEDULE, [
+        CandidateEdit(kind="swap", assignment=1, other=2),
+        CandidateEdit(kind="swap", assignment=0, other=1),
+    ])["results"]
+    assert results[0]["feasible"]
+    assert results[1]["feasible"]  # Alice and Bob simply trade places in R1
+    with pytest.raises(ValueError, match=r"candidates\[0\]\.assignment"):
+        score_candidates(make_input(), SCHEDULE, [CandidateEdit(kind="move", assignment=9)])
+    with pytest.raises(ValueError, match=r"candidates\[0\]\.kind"):
+        score_candidates(make_input(), SCHEDULE, [CandidateEdit(kind="rotate", assignment=0)])
+
+# Test Case 96: Incremental penalty deltas agree with re-validating the edited schedule
+def test_penalty_delta_matches_full_validation():
+    input_data = generate_instance(num_subjects=12, num_faculty=6, num_rooms=2, seed=4)
+    service = SchedulerService()
+    service.generate_schedule(input_data)
+    schedule = [ScheduleAssignment(**a) for a in service.schedule_history[-1]["schedule"] if not a["faculty_id"].startswith("VF")]
+    rng = random.Random(1)
+    slots = service.fixed_slots
+    candidates = []
+    for _ in range(40):
+        slot = rng.choice(slots)
+        candidates.append(CandidateEdit(kind="move", assignment=rng.randrange(len(schedule)), day=slot.day,
+                                        startTime=slot.startTime, room_id=rng.choice(input_data.rooms)))
+    results = score_candidates(input_data, schedule, candidates)["results"]
+
+    def penalty(edited):
+        return sum(n for kind, n in validate_schedule(input_data, edited)["counts"].items() if kind != "unmet_class_count")
+
+    base = penalty(schedule)
+    for candidate, result in zip(candidates, results):
+        edited = list(schedule)
+        moved = schedule[candidate.assignment]
+        length = int(moved.endTime[:2]) * 60 + int(moved.endTime[3:]) - int(moved.startTime[:2]) * 60 - int(moved.startTime[3:])
+        start = int(candidate.startTime[:2]) * 60 + int(candidate.startTime[3:])
+        edited[candidate.assignment] = dataclasses.replace(
+            moved, day=candidate.day, startTime=candidate.startTime,
+            endTime=f"{(start + length) // 60:02d}:{(start + length) % 60:02d}", room_id=candidate.room_id)
+        assert penalty(edited) - base == result["penalty_delta"]
+
+# Test Case 97: Suggestions are feasible, ranked by preference gain and may change faculty
+def test_suggest_moves_ranked_by_preference():
+    input_data = make_input()
+    input_data.subjects[0].faculty.append(Faculty(id="T3", name="Carol", availability=[TimeSlot("MONDAY", "09:00", "12:00")]))
+    report = suggest_alternatives(input_data, SCHEDULE, 0, k=50)
+    suggestions = report["suggestions"]
+    assert suggestions[0]["kind"] == "move" and suggestions[0]["day"] == "TUESDAY" and suggestions[0]["startTime"] == "09:00"
+    assert suggestions[0]["preference_delta"] == 50
+    assert any(s["faculty_id"] == "T3" and s["disruption"] == 2 for s in suggestions if s["kind"] == "move")
+    candidates = [CandidateEdit(kind="move", assignment=0, day=s["day"], startTime=s["startTime"], endTime=s["endTime"],
+                                room_id=s["room_id"], faculty_id=s["faculty_id"]) for s in suggestions if s["kind"] == "move"]
+    assert all(r["feasible"] for r in score_candidates(input_data, SCHEDULE, candidates)["results"])
+    keys = [(-s["preference_delta"], s["disruption"], s["shift_minutes"]) for s in suggestions]
+    assert keys == sorted(keys)
+
+# Test Case 98: Swaps with classes of the same duration are suggested, and k bounds the answer
+def test_suggest_swaps_and_limit():
+    report = suggest_alternatives(make_input(), SCHEDULE, 1, k=50)
+    swaps = [s for s in report["suggestions"] if s["kind"] == "swap"]
+    assert sorted(s["other"] for s in swaps) == [0, 2]
+    assert len(suggest_alternatives(make_input(), SCHEDULE, 1, k=1)["suggestions"]) == 1
+    with pytest.raises(ValueError):
+        suggest_alternatives(make_input(), SCHEDULE, 1, k=0)
+
+def make_lab_input():
+    days = ["MONDAY", "TUESDAY"]
+    return ScheduleInput(
+        subjects=[
+            Subject(name="Math", time=50, no_of_classes_per_week=2,
+                    faculty=[Faculty(id="T1", name="Alice", availability=[TimeSlot(day, "09:00", "12:00") for day in days])]),
+            Subject(name="Lab", time=100, no_of_classes_per_week=1, requires_consecutive=True,
+                    faculty=[Faculty(id="T2", name="Bob", availability=[TimeSlot(day, "09:00", "12:00") for day in days])]),
+        ],
+        break_=[],
+        college_time=CollegeTime(startTime="09:00", endTime="12:00"),
+        rooms=["R1", "R2"]
+    )
+
+LAB_SCHEDULE = [
+    ScheduleAssignment("Lab", "T2", "Bob", "MONDAY", "09:00", "09:50", "R1"),
+    ScheduleAssignment("Lab", "T2", "Bob", "MONDAY", "09:50", "10:40", "R1"),
+    ScheduleAssignment("Math", "T1", "Alice", "MONDAY", "09:00", "09:50", "R2"),
+    ScheduleAssignment("Math", "T1", "Alice", "TUESDAY", "10:40", "11:30", "R1"),
+]
+
+# Test Case 118: A lab period moves its whole block, and block deltas agree with re-validation
+def test_score_moves_whole_block():
+    input_data = make_lab_input()
+    results = score_candidates(input_data, LAB_SCHEDULE, [
+        CandidateEdit(kind="move", assignment=1, day="TUESDAY", startTime="09:00"),    # whole block to Tuesday
+        CandidateEdit(kind="move", assignment=0, day="TUESDAY", startTime="09:50"),    # second period hits Math
+        CandidateEdit(kind="swap", assignment=0, other=3),
+        CandidateEdit(kind="move", assignment=0, startTime="09:50", room_id="R2"),
+    ])["results"]
+    assert results[0] == {"feasible": True, "violations": {}, "penalty_delta": 0, "preference_delta": 0}
+    assert results[1]["violations"] == {"room_double_booking": 1}
+    with pytest.raises(ValueError, match="same block"):
+        score_candidates(input_data, LAB_SCHEDULE, [CandidateEdit(kind="swap", assignment=0, other=1)])
+
+    def penalty(edited):
+        return sum(n for kind, n in validate_schedule(input_data, edited)["counts"].items() if kind != "unmet_class_count")
+
+    def shifted(a, day, shift, room):
+        def at(hhmm):
+            minutes = int(hhmm[:2]) * 60 + int(hhmm[3:]) + shift
+            return f"{minutes // 60:02d}:{minutes % 60:02d}"
+        return dataclasses.replace(a, day=day, startTime=at(a.startTime), endTime=at(a.endTime), room_id=room)
+
+    expected = [
+        [shifted(LAB_SCHEDULE[0], "TUESDAY", 0, "R1"), shifted(LAB_SCHEDULE[1], "TUESDAY", 0, "R1")] + LAB_SCHEDULE[2:],
+        [shifted(LAB_SCHEDULE[0], "TUESDAY", 50, "R1"), shifted(LAB_SCHEDULE[1], "TUESDAY", 50, "R1")] + LAB_SCHEDULE[2:],
+        [shifted(LAB_SCHEDULE[0], "TUESDAY", 100, "R1"), shifted(LAB_SCHEDULE[1], "TUESDAY", 100, "R1"),
+         LAB_SCHEDULE[2], shifted(LAB_SCHEDULE[3], "MONDAY", -100, "R1")],
+        [shifted(LAB_SCHEDULE[0], "MONDAY", 50, "R2"), shifted(LAB_SCHEDULE[1], "MONDAY", 50, "R2")] + LAB_SCHEDULE[2:],
+    ]
+    base = penalty(LAB_SCHEDULE)
+    for edited, result in zip(expected, results):
+        assert penalty(edited) - base == result["penalty_delta"]
+
+# Test Case 119: Suggestions for a lab period move the whole block to free blocks of adjacent periods
+def test_suggest_moves_for_block():
+    input_data = make_lab_input()
+    report = suggest_alternatives(input_data, LAB_SCHEDULE, 1, k=50)
+    moves = report["suggestions"]
+    assert moves and all(s["kind"] == "move" for s in moves)
+    assert {(s["startTime"], s["endTime"], s["room_id"]) for s in moves if s["day"] == "TUESDAY"} == {
+        ("09:00", "10:40", "R1"), ("09:50", "11:30", "R2")}  # R1 holds Math from 10:40
+    assert ("MONDAY", "09:50", "11:30", "R1") in {(s["day"], s["startTime"], s["endTime"], s["room_id"]) for s in moves}
+    candidates = [CandidateEdit(kind="move", assignment=1, day=s["day"], startTime=s["startTime"], endTime=s["endTime"],
+                                room_id=s["room_id"], faculty_id=s["faculty_id"]) for s in moves]
+    assert all(r["feasible"] for r in score_candidates(input_data, LAB_SCHEDULE, candidates)["results"])
@@ -1,22 +1,28 @@
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Union
+from functools import lru_cache
 from model import TimeSlot, Break, PreferredSlot
+from intervals import IntervalSet
 import re
 
 # Valid days of the week
 VALID_DAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY"]
 
+# Compiled once; time_to_minutes runs for every time field of every request
+_CLOCK_RE = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+@lru_cache(maxsize=4096)
 def time_to_minutes(time_str: str) -> int:
     """Convert time string (HH:MM or HH:MM AM/PM) to minutes since midnight."""
+    upper = time_str.upper()
     # Handle AM/PM format
-    if 'AM' in time_str.upper() or 'PM' in time_str.upper():
-        time_str = time_str.upper().strip()
+    if 'AM' in upper or 'PM' in upper:
+        time_str = upper.strip()
         is_pm = 'PM' in time_str
-        time_part = time_str.replace('AM', '').replace('PM', '').strip()
-        
-        if not re.match(r'^\d{1,2}:\d{2}$', time_part):
+        match = _CLOCK_RE.match(time_str.replace('AM', '').replace('PM', '').strip())
+        if not match:
             raise ValueError(f"Invalid time format: {time_str}. Expected format: HH:MM AM/PM")
         
-        hours, minutes = map(int, time_part.split(':'))
+        hours, minutes = int(match.group(1)), int(match.group(2))
         
         # Convert to 24-hour format
         if is_pm and hours != 12:
@@ -30,10 +36,11 @@ def time_to_minutes(time_str: str) -> int:
         return hours * 60 + minutes
     
     # Handle 24-hour format
-    if not re.match(r'^\d{1,2}:\d{2}$', time_str):
+    match = _CLOCK_RE.match(time_str)
+    if not match:
         raise ValueError(f"Invalid time format: {time_str}. Expected format: HH:MM or HH:MM AM/PM")
     
-    hours, minutes = map(int, time_str.split(':'))
+    hours, minutes = int(match.group(1)), int(match.group(2))
     if hours < 0 or hours > 23 or minutes < 0 or minutes > 59:
         raise ValueError(f"Invalid time values in {time_str}. Hours must be 0-23, minutes 0-59")
     
@@ -61,8 +68,26 @@ def check_time_conflict(slot1: TimeSlot, slot2: TimeSlot) -> bool:
     # Check if one slot starts during the other slot
     return (start1 < end2 and start2 < end1)
 
-def check_break_conflict(slot: TimeSlot, breaks: List[Break]) -> bool:
-    """Check if a time slot conflicts with any break, including ALL_DAYS breaks."""
+BreakIndex = Dict[str, IntervalSet]  # day -> merged break windows, ALL_DAYS expanded
+
+def build_break_index(breaks: List[Break]) -> BreakIndex:
+    """Merge breaks per day, expanding ALL_DAYS breaks onto every day."""
+    windows: Dict[str, List[Tuple[int, int]]] = {day: [] for day in VALID_DAYS}
+    for b in breaks:
+        window = (time_to_minutes(b.startTime), time_to_minutes(b.endTime))
+        for day in (VALID_DAYS if b.day == "ALL_DAYS" else [b.day]):
+            windows.setdefault(day, []).append(window)
+    return {day: IntervalSet(day_windows) for day, day_windows in windows.items()}
+
+def check_break_conflict(slot: TimeSlot, breaks: Union[List[Break], BreakIndex]) -> bool:
+    """Check if a time slot conflicts with any break, including ALL_DAYS breaks.
+
+    Pass a BreakIndex from build_break_index when checking many slots; a plain
+    list of breaks is scanned linearly.
+    """
+    if isinstance(breaks, dict):
+        day_breaks = breaks.get(slot.day)
+        return day_breaks is not None and day_breaks.overlaps(time_to_minutes(slot.startTime), time_to_minutes(slot.endTime))
     for break_slot in breaks:
         # Handle ALL_DAYS break - applies to every day
         if break_slot.day == "ALL_DAYS" or break_slot.day == slot.day:
@@ -107,79 +132,86 @@ def calculate_preference_score(slot: TimeSlot, subject_preferences: List[Preferr
     
     return score
 
-def generate_time_slots(start_time: str, end_time: str, breaks: List[Break], subjects: List) -> List[str]:
-    """Generate non-overlapping time slot labels, excluding ALL_DAYS breaks."""
-    start_minutes = time_to_minutes(start_time)
-    end_minutes = time_to_minutes(end_time)
-    
-    # Get unique subject durations and sort them
-    durations = sorted(set(subject.time for subject in subjects))
-    if not durations:
-        return []
-    
-    # Use the smallest duration as the base unit
-    base_duration = min(durations)
-    
-    # Generate sequential time slots without overlaps
-    time_slots = []
+DurationDemand = Tuple[Tuple[int, int], ...]  # ((duration, weekly minutes requested), ...) by duration
+
+def duration_demand(subjects: List) -> DurationDemand:
+    """Weekly minutes requested per subject duration, shortest duration first.
+
+    Subjects that require consecutive periods are taught as runs of the
+    shortest regular period, so their minutes count towards that period
+    instead of asking for slots of their own length.
+    """
+    periods = [subject.time for subject in subjects if not subject.requires_consecutive]
+    base_period = min(periods) if periods else None
+    demand: Dict[int, int] = {}
+    for subject in subjects:
+        duration = subject.time
+        if base_period is not None and subject.requires_consecutive:
+            duration = base_period
+        demand[duration] = demand.get(duration, 0) + subject.time * max(subject.no_of_classes_per_week, 1)
+    return tuple(sorted(demand.items()))
+
+@lru_cache(maxsize=256)
+def sweep_day_grid(start_minutes: int, end_minutes: int, day_breaks: Tuple[Tuple[int, int], ...],
+                   demand: DurationDemand) -> Tuple[Tuple[int, int], ...]:
+    """Non-overlapping (start, end) slots of one day, in a single sweep from college start to end.
+
+    At each position the sweep places the duration that fits before the next
+    break and is furthest behind its share of the requested minutes (the
+    shortest on ties), so longer classes get slots of their own instead of
+    always losing to the shortest duration. Where nothing fits, the sweep
+    moves on by the shortest duration. Cached: the grid only changes with the
+    college time, the breaks and the set of durations.
+    """
+    if not demand:
+        return ()
+    breaks = IntervalSet(day_breaks)
+    base_duration = demand[0][0]
+    placed = {duration: 0 for duration, _ in demand}
+    grid = []
     current_time = start_minutes
-    
     while current_time + base_duration <= end_minutes:
-        # For each duration, create a slot starting at current_time
-        for duration in durations:
-            if current_time + duration <= end_minutes:
-                slot_start = minutes_to_time(current_time)
-                slot_end = minutes_to_time(current_time + duration)
-                slot_label = f"{slot_start}-{slot_end}"
-                
-                # Check if this slot conflicts with any break (including ALL_DAYS)
-                temp_slot = TimeSlot(day="MONDAY", startTime=slot_start, endTime=slot_end)
-                if not check_break_conflict(temp_slot, breaks):
-                    time_slots.append(slot_label)
-        
-        # Move to next time slot
-        current_time += base_duration
-    
-    # Remove duplicates and sort
-    unique_slots = sorted(set(time_slots), key=lambda x: (time_to_minutes(x.split('-')[0]), time_to_minutes(x.split('-')[1])))
-    
-    # Filter out overlapping slots - keep only non-overlapping ones
-    non_overlapping = []
-    for slot in unique_slots:
-        start, end = slot.split('-')
-        slot_start = time_to_minutes(start)
-        slot_end = time_to_minutes(end)
-        
-        # Check if this slot overlaps with any already selected slot
-        overlaps = False
-        for existing in non_overlapping:
-            ex_start, ex_end = existing.split('-')
-            ex_start_min = time_to_minutes(ex_start)
-            ex_end_min = time_to_minutes(ex_end)
-            
-            # Check for overlap
-            if slot_start < ex_end_min and ex_start_min < slot_end:
-                overlaps = True
-                break
-        
-        if not overlaps:
-            non_overlapping.append(slot)
-    
-    return non_overlapping
+        fitting = [(placed[duration] / minutes, duration) for duration, minutes in demand
+                   if current_time + duration <= end_minutes and not breaks.overlaps(current_time, current_time + duration)]
+        if not fitting:
+            current_time += base_duration
+            continue
+        _, duration = min(fitting)
+        grid.append((current_time, current_time + duration))
+        placed[duration] += duration
+        current_time += duration
+    return tuple(grid)
+
+def _day_grids(start_time: str, end_time: str, breaks: Union[List[Break], BreakIndex], subjects: List) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """Slot grid of every day; days with the same breaks share one cached grid."""
+    if not isinstance(breaks, dict):
+        breaks = build_break_index(breaks)
+    start_minutes = time_to_minutes(start_time)
+    end_minutes = time_to_minutes(end_time)
+    demand = duration_demand(subjects)
+    return {day: sweep_day_grid(start_minutes, end_minutes, tuple(breaks.get(day, ())), demand) for day in VALID_DAYS}
+
+def _label(window: Tuple[int, int]) -> str:
+    return f"{minutes_to_time(window[0])}-{minutes_to_time(window[1])}"
+
+def generate_time_slots(start_time: str, end_time: str, breaks: List[Break], subjects: List) -> List[str]:
+    """Time slot labels used on any day, ordered by start and end time."""
+    windows = set()
+    for grid in _day_grids(start_time, end_time, breaks, subjects).values():
+        windows.update(grid)
+    return [_label(window) for window in sorted(windows)]
 
 def generate_weekly_time_slots(start_time: str, end_time: str, breaks: List[Break], subjects: List) -> Tuple[List[str], List[TimeSlot]]:
-    """Generate time slots for all days of the week, excluding ALL_DAYS breaks."""
-    time_slot_labels = generate_time_slots(start_time, end_time, breaks, subjects)
-    
-    # Create TimeSlot objects for each day and time slot
+    """Generate the slot grid of every day of the week, skipping each day's own breaks.
+
+    Returns the labels used on any day (the timetable columns) and the slots
+    of each day's grid, in day order.
+    """
+    grids = _day_grids(start_time, end_time, breaks, subjects)
+    windows = set()
     fixed_slots = []
     for day in VALID_DAYS:
-        for slot_label in time_slot_labels:
-            start, end = slot_label.split('-')
-            slot = TimeSlot(day=day, startTime=start, endTime=end)
-            
-            # Skip slots that conflict with breaks (including ALL_DAYS)
-            if not check_break_conflict(slot, breaks):
-                fixed_slots.append(slot)
-    
-    return time_slot_labels, fixed_slots
+        windows.update(grids[day])
+        fixed_slots.extend(TimeSlot(day=day, startTime=minutes_to_time(start), endTime=minutes_to_time(end))
+                           for start, end in grids[day])
+    return [_label(window) for window in sorted(windows)], fixed_slots
@@ -0,0 +1,168 @@
+import heapq
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from model import ScheduleInput, ScheduleAssignment
+from problem import NormalizedProblem, normalize_input
+from utils import VALID_DAYS, time_to_minutes
+
+def overlapping_pairs(intervals: Iterable[Tuple[int, int, int]]) -> Iterator[Tuple[int, int]]:
+    """Yield (i, j) for every pair of overlapping (start, end, id) intervals, with i < j.
+
+    Sort-and-sweep: intervals are visited by start time while a heap holds the
+    ones still running, so the cost is O(n log n) plus one step per pair found.
+    """
+    active: List[Tuple[int, int]] = []  # (end, id) of intervals that have started and not ended
+    for start, end, idx in sorted(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _, other in active:
+            yield (other, idx) if other < idx else (idx, other)
+        heapq.heappush(active, (end, idx))
+
+def grouped_overlaps(intervals: Dict[Hashable, List[Tuple[int, int, int]]]) -> Iterator[Tuple[Hashable, int, int]]:
+    """Overlapping pairs within each group, e.g. per (faculty_id, day), as (group, i, j)."""
+    for group, group_intervals in intervals.items():
+        if len(group_intervals) > 1:
+            for i, j in overlapping_pairs(group_intervals):
+                yield group, i, j
+
+def contiguous_runs(periods: Iterable[Tuple[int, int, int]]) -> Iterator[List[Tuple[int, int, int]]]:
+    """Group (start, end, id) periods into runs where each period starts exactly when the previous one ends."""
+    run: List[Tuple[int, int, int]] = []
+    for period in sorted(periods):
+        if run and period[0] != run[-1][1]:
+            yield run
+            run = []
+        run.append(period)
+    if run:
+        yield run
+
+def split_blocks(run: List[Tuple[int, int, int]], length: int) -> Iterator[List[Tuple[int, int, int]]]:
+    """Cut a run of back-to-back (start, end, id) periods into classes lasting length minutes; a shorter
+    leftover at the end is a class of its own."""
+    block: List[Tuple[int, int, int]] = []
+    for period in run:
+        block.append(period)
+        if period[1] - block[0][0] >= length:
+            yield block
+            block = []
+    if block:
+        yield block
+
+def _violation(kind: str, message: str, assignments: List[int], **details: Any) -> Dict[str, Any]:
+    return {"type": kind, "message": message, "assignments": assignments, **details}
+
+def validate_schedule(input_data: ScheduleInput, schedule: List[ScheduleAssignment],
+                      problem: Optional[NormalizedProblem] = None) -> Dict[str, Any]:
+    """Every hard-constraint violation of a schedule against its input.
+
+    Assignment indexes in the report refer to positions in `schedule`.
+    Placeholder cells (unknown subject and faculty, like the solver's
+    "Available Slot" entries) are skipped. Raises ValueError only when
+    input_data itself is invalid.
+    """
+    if problem is None:
+        problem = normalize_input(input_data)
+    subjects = {subject.name: subject for subject in input_data.subjects}
+    rooms = set(input_data.rooms)
+
+    violations: List[Dict[str, Any]] = []
+    by_faculty: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+    by_room: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+    scheduled = defaultdict(int)
+    placeholders = 0
+    # Consecutive-period subjects are scheduled one assignment per period and counted per complete block
+    block_periods: Dict[Tuple[str, str, str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+
+    for idx, a in enumerate(schedule):
+        subject = subjects.get(a.subject_name)
+        if subject is None and a.faculty_id not in problem.faculty:
+            placeholders += 1
+            continue
+        if a.day not in VALID_DAYS:
+            violations.append(_violation("invalid_day", f"schedule[{idx}].day: {a.day} is not one of {VALID_DAYS}", [idx]))
+            continue
+        try:
+            start, end = time_to_minutes(a.startTime), time_to_minutes(a.endTime)
+        except (ValueError, TypeError, AttributeError):
+            violations.append(_violation(
+                "invalid_time", f"schedule[{idx}]: {a.startTime!r}-{a.endTime!r} is not HH:MM or HH:MM AM/PM", [idx]))
+            continue
+        if end <= start:
+            violations.append(_violation("invalid_time", f"schedule[{idx}]: ends at {a.endTime}, before it starts", [idx]))
+            continue
+
+        if subject is None:
+            violations.append(_violation("unknown_subject", f"schedule[{idx}]: unknown subject {a.subject_name}", [idx]))
+        else:
+            if subject.requires_consecutive:
+                block_periods[(subject.name, a.faculty_id, a.room_id, a.day)].append((start, end, idx))
+            else:
+                scheduled[subject.name] += 1
+            if a.faculty_id not in {faculty.id for faculty in subject.faculty}:
+                violations.append(_violation(
+                    "faculty_not_assigned", f"schedule[{idx}]: {a.faculty_id} does not teach {subject.name}", [idx],
+                    faculty_id=a.faculty_id))
+            if not subject.requires_consecutive and end - start != subject.time:
+                violations.append(_violation(
+                    "duration_mismatch", f"schedule[{idx}]: {end - start} minutes, {subject.name} takes {subject.time}",
+                    [idx]))
+        if a.room_id not in rooms:
+            violations.append(_violation("unknown_room", f"schedule[{idx}]: unknown room {a.room_id}", [idx],
+                                         room_id=a.room_id))
+        if problem.overlaps_break(a.day, start, end):
+            violations.append(_violation("break_overlap", f"schedule[{idx}]: {a.day} {a.startTime}-{a.endTime} overlaps a break",
+                                         [idx], day=a.day))
+        if a.faculty_id in problem.faculty and not problem.is_available(a.faculty_id, a.day, start, end):
+            violations.append(_violation(
+                "availability_breach", f"schedule[{idx}]: {a.faculty_id} is not available {a.day} {a.startTime}-{a.endTime}",
+                [idx], faculty_id=a.faculty_id, day=a.day))
+
+        by_faculty[(a.faculty_id, a.day)].append((start, end, idx))
+        by_room[(a.room_id, a.day)].append((start, end, idx))
+
+    for (faculty_id, day), i, j in grouped_overlaps(by_faculty):
+        violations.append(_violation("faculty_double_booking", f"{faculty_id} is booked twice on {day}: schedule[{i}] and schedule[{j}]",
+                                     [i, j], faculty_id=faculty_id, day=day))
+    for (room_id, day), i, j in grouped_overlaps(by_room):
+        violations.append(_violation("room_double_booking", f"{room_id} is booked twice on {day}: schedule[{i}] and schedule[{j}]",
+                                     [i, j], room_id=room_id, day=day))
+
+    for (subject_name, faculty_id, room_id, day), periods in block_periods.items():
+        length = subjects[subject_name].time
+        for run in contiguous_runs(periods):
+            minutes = run[-1][1] - run[0][0]
+            scheduled[subject_name] += minutes // length
+            if minutes % length:
+                violations.append(_violation(
+                    "incomplete_block", f"{subject_name}: {minutes} consecutive minutes on {day} in {room_id}, "
+                    f"blocks take {length}", [idx for _, _, idx in run], faculty_id=faculty_id, day=day))
+
+    for subject in input_data.subjects:
+        if scheduled[subject.name] < subject.no_of_classes_per_week:
+            violations.append(_violation(
+                "unmet_class_count", f"{subject.name}: {scheduled[subject.name]} of {subject.no_of_classes_per_week} classes scheduled",
+                [], subject_name=subject.name, scheduled=scheduled[subject.name], required=subject.no_of_classes_per_week))
+
+    counts: Dict[str, int] = defaultdict(int)
+    for violation in violations:
+        counts[violation["type"]] += 1
+    return {
+        "valid": not violations,
+        "violations": violations,
+        "counts": dict(counts),
+        "checked_assignments": len(schedule) - placeholders,
+        "placeholders": placeholders,
+    }
+
+def conflicting_pairs(schedule: List[ScheduleAssignment]) -> Set[Tuple[int, int]]:
+    """Index pairs of assignments that overlap in time and share a faculty member or a room."""
+    by_faculty: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+    by_room: Dict[Tuple[str, str], List[Tuple[int, int, int]]] = defaultdict(list)
+    for idx, a in enumerate(schedule):
+        interval = (time_to_minutes(a.startTime), time_to_minutes(a.endTime), idx)
+        by_faculty[(a.faculty_id, a.day)].append(interval)
+        by_room[(a.room_id, a.day)].append(interval)
+    pairs = {(i, j) for _, i, j in grouped_overlaps(by_faculty)}
+    pairs.update((i, j) for _, i, j in grouped_overlaps(by_room))
+    return pairs
@@ -0,0 +1,328 @@
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+from indexes import OccupancyIndex, ConsecutiveBlockIndex
+from model import ScheduleInput, ScheduleAssignment, CandidateEdit, PreferredSlot
+from problem import NormalizedProblem, normalize_input
+from validation import contiguous_runs, split_blocks
+from utils import VALID_DAYS, time_to_minutes, minutes_to_time, generate_weekly_time_slots
+
+# (day, start, end, points); day may be "ANY_DAY"
+_Preference = Tuple[str, int, int, int]
+
+class PreferenceIndex:
+    """Preference windows of every subject and faculty member, parsed once.
+
+    score() gives the same points as utils.calculate_preference_score.
+    """
+
+    def __init__(self, input_data: ScheduleInput):
+        self.subjects: Dict[str, List[_Preference]] = {}
+        self.faculty: Dict[str, List[_Preference]] = {}
+        for subject in input_data.subjects:
+            self.subjects.setdefault(subject.name, self._parse(subject.preferred_slots, 10))
+            for faculty in subject.faculty:
+                self.faculty.setdefault(faculty.id, self._parse(faculty.preferred_slots, 5))
+
+    @staticmethod
+    def _parse(preferences: List[PreferredSlot], weight: int) -> List[_Preference]:
+        return [(pref.day, time_to_minutes(pref.startTime), time_to_minutes(pref.endTime), (6 - pref.priority) * weight)
+                for pref in preferences]
+
+    def score(self, subject_name: str, faculty_id: str, day: str, start: int, end: int) -> int:
+        score = 0
+        for preferences in (self.subjects.get(subject_name, ()), self.faculty.get(faculty_id, ())):
+            for pref_day, pref_start, pref_end, points in preferences:
+                if (pref_day == "ANY_DAY" or pref_day == day) and pref_start <= start and end <= pref_end:
+                    score += points
+        return score
+
+# A class (or one period of a consecutive-period block) at a position: (subject_name, faculty_id, day, start, end, room_id)
+_Placement = Tuple[str, str, str, int, int, str]
+# Consecutive-period periods are validated per (subject_name, faculty_id, room_id, day) run
+_BlockGroup = Tuple[str, str, str, str]
+
+class WhatIfScorer:
+    """Scores candidate moves and swaps against one base schedule.
+
+    The occupancy of every faculty member and room and the preference
+    windows are indexed once; each candidate then only checks the classes it
+    moves, so scoring a candidate costs O(log n) instead of a full
+    re-evaluation of the schedule. A period of a consecutive-period block
+    stands for its whole block: the block moves as one class, its periods
+    are checked one by one and its runs are re-counted like
+    validate_schedule does, so the deltas match re-validating the schedule.
+    """
+
+    def __init__(self, input_data: ScheduleInput, schedule: List[ScheduleAssignment],
+                 problem: Optional[NormalizedProblem] = None):
+        self.problem = problem or normalize_input(input_data)
+        self.input_data = input_data
+        self.schedule = schedule
+        self.subjects = {subject.name: subject for subject in input_data.subjects}
+        self.rooms = set(input_data.rooms)
+        self.preferences = PreferenceIndex(input_data)
+
+        self.placements: Dict[int, _Placement] = {}
+        self.units: Dict[int, List[int]] = {}  # assignment -> the assignments of its class (the block's periods)
+        self.block_groups: Dict[_BlockGroup, List[Tuple[int, int, int]]] = defaultdict(list)
+        intervals = []
+        for idx, a in enumerate(schedule):
+            # Placeholder cells (unknown subject and faculty) are free for the editor
+            if a.subject_name not in self.subjects and a.faculty_id not in self.problem.faculty:
+                continue
+            start, end = time_to_minutes(a.startTime), time_to_minutes(a.endTime)
+            self.placements[idx] = (a.subject_name, a.faculty_id, a.day, start, end, a.room_id)
+            intervals.append((("FACULTY", a.faculty_id, a.day), start, end, idx))
+            intervals.append((("ROOM", a.room_id, a.day), start, end, idx))
+            if self._is_block(a.subject_name):
+                self.block_groups[self._group(self.placements[idx])].append((start, end, idx))
+            else:
+                self.units[idx] = [idx]
+        self.occupancy = OccupancyIndex.build(intervals)
+        for group, periods in self.block_groups.items():
+            for run in contiguous_runs(periods):
+                for block in split_blocks(run, self.subjects[group[0]].time):
+                    unit = [idx for _, _, idx in block]
+                    for idx in unit:
+                        self.units[idx] = unit
+
+    def _is_block(self, subject_name: str) -> bool:
+        subject = self.subjects.get(subject_name)
+        return subject is not None and subject.requires_consecutive
+
+    @staticmethod
+    def _group(placement: _Placement) -> _BlockGroup:
+        subject_name, faculty_id, day, _, _, room_id = placement
+        return subject_name, faculty_id, room_id, day
+
+    def _violations(self, placement: _Placement, moved: Set[int], others: List[_Placement]) -> List[str]:
+        """Hard violations of one class (or block period) at a position, against the unmoved classes and the
+        other moved ones."""
+        subject_name, faculty_id, day, start, end, room_id = placement
+        violations = []
+        subject = self.subjects.get(subject_name)
+        if subject is not None:
+            if faculty_id not in {faculty.id for faculty in subject.faculty}:
+                violations.append("faculty_not_assigned")
+            # Block periods are checked per run in _incomplete_blocks
+            if not subject.requires_consecutive and end - start != subject.time:
+                violations.append("duration_mismatch")
+        if room_id not in self.rooms:
+            violations.append("unknown_room")
+        if self.problem.overlaps_break(day, start, end):
+            violations.append("break_overlap")
+        if faculty_id in self.problem.faculty and not self.problem.is_available(faculty_id, day, start, end):
+            violations.append("availability_breach")
+        faculty_clashes = len(self.occupancy.overlapping(("FACULTY", faculty_id, day), start, end, moved))
+        room_clashes = len(self.occupancy.overlapping(("ROOM", room_id, day), start, end, moved))
+        for _, other_faculty, other_day, other_start, other_end, other_room in others:
+            if other_day == day and start < other_end and other_start < end:
+                faculty_clashes += other_faculty == faculty_id
+                room_clashes += other_room == room_id
+        violations += ["faculty_double_booking"] * faculty_clashes + ["room_double_booking"] * room_clashes
+        return violations
+
+    def _incomplete_blocks(self, placements: List[_Placement], moved: Set[int], groups: Set[_BlockGroup]) -> int:
+        """Runs in the given block groups whose length is not a whole number of blocks, with the moved
+        periods at placements."""
+        incomplete = 0
+        for group in groups:
+            periods = [period for period in self.block_groups.get(group, ()) if period[2] not in moved]
+            periods += [(p[3], p[4], -1 - i) for i, p in enumerate(placements) if self._group(p) == group]
+            length = self.subjects[group[0]].time
+            incomplete += sum(1 for run in contiguous_runs(periods) if (run[-1][1] - run[0][0]) % length)
+        return incomplete
+
+    def _evaluate(self, classes: List[List[_Placement]], moved: Set[int],
+                  groups: Set[_BlockGroup]) -> Tuple[List[str], int]:
+        violations, preference = [], 0
+        placements = [placement for periods in classes for placement in periods]
+        for i, placement in enumerate(placements):
+            # Each pair of moved periods is counted once
+            violations += self._violations(placement, moved, placements[:i])
+        violations += ["incomplete_block"] * self._incomplete_blocks(placements, moved, groups)
+        for periods in classes:
+            # A block is scored once, over its whole span, like the engines score it
+            subject_name, faculty_id, day, start, _, _ = periods[0]
+            preference += self.preferences.score(subject_name, faculty_id, day, start, periods[-1][4])
+        return violations, preference
+
+    def _placement(self, idx: int, path: str) -> _Placement:
+        if not 0 <= idx < len(self.schedule):
+            raise ValueError(f"{path}: no assignment {idx} in a schedule of {len(self.schedule)}")
+        if idx not in self.placements:
+            raise ValueError(f"{path}: assignment {idx} is a placeholder cell")
+        return self.placements[idx]
+
+    def _class(self, idx: int, path: str) -> List[_Placement]:
+        """Placements of the class an assignment belongs to: itself, or every period of its block."""
+        self._placement(idx, path)
+        return [self.placements[i] for i in self.units[idx]]
+
+    def _relocated(self, periods: List[_Placement], faculty_id: str, day: str, start: int, end: int,
+                   room_id: str) -> List[_Placement]:
+        """A class moved to a position; a block keeps its periods and shifts so that it starts at start."""
+        subject_name = periods[0][0]
+        if not self._is_block(subject_name):
+            return [(subject_name, faculty_id, day, start, end, room_id)]
+        shift = start - periods[0][3]
+        return [(subject_name, faculty_id, day, p[3] + shift, p[4] + shift, room_id) for p in periods]
+
+    def _candidate_placements(self, candidate: CandidateEdit,
+                              path: str) -> Tuple[List[int], List[List[_Placement]], List[List[_Placement]]]:
+        """(moved ids, classes before, classes after) of one candidate edit."""
+        if candidate.kind == "move":
+            before = self._class(candidate.assignment, f"{path}.assignment")
+            subject_name, faculty_id, day, start, _, room_id = before[0]
+            end = before[-1][4]
+            if candidate.day is not None:
+                if candidate.day not in VALID_DAYS:
+                    raise ValueError(f"{path}.day: {candidate.day} is not one of {VALID_DAYS}")
+                day = candidate.day
+            try:
+                if candidate.startTime is not None:
+                    # Moving the start alone keeps the class length
+                    start, end = time_to_minutes(candidate.startTime), time_to_minutes(candidate.startTime) + end - start
+                if candidate.endTime is not None:
+                    if self._is_block(subject_name) and candidate.startTime is None:
+                        # A block keeps its length, so a new end alone shifts it
+                        start = time_to_minutes(candidate.endTime) - (end - start)
+                    end = time_to_minutes(candidate.endTime)
+            except (ValueError, TypeError, AttributeError):
+                raise ValueError(f"Invalid time format in {path}: {candidate.startTime!r}-{candidate.endTime!r}")
+            after = self._relocated(before, candidate.faculty_id or faculty_id, day, start, end,
+                                    candidate.room_id or room_id)
+            return list(self.units[candidate.assignment]), [before], [after]
+        if candidate.kind == "swap":
+            if candidate.other is None:
+                raise ValueError(f"{path}.other: a swap needs the index of the other assignment")
+            if candidate.other == candidate.assignment:
+                raise ValueError(f"{path}.other: cannot swap assignment {candidate.other} with itself")
+            first = self._class(candidate.assignment, f"{path}.assignment")
+            second = self._class(candidate.other, f"{path}.other")
+            if candidate.other in self.units[candidate.assignment]:
+                raise ValueError(f"{path}.other: assignment {candidate.other} is a period of the same block")
+            # The two classes exchange cells (day, time and room); each keeps its subject and faculty.
+            # A class taking a block's place starts where the block started and keeps its own length.
+            def cell_end(periods, other):
+                return other[-1][4] if not self._is_block(other[0][0]) else other[0][3] + periods[-1][4] - periods[0][3]
+            after = [self._relocated(first, first[0][1], second[0][2], second[0][3], cell_end(first, second), second[0][5]),
+                     self._relocated(second, second[0][1], first[0][2], first[0][3], cell_end(second, first), first[0][5])]
+            return self.units[candidate.assignment] + self.units[candidate.other], [first, second], after
+        raise ValueError(f"{path}.kind: must be 'move' or 'swap', got {candidate.kind!r}")
+
+    def score(self, candidate: CandidateEdit, path: str = "candidate") -> Dict[str, Any]:
+        """Feasibility and penalty/preference deltas of one candidate against the base schedule."""
+        moved_ids, before, after = self._candidate_placements(candidate, path)
+        moved = set(moved_ids)
+        # Runs of block periods are re-counted wherever a moved block leaves or lands
+        groups = {self._group(p) for periods in before + after for p in periods if self._is_block(p[0])}
+        violations_before, preference_before = self._evaluate(before, moved, groups)
+        violations_after, preference_after = self._evaluate(after, moved, groups)
+        counts: Dict[str, int] = defaultdict(int)
+        for violation in violations_after:
+            counts[violation] += 1
+        return {
+            "feasible": not violations_after,
+            "violations": dict(counts),
+            "penalty_delta": len(violations_after) - len(violations_before),
+            "preference_delta": preference_after - preference_before,
+        }
+
+def score_candidates(input_data: ScheduleInput, schedule: List[ScheduleAssignment], candidates: List[CandidateEdit],
+                     problem: Optional[NormalizedProblem] = None) -> Dict[str, Any]:
+    """Score many candidate edits of one schedule; results are in candidate order."""
+    scorer = WhatIfScorer(input_data, schedule, problem)
+    results = [scorer.score(candidate, f"candidates[{i}]") for i, candidate in enumerate(candidates)]
+    return {
+        "results": results,
+        "feasible": sum(1 for result in results if result["feasible"]),
+    }
+
+# Suggestions returned when the caller does not ask for a number
+DEFAULT_SUGGESTIONS = 10
+
+def _suggestion(kind: str, result: Dict[str, Any], disruption: int, shift: int, **edit: Any) -> Dict[str, Any]:
+    return {"kind": kind, **edit, "preference_delta": result["preference_delta"],
+            "penalty_delta": result["penalty_delta"], "disruption": disruption, "shift_minutes": shift}
+
+def suggest_alternatives(input_data: ScheduleInput, schedule: List[ScheduleAssignment], assignment: int,
+                         k: int = DEFAULT_SUGGESTIONS, include_swaps: bool = True,
+                         problem: Optional[NormalizedProblem] = None) -> Dict[str, Any]:
+    """The k best feasible moves and swaps for one assignment.
+
+    Moves cover every grid slot of the class's duration (for a
+    consecutive-period subject, every block of adjacent periods from the
+    ConsecutiveBlockIndex, moving the whole block) with every qualified
+    faculty member of the subject, in the class's own room when it is free
+    and otherwise in the first free room. Swaps exchange cells with another
+    class of the same duration. Candidates failing the cheap checks (break,
+    availability, faculty already busy) are skipped before scoring, and only
+    feasible ones are returned, best preference gain first, then fewest
+    classes/faculty changed, then the smallest shift in time.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    scorer = WhatIfScorer(input_data, schedule, problem)
+    periods = scorer._class(assignment, "assignment")
+    subject_name, faculty_id, day, start, _, room_id = periods[0]
+    end = periods[-1][4]
+    subject = scorer.subjects.get(subject_name)
+    if subject is None:
+        raise ValueError(f"assignment: subject {subject_name} is not in the input")
+    duration = end - start
+    origin = VALID_DAYS.index(day) * 1440 + start
+    moved = set(scorer.units[assignment])
+    rooms = [room_id] + [room for room in input_data.rooms if room != room_id]
+
+    _, grid_slots = generate_weekly_time_slots(input_data.college_time.startTime, input_data.college_time.endTime,
+                                               input_data.break_, input_data.subjects)
+    if subject.requires_consecutive:
+        blocks = ConsecutiveBlockIndex(grid_slots)
+        grid_slots = [span for block_day in VALID_DAYS for _, span in blocks.blocks(block_day, subject.time)]
+    suggestions, evaluated = [], 0
+    for faculty in subject.faculty:
+        for slot in grid_slots:
+            slot_start, slot_end = time_to_minutes(slot.startTime), time_to_minutes(slot.endTime)
+            if slot_end - slot_start != duration or (faculty.id == faculty_id and slot.day == day and slot_start == start):
+                continue
+            if (not scorer.problem.is_available(faculty.id, slot.day, slot_start, slot_end)
+                    or scorer.occupancy.overlapping(("FACULTY", faculty.id, slot.day), slot_start, slot_end, moved)):
+                continue
+            free_room = next((room for room in rooms if not scorer.occupancy.overlapping(
+                ("ROOM", room, slot.day), slot_start, slot_end, moved)), None)
+            if free_room is None:
+                continue
+            evaluated += 1
+            result = scorer.score(CandidateEdit(kind="move", assignment=assignment, day=slot.day, startTime=slot.startTime,
+                                                endTime=slot.endTime, room_id=free_room, faculty_id=faculty.id))
+            if result["feasible"]:
+                suggestions.append(_suggestion(
+                    "move", result, 1 + (faculty.id != faculty_id), abs(VALID_DAYS.index(slot.day) * 1440 + slot_start - origin),
+                    day=slot.day, startTime=slot.startTime, endTime=slot.endTime, room_id=free_room,
+                    faculty_id=faculty.id, faculty_name=faculty.name))
+
+    if include_swaps:
+        for other, (other_subject, other_faculty, other_day, other_start, _, other_room) in scorer.placements.items():
+            # A block is offered once, by its first period
+            if scorer.units[other][0] != other or other in moved:
+                continue
+            other_end = scorer.placements[scorer.units[other][-1]][4]
+            if other_end - other_start != duration or (other_day, other_start) == (day, start):
+                continue
+            if (other_subject, other_faculty) == (subject_name, faculty_id):
+                continue  # Swapping identical classes changes nothing
+            # Both faculty must be available in the cell they take over
+            if (not scorer.problem.is_available(faculty_id, other_day, other_start, other_end)
+                    or not scorer.problem.is_available(other_faculty, day, start, end)):
+                continue
+            evaluated += 1
+            result = scorer.score(CandidateEdit(kind="swap", assignment=assignment, other=other))
+            if result["feasible"]:
+                suggestions.append(_suggestion(
+                    "swap", result, 2, abs(VALID_DAYS.index(other_day) * 1440 + other_start - origin),
+                    other=other, day=other_day, startTime=minutes_to_time(other_start), endTime=minutes_to_time(other_end),
+                    room_id=other_room, other_assignment=schedule[other].model_dump()))
+
+    suggestions.sort(key=lambda s: (-s["preference_delta"], s["disruption"], s["shift_minutes"]))
+    return {"assignment": assignment, "evaluated": evaluated, "feasible": len(suggestions), "suggestions": suggestions[:k]}